@@ -8,7 +8,7 @@ import networkx as nx
 
 from graph_coloring.heuristics.greedy_color import GreedyColor
 from graph_coloring.result_models.basic_heuristic_results import BasicHeuristicResults
-from util.graph import PerfectGraphGenerator
+from util.graph import PerfectGraphGenerator, load_table_cache
 from util.storage import store_experiment, load_preprocessing
 
 
@@ -63,10 +63,11 @@ def basic_heuristic(verbose, n, min_n, max_n, step, num_trials, co_split, store_
     graphs: Dict[int, List[Tuple[nx.Graph, int]]] = defaultdict(list)
     co_split: bool = co_split if co_split != -1 else (random.randint(0, 1))
     if pp_file is None:
+        # One generator serves every n, with its tables loaded from the table cache
+        generator: PerfectGraphGenerator = PerfectGraphGenerator(max(n_values), load_table_cache('graph_coloring'))
         for n in n_values:
-            generator: PerfectGraphGenerator = PerfectGraphGenerator(n)
             for trial in range(num_trials):
-                graphs[n].append(generator.generate_random_split_graph(.5, co_split))
+                graphs[n].append(generator.generate_random_split_graph(.5, co_split, n=n))
     else:
         graphs = load_preprocessing('graph_coloring', pp_file)
         n_values: List[int] = sorted(graphs.keys())
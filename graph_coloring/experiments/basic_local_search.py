@@ -8,7 +8,7 @@ import networkx as nx
 from graph_coloring.heuristics.basic_local_search import BasicLocalSearch
 from graph_coloring.result_models.basic_local_search_results import \
     BasicLocalSearchResults
-from util.graph import PerfectGraphGenerator
+from util.graph import PerfectGraphGenerator, load_table_cache
 from util.storage import store_experiment, load_preprocessing
 
 
@@ -63,10 +63,12 @@ def basic_local_search(verbose, min_n, max_n, step, num_trials, n, co_split, sto
 
     graphs: Dict[int, List[Tuple[nx.Graph, int]]] = defaultdict(list)
     if pp_file is None:
+        # One generator serves every n, with its tables loaded from the table cache
+        generator: PerfectGraphGenerator = PerfectGraphGenerator(max(n_values), load_table_cache('graph_coloring'))
         for n in n_values:
             for trial in range(num_trials):
                 co_split: bool = co_split if co_split != -1 else (random.randint(0, 1))
-                graphs[n].append(PerfectGraphGenerator(n).generate_random_split_graph(.5, co_split))
+                graphs[n].append(generator.generate_random_split_graph(.5, co_split, n=n))
     else:
         graphs = load_preprocessing('graph_coloring', pp_file)
         n_values: List[int] = sorted(graphs.keys())
@@ -81,9 +83,8 @@ def basic_local_search(verbose, min_n, max_n, step, num_trials, n, co_split, sto
     co_split: bool = co_split if co_split != -1 else (random.randint(0, 1))
     if pp_file is None:
         for n in n_values:
-            generator: PerfectGraphGenerator = PerfectGraphGenerator(n)
             for trial in range(num_trials):
-                graphs[n].append(generator.generate_random_split_graph(.5, co_split))
+                graphs[n].append(generator.generate_random_split_graph(.5, co_split, n=n))
     else:
         graphs = load_preprocessing('graph_coloring', pp_file)
 
@@ -7,7 +7,7 @@ import networkx as nx
 
 from graph_coloring.heuristics.glauber_dynamics import GlauberDynamics
 from graph_coloring.result_models.basic_local_search_results import BasicLocalSearchResults
-from util.graph import PerfectGraphGenerator, max_degree
+from util.graph import PerfectGraphGenerator, load_table_cache, max_degree
 from util.storage import store_experiment, load_preprocessing
 
 
@@ -65,10 +65,11 @@ def glauber_dynamics(verbose, min_n, max_n, step, num_trials, delta, max_iter, n
     graphs: Dict[int, List[Tuple[nx.Graph, int]]] = defaultdict(list)
     co_split: bool = co_split if co_split != -1 else (random.randint(0, 1))
     if pp_file is None:
+        # One generator serves every n, with its tables loaded from the table cache
+        generator: PerfectGraphGenerator = PerfectGraphGenerator(max(n_values), load_table_cache('graph_coloring'))
         for n in n_values:
-            generator: PerfectGraphGenerator = PerfectGraphGenerator(n)
             for trial in range(num_trials):
-                graphs[n].append(generator.generate_random_split_graph(.5, co_split))
+                graphs[n].append(generator.generate_random_split_graph(.5, co_split, n=n))
     else:
         graphs = load_preprocessing('graph_coloring', pp_file)
         n_values: List[int] = sorted(graphs.keys())
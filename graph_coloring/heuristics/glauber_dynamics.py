@@ -29,14 +29,15 @@ class GlauberDynamics(GraphColoringHeuristic):
                 AVAILABLE_COLORS_AT,
                 COLORED_NODES,
                 NUM_NEIGHBORING_COLORS
-            }
+            },
+            rng=self.rng
         )
 
         k: int = min(max_degree(self.G) + delta, len(self.G))
 
         # Start with a random MAX_DEGREE + delta coloring
         # Note: this is NOT a proper coloring
-        partition: Dict[int, Set[int]] = graph.generate_random_color_partition(self.G, k)
+        partition: Dict[int, Set[int]] = graph.generate_random_color_partition(self.G, k, self.rng)
         self.solution.set_coloring_with_color_classes(partition)
 
         # TODO: remove
@@ -1,5 +1,4 @@
 import copy
-import random
 import time
 
 from graph_coloring.heuristics.graph_coloring_heuristic import GraphColoringHeuristic
@@ -50,7 +49,8 @@ class GreedyColor(GraphColoringHeuristic):
             while len(ind_set) != 0:
                 num_added += 1
 
-                v: int = random.choice(list(ind_set))
+                candidates: list = list(ind_set)
+                v: int = candidates[self.rng.integers(len(candidates))]
                 ind_set.remove(v)
 
                 # Now color the node according to the right greedy strategy
@@ -129,7 +129,8 @@ class GreedyColor(GraphColoringHeuristic):
 
         self.solution: GraphColoringTracker = GraphColoringTracker(
             self.G,
-            requested_data=requested_data
+            requested_data=requested_data,
+            rng=self.rng
         )
         self.results = results
         self.trial = trial
@@ -7,7 +7,7 @@ from typing import List, Tuple, Dict
 import click
 import networkx as nx
 
-from util.graph import PerfectGraphGenerator
+from util.graph import PerfectGraphGenerator, load_table_cache
 from util.storage import store_preprocessing
 
 
@@ -40,14 +40,14 @@ def preprocessing(verbose, n, min_n, max_n, step, num_trials, co_split, store_na
 
     graphs: Dict[int, List[Tuple[nx.Graph, int]]] = defaultdict(list)
     comp_split: bool = bool(random.randint(0, 1)) if co_split == -1 else co_split
-    generator: PerfectGraphGenerator = None
+    # One generator serves every n, with its tables loaded from the table cache
+    generator: PerfectGraphGenerator = PerfectGraphGenerator(max(n_values), load_table_cache('graph_coloring'))
     for n in n_values:
-        generator = PerfectGraphGenerator(n)
         for trial in range(num_trials):
             if verbose:
                 print(f'[V]: Generating an order {n} graph for trial {trial}...')
 
-            graphs[n].append(generator.generate_random_split_graph(.5, comp_split))
+            graphs[n].append(generator.generate_random_split_graph(.5, comp_split, n=n))
 
     del generator
     gc.collect()
@@ -7,6 +7,7 @@ import sys
 from typing import List, Set, Tuple
 
 import click
+import numpy as np
 
 from independent_set.heuristics.fixed_gww import FixedGWW
 from independent_set.heuristics.independent_set_heuristic import \
@@ -15,8 +16,10 @@ from independent_set.heuristics.phase_heuristic import PhaseHeuristic
 from independent_set.heuristics.successive_augmentation import \
     SuccessiveAugmentation
 from independent_set.result_models.heuristic_results import HeuristicResults
+from util.models.planted_oracle import PlantedOracle
 from util.new_graph.models.graph import generate_planted_ind_set_graph
 from util.storage import store_results
+from util.trial_executor import resolve_root_seed, run_trials
 
 ##########################################
 #       Configuration
@@ -31,6 +34,8 @@ def planted_ind_set_size(n: int) -> int:
 
 # The probability that edges exist
 EDGE_PROBABILITY: float = 0.5
+# The graph implementation to generate instances with (see GRAPH_BACKENDS)
+GRAPH_BACKEND: str = "bitset"
 # The maximum number of steps an optimizer can run before we stop it
 MAX_OPTIMIZER_STEPS: int = 999
 # The percent to accomplish between each print statement
@@ -70,9 +75,29 @@ HEURISTIC_METADATA = {
 ##########################################
 
 
-def run_heuristic(n: List[int], num_trials, verbose) -> HeuristicResults:
+def _run_trial(n_value: int, planted_size: int, rng: np.random.Generator) -> Tuple[int, float, int]:
+    """Runs the heuristic on a fresh graph, returning (intersection_size, density, subset_size)"""
+    # Generate a random graph
+    (G, B) = generate_planted_ind_set_graph(n_value, EDGE_PROBABILITY, planted_size, GRAPH_BACKEND, rng=rng)
+    # Run the heuristic
+    HEURISTIC.clear()
+
+    # Each phase resets the oracle to its starting solution, so the phases can share it
+    oracle: PlantedOracle = PlantedOracle(B)
+    HEURISTIC_METADATA["metadata"][0]["intersection_oracle"] = oracle
+    HEURISTIC_METADATA["metadata"][1]["intersection_oracle"] = oracle
+
+    HEURISTIC.run_heuristic(G, HEURISTIC_METADATA, rng=rng)
+
+    # Take the results, collect data, store the results
+    return (len(HEURISTIC.solution.intersection(B)), G.density(HEURISTIC.solution), len(HEURISTIC.solution))
+
+
+def run_heuristic(n: List[int], num_trials, verbose, workers: int = 1, seed: int = None) -> HeuristicResults:
     #? Initialization
     results: HeuristicResults = HeuristicResults(n, num_trials, planted_ind_set_size, HEURISTIC_METADATA)
+    results.root_seed = seed = resolve_root_seed(seed)
+    trials: List[Tuple[Tuple[int, int], tuple]] = []
     for n_value in n:
         planted_size: int = planted_ind_set_size(n_value)    
         if planted_size >= n_value:
@@ -80,24 +105,12 @@ def run_heuristic(n: List[int], num_trials, verbose) -> HeuristicResults:
             planted_size = n_value
         if verbose:
             print(f"Running experiment for n={n_value} with planted_size={planted_size}")
-        for t in range(num_trials):
-            # Generate a random graph
-            (G, B) = generate_planted_ind_set_graph(n_value, EDGE_PROBABILITY, planted_size)
-            # Run the heuristic
-            HEURISTIC.clear()
-
-            HEURISTIC_METADATA["metadata"][0]["intersection_oracle"] = lambda x : len(x.intersection(B))
-            HEURISTIC_METADATA["metadata"][1]["intersection_oracle"] = lambda x : len(x.intersection(B))
-
-            HEURISTIC.run_heuristic(G, HEURISTIC_METADATA)
-
-            # Take the results, collect data, store the results
-            intersection_size: int = len(HEURISTIC.solution.intersection(B))
-            density: float = G.density(HEURISTIC.solution)
-            subset_size: int = len(HEURISTIC.solution)
-            if verbose:
-                print(f"Collected results for n={n_value}, t={t}, with results {intersection_size}, {density}, {subset_size}")
-            results.add_result(n_value, t, intersection_size, density, subset_size)
+        trials.extend(((n_value, t), (n_value, planted_size)) for t in range(num_trials))
+
+    for (n_value, t), (intersection_size, density, subset_size) in run_trials(_run_trial, trials, workers, seed):
+        if verbose:
+            print(f"Collected results for n={n_value}, t={t}, with results {intersection_size}, {density}, {subset_size}")
+        results.add_result(n_value, t, intersection_size, density, subset_size)
     
     return results
 
@@ -123,7 +136,9 @@ def profile_heuristic():
 @click.option("--num-trials", required=False, multiple=False, type=int, default=1)
 @click.option("--transient", required=False, default=False, is_flag=True)
 @click.option("--verbose", required=False, is_flag=True, default=False)
-def heuristic(profile, n: List[int], min_n, max_n, step, num_trials, transient, verbose):
+@click.option("--workers", required=False, type=int, default=1, help="The number of processes to run trials in.")
+@click.option("--seed", required=False, type=int, default=None, help="Root seed for the trials. Runs are reproducible when set.")
+def heuristic(profile, n: List[int], min_n, max_n, step, num_trials, transient, verbose, workers, seed):
     #? Check if we are profiling and rec. profile.
     if profile:
         profile_heuristic()
@@ -141,6 +156,6 @@ def heuristic(profile, n: List[int], min_n, max_n, step, num_trials, transient,
         click.secho("All values of n must be positive.", fg="red")
 
     #? Run the heuristic, then persist results
-    results = run_heuristic(n, num_trials, verbose) 
+    results = run_heuristic(n, num_trials, verbose, workers, seed)
     if not transient:
         store_results("independent_set", results)
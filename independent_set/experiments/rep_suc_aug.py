@@ -3,11 +3,11 @@ import copy
 import cProfile
 import math
 import pstats
-import random
 import sys
-from typing import Callable, Set
+from typing import Callable, Set, Tuple
 
 import click
+import numpy as np
 
 from independent_set.heuristics.repeated_successive_augmentation import \
     RepeatedSuccessiveAugmentation
@@ -19,9 +19,11 @@ from independent_set.result_models.sa_distribution_results import \
     SADistributionResults
 from util.misc import validate
 from util.models.graph_subset_tracker import GraphSubsetTracker
+from util.models.planted_oracle import PlantedOracle
 from util.new_graph.models.graph import generate_planted_ind_set_graph
 from util.new_graph.util import greedily_recover_ind_subset
 from util.storage import store_results
+from util.trial_executor import resolve_root_seed, run_trials
 
 
 def planted_ind_set_size(n: int) -> int:
@@ -30,6 +32,7 @@ def planted_ind_set_size(n: int) -> int:
 
 class CONSTANTS:
     p: int = 0.5
+    graph_backend: str = "csr"
     headstart_size: int = 5
     max_iterations: int = 20
     init_epsilon: int = 12
@@ -40,44 +43,52 @@ def _v_print(condition: bool, message: str):
     if condition:
         print(f"[V] {message}")
 
+def _run_trial(n: int, rng: np.random.Generator) -> Tuple[int, int]:
+    """ Runs repeated successive augmentation on a fresh graph, returning (size, intersection) """
+    (G, I) = generate_planted_ind_set_graph(n, CONSTANTS.p, planted_ind_set_size(n), CONSTANTS.graph_backend, rng=rng)
+    alg: RepeatedSuccessiveAugmentation = RepeatedSuccessiveAugmentation(
+        max_iterations=CONSTANTS.max_iterations,
+        init_epsilon=CONSTANTS.init_epsilon,
+        next_epsilon=CONSTANTS.next_epsilon,
+        verbose=True,
+        debug=True,
+    )
+
+    # Define post step hook
+    def post_step_hook(S: Set[int], step: int):
+        print(f"+++ {len(S.intersection(I))}/{len(S)}")
+        pass
+
+    alg.run_heuristic(
+        G=G,
+        metadata={"intersection_oracle": PlantedOracle(I)},
+        seed=set(rng.choice(I, CONSTANTS.headstart_size, replace=False).tolist()),
+        post_step_hook=post_step_hook,
+        rng=rng,
+    )
+    return (len(alg.solution), len(alg.solution.intersection(I)))
+
+
 @click.command()
 @click.option("-n", required=True, multiple=False, type=int)
 @click.option("--num-trials", required=True, multiple=False, type=int)
 @click.option("--verbose", required=False, is_flag=True, default=False)
 @click.option("--transient", required=False, is_flag=True, default=False)
-def repeated_suc_aug(n, num_trials, verbose, transient):
+@click.option("--workers", required=False, type=int, default=1, help="The number of processes to run trials in.")
+@click.option("--seed", required=False, type=int, default=None, help="Root seed for the trials. Runs are reproducible when set.")
+def repeated_suc_aug(n, num_trials, verbose, transient, workers, seed):
     validate(
         num_trials > 0, f"Unable to run experiment without a positive number of trials."
     )
     validate(n > 0, f"Unable to run experiment with non-positive 0")
 
     results: RepeatedSucAugResults = RepeatedSucAugResults(n, num_trials)
-    alg: RepeatedSuccessiveAugmentation = RepeatedSuccessiveAugmentation(
-        max_iterations=CONSTANTS.max_iterations,
-        init_epsilon=CONSTANTS.init_epsilon,
-        next_epsilon=CONSTANTS.next_epsilon,
-        verbose=True,
-        debug=True,
-    )
+    results.root_seed = seed = resolve_root_seed(seed)
     _v_print(verbose, f"Graph Size={n}, Planted Size={planted_ind_set_size(n)}")
 
-    for t in range(num_trials):
-        (G, I) = generate_planted_ind_set_graph(n, CONSTANTS.p, planted_ind_set_size(n))
-        _v_print(verbose, f"Starting trial {t} / {num_trials}")
-
-        # Define post step hook
-        def post_step_hook(S: Set[int], step: int):
-            print(f"+++ {len(S.intersection(I))}/{len(S)}")
-            pass
-
-        alg.clear()
-        alg.run_heuristic(
-            G=G,
-            metadata={"intersection_oracle": lambda x: len(x.intersection(I))},
-            seed=set(random.sample(I, k=CONSTANTS.headstart_size)),
-            post_step_hook=post_step_hook,
-        )
-        _v_print(verbose, f"Size={len(alg.solution)}, Intersection={len(alg.solution.intersection(I))}")
+    trials = [((t,), (n,)) for t in range(num_trials)]
+    for (t,), (size, intersection) in run_trials(_run_trial, trials, workers, seed):
+        _v_print(verbose, f"Trial {t} / {num_trials}: Size={size}, Intersection={intersection}")
 
     if not transient:
         store_results("independent_set", results)
@@ -1,28 +1,71 @@
 #!env/bin/python3
 import copy
 import cProfile
+import functools
 import math
 import pstats
-import random
 import sys
+from typing import List, Set, Tuple
 
 import click
+import numpy as np
 
-from independent_set.heuristics.successive_augmentation import \
-    PruningSuccessiveAugmentation
+from independent_set.heuristics.batched_successive_augmentation import \
+    BatchedSuccessiveAugmentation
 from independent_set.result_models.sa_distribution_results import \
     SADistributionResults
 from util.misc import validate
+from util.new_graph.instance_cache import load_instance_cache
+from util.new_graph.models.abstract_graph import AbstractGraph
 from util.new_graph.models.graph import generate_planted_ind_set_graph
 from util.storage import store_results
+from util.trial_executor import resolve_root_seed, run_trials, trial_rng
 
 
 def planted_ind_set_size(n: int) -> int:
     return math.ceil(math.sqrt(n)) * 1
 
 EDGE_PROBABILITY: float = 0.5
+GRAPH_BACKEND: str = "csr"
 EPSILON: int = 3
 HEADSTART_SIZE: int = 5
+# The number of trials advanced together by the batched heuristic
+BATCH_SIZE: int = 64
+
+
+@functools.lru_cache(maxsize=1)
+def _load_graph(n: int, seed: int, cache: bool) -> Tuple[AbstractGraph, List[int]]:
+    """Generates the graph shared by every trial, once per worker process"""
+    return generate_planted_ind_set_graph(
+        n,
+        EDGE_PROBABILITY,
+        planted_ind_set_size(n),
+        GRAPH_BACKEND,
+        seed=seed,
+        cache=load_instance_cache("independent_set") if cache else None,
+    )
+
+
+def _sample_trial(G: AbstractGraph, I: List[int], rng: np.random.Generator) -> Tuple[List[int], List[int]]:
+    """Draws the (vertex permutation, headstart) of a trial, in the order the heuristic would draw them"""
+    headstart: List[int] = rng.choice(I, HEADSTART_SIZE, replace=False).tolist()
+    return rng.permutation(G.vertex_list()).tolist(), headstart
+
+
+def _run_batch(n: int, seed: int, cache: bool, trial_nums: List[int], rng: np.random.Generator) -> List[Tuple[int, List[int], Set[int]]]:
+    """
+    Runs the trials in `trial_nums` together. Each trial draws its permutation and headstart from its
+    own generator, derived from the root seed and the trial number, so results do not depend on how
+    trials are batched.
+    """
+    G, I = _load_graph(n, seed, cache)
+    samples = [_sample_trial(G, I, trial_rng(seed, (t,))) for t in trial_nums]
+    sa: BatchedSuccessiveAugmentation = BatchedSuccessiveAugmentation(G, I, EPSILON)
+    solutions: List[Set[int]] = sa.run(
+        np.array([node_list for node_list, _ in samples]),
+        np.array([headstart for _, headstart in samples]),
+    )
+    return [(t, node_list, solution) for t, (node_list, _), solution in zip(trial_nums, samples, solutions)]
 
 
 """
@@ -33,27 +76,30 @@ HEADSTART_SIZE: int = 5
 @click.option("--num-trials", required=True, multiple=False, type=int)
 @click.option("--verbose", required=False, is_flag=True, default=False)
 @click.option("--transient", required=False, is_flag=True, default=False)
-def sa_distribution(n, num_trials, verbose, transient):
+@click.option("--seed", required=False, type=int, default=None, help="Seed for graph generation. The graph is reproducible across runs when set.")
+@click.option("--cache", required=False, is_flag=True, default=False, help="Reuse the graph from the instance cache. Requires --seed.")
+@click.option("--workers", required=False, type=int, default=1, help="The number of processes to run trials in.")
+def sa_distribution(n, num_trials, verbose, transient, seed, cache, workers):
     validate(num_trials > 0, f"Unable to run experiment without a positive number of trials.")
     validate(n > 0, f"Unable to run experiment with non-postivie 0")
+    validate(seed is not None or not cache, f"The instance cache can only be used with a seed.")
 
-    #? Generate graph and then create results object
-    G, I = generate_planted_ind_set_graph(n, EDGE_PROBABILITY, planted_ind_set_size(n))
-    sa: PruningSuccessiveAugmentation = PruningSuccessiveAugmentation(permute_vertices=True)
+    #? Generate graph and then create results object. Workers regenerate the same graph from the seed.
+    seed = resolve_root_seed(seed)
+    G, I = _load_graph(n, seed, cache)
     results: SADistributionResults = SADistributionResults(G, I, EPSILON, num_trials, HEADSTART_SIZE)
+    results.root_seed = seed
 
-    for t in range(num_trials):
+    batches = [
+        ((b,), (n, seed, cache, list(range(start, min(start + BATCH_SIZE, num_trials)))))
+        for b, start in enumerate(range(0, num_trials, BATCH_SIZE))
+    ]
+    collected: int = 0
+    for _, batch in run_trials(_run_batch, batches, workers, seed):
+        results.add_results(*zip(*batch))
+        collected += len(batch)
         if verbose:
-            print(f"[V] Running trial {t+1} / {num_trials}")
-        sa.clear()
-
-        sa.run_heuristic(G, {
-                "intersection_oracle": lambda x : len(x.intersection(I)),
-                "epsilon": EPSILON,
-            },
-            seed=set(random.sample(I, k=HEADSTART_SIZE))
-        )
-        results.add_result(t, sa.node_list, sa.solution)
+            print(f"[V] Collected trial {collected} / {num_trials}")
 
     if not transient: 
         store_results("independent_set", results)
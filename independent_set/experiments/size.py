@@ -1,19 +1,30 @@
 #!env/bin/python3
 import copy
 import math
+import time
 
 import click
+import numpy as np
 
 from independent_set.heuristics.fixed_gww import FixedGWW
+from independent_set.heuristics.independent_set_heuristic import \
+    IndependentSetHeuristic
+from independent_set.heuristics.vectorized_gww import VectorizedFixedGWW
 from independent_set.result_models.size_results import SizeResults
-from util.graph import generate_planted_independent_set_graph
-from util.storage import store_results
+from util.new_graph.instance_cache import GraphInstanceCache, load_instance_cache
+from util.new_graph.models.graph import generate_planted_ind_set_graph
+from util.storage import (load_checkpoint, remove_checkpoint,
+                           store_checkpoint, store_results)
+from util.trial_executor import resolve_root_seed, run_trials
 
 
 def planted_ind_set_size(n: int) -> int:
     return math.ceil(math.sqrt(n)) * 1
 
 EDGE_PROBABILITY: float = 0.5
+GRAPH_BACKEND: str = "csr"
+# The minimum number of seconds between checkpoints of the collected results
+CHECKPOINT_INTERVAL: float = 300
 
 BASE_METADATA: dict = {
     "num_particles":            lambda n: 2 * int(math.sqrt(n)),
@@ -23,6 +34,27 @@ BASE_METADATA: dict = {
     "min_threshold":            0.1,
 }
 
+def _run_trial(n: int, k: int, t: int, verbose: bool, seed: int, cache: bool, vectorized: bool, rng: np.random.Generator) -> int:
+    """ Runs FixedGWW (or VectorizedFixedGWW) with subset size k on a fresh graph, returning the intersection size """
+    # Perform initial calculations and checks
+    planted_size = planted_ind_set_size(n)
+    if planted_size > n:
+        planted_size = n
+    if verbose:
+        print(f"[V] running trial with n, k, t = {n}, {k}, {t}")
+
+    # Construct metadata, set appropriate subset size
+    metadata = copy.copy(BASE_METADATA)
+    metadata["subset_size"] = lambda x : k
+
+    trial_seed = None if seed is None else (seed, n, k, t)
+    instance_cache: GraphInstanceCache = load_instance_cache("independent_set") if cache else None
+    (G, B) = generate_planted_ind_set_graph(n, EDGE_PROBABILITY, planted_size, GRAPH_BACKEND, seed=trial_seed, cache=instance_cache, rng=rng)
+    gww: IndependentSetHeuristic = VectorizedFixedGWW(verbose=True, debug=False) if vectorized else FixedGWW(verbose=True, debug=False)
+    gww.run_heuristic(G, metadata, rng=rng)
+    return len(gww.solution.intersection(B))
+
+
 """
     Experiment which attempts to solve a planted clique problem from start to end.
 """
@@ -35,6 +67,11 @@ BASE_METADATA: dict = {
 @click.option("--max-k",    required=True,  type=int,       help="The max. size of subset to run GWW with.")
 @click.option("--k-step",   required=True,  type=int,       help="The step size for k..")
 @click.option("--trials",   required=True,  type=int,       help="The number of trials to run for each k.")
+@click.option("--seed",     required=False, type=int,       default=None, help="Root seed for graph generation. Graphs are reproducible across runs when set.")
+@click.option("--cache",    required=False, is_flag=True,   default=False, help="Reuse graph instances from the instance cache. Requires --seed.")
+@click.option("--workers",  required=False, type=int,       default=1, help="The number of processes to run trials in.")
+@click.option("--resume",   required=False, is_flag=True,   default=False, help="Resume the sweep from its last checkpoint, skipping collected cells.")
+@click.option("--vectorized", required=False, is_flag=True, default=False, help="Run GWW with every particle's random walk vectorized (VectorizedFixedGWW).")
 def size(
     verbose,
     min_n,
@@ -44,6 +81,11 @@ def size(
     max_k,
     k_step,
     trials,
+    seed,
+    cache,
+    workers,
+    resume,
+    vectorized,
 ):
     # Print header if doing verbose output
     if verbose:
@@ -61,31 +103,43 @@ def size(
     # Create results and run experiment for each possible value
     n_values = range(min_n, max_n + 1, n_step)  # Adjusting for inclusivity
     k_values = range(min_k, max_k + 1, k_step)
-    results: SizeResults = SizeResults(n_values=n_values, k_values=k_values, trials=trials)
-    gww: FixedGWW = FixedGWW(verbose=True, debug=False)
-
-    for n, k, t in results:
-        # Perform initial calculations and checks
-        planted_size = planted_ind_set_size(n)
-        if planted_size > n:
-            planted_size = n
-        if verbose:
-            print(f"[V] running trial with n, k, t = {n}, {k}, {t}")
-
-        # Construct metadata, set appropriate subset size
-        metadata = copy.copy(BASE_METADATA)
-        metadata["subset_size"] = lambda x : k
-        
-        (G, B) = generate_planted_independent_set_graph(n, EDGE_PROBABILITY, planted_size, "planted")
-        gww.clear()
-        gww.run_heuristic(G, metadata)
-
-        intersection_size: int = len(gww.solution.subset.intersection(B))
-        if verbose:
-            print(f"[V] Results: intersection_size of {intersection_size}")
-        
-        results.add_result(n, k, t, intersection_size)
-        if verbose:
-            print(f"[V] Collected Results: {results.get_results_collected()} / {results.get_total_results()}")
+    results: SizeResults = load_checkpoint("independent_set", SizeResults) if resume else None
+    if results is None:
+        if resume:
+            print(f"No checkpoint found to resume from. Starting the sweep from scratch.")
+        results = SizeResults(n_values=n_values, k_values=k_values, trials=trials)
+        results.root_seed = resolve_root_seed(seed)
+        results.seed = seed
+    elif not results.matches(n_values, k_values, trials):
+        raise Exception(f"The checkpoint is for a sweep over n={results.n_values}, k={results.k_values}, trials={results.trials}, not the requested sweep.")
+    elif seed is not None and seed != results.seed:
+        raise Exception(f"The checkpoint was run with seed {results.seed}, not {seed}.")
+    elif verbose:
+        print(f"[V] Resuming from checkpoint with {results.get_results_collected()} / {results.get_total_results()} results collected.")
+
+    # A resumed sweep is seeded as it was originally, whether or not --seed is passed again
+    seed = results.seed
+    if cache and seed is None:
+        raise Exception("The instance cache can only be used with a seed.")
+
+    # Trials are seeded from the seeds stored with the results, so resumed cells match an uninterrupted sweep
+    cells = [((n, k, t), (n, k, t, verbose, seed, cache, vectorized)) for n, k, t in results if not results.is_collected(n, k, t)]
+    last_checkpoint: float = time.time()
+    try:
+        for (n, k, t), intersection_size in run_trials(_run_trial, cells, workers, results.root_seed):
+            if verbose:
+                print(f"[V] Results: intersection_size of {intersection_size}")
+            
+            results.add_result(n, k, t, intersection_size)
+            if verbose:
+                print(f"[V] Collected Results: {results.get_results_collected()} / {results.get_total_results()}")
+            if time.time() - last_checkpoint >= CHECKPOINT_INTERVAL:
+                store_checkpoint("independent_set", results)
+                last_checkpoint = time.time()
+    except KeyboardInterrupt:
+        # Keep everything collected so far, so the sweep can be picked back up with --resume
+        store_checkpoint("independent_set", results)
+        raise
 
     store_results("independent_set", results)
+    remove_checkpoint("independent_set", SizeResults)
@@ -3,52 +3,59 @@ import copy
 import cProfile
 import math
 import pstats
-import random
+import shutil
 import sys
+from typing import List, Tuple
 
 import click
+import numpy as np
 
-from independent_set.heuristics.successive_augmentation import \
-    SuccessiveAugmentation
+from independent_set.heuristics.batched_successive_augmentation import \
+    BatchedSuccessiveAugmentation
 from independent_set.result_models.suc_aug_concentration_results import \
     SucAugConcentrationResults
 from util.graph import generate_planted_independent_set_graph
 from util.misc import validate
+from util.new_graph.instance_cache import GraphInstanceCache, load_instance_cache
 from util.new_graph.models.graph import generate_planted_ind_set_graph
-from util.storage import store_results
+from util.storage import results_tensor_directory, store_results
+from util.trial_executor import resolve_root_seed, run_trials
 
 
 def planted_ind_set_size(n: int) -> int:
     return math.ceil(math.sqrt(n)) * 1
 
 EDGE_PROBABILITY: float = 0.5
+GRAPH_BACKEND: str = "csr"
 HEADSTART_SIZE: int = 5
 
-def _run_trial(n: int, planted_size: int, trial_num: int, verbose: bool, result: SucAugConcentrationResults):
-    sa: SuccessiveAugmentation = SuccessiveAugmentation()
+def _run_trial(
+    n: int,
+    planted_size: int,
+    trial_num: int,
+    verbose: bool,
+    epsilon_values: List[int],
+    seed: int = None,
+    cache: bool = False,
+    step_interval: int = 1,
+    rng: np.random.Generator = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Runs every epsilon on one graph in lockstep, returning the (sizes, intersections) matrices
+    where row i holds the solution at every `step_interval`-th step of epsilon_values[i]
+    """
     if verbose:
         print(f"[V] Running trial {trial_num+1}")
 
-    (G, B) = generate_planted_ind_set_graph(n, EDGE_PROBABILITY, planted_size)
+    trial_seed = None if seed is None else (seed, trial_num)
+    instance_cache: GraphInstanceCache = load_instance_cache("independent_set") if cache else None
+    (G, B) = generate_planted_ind_set_graph(n, EDGE_PROBABILITY, planted_size, GRAPH_BACKEND, seed=trial_seed, cache=instance_cache, rng=rng)
 
-    # ? For each epsilon value, run the experiment on the SAME Graph provided above
-    for epsilon in result.epsilon_values:
-        if verbose:
-            print(f"[V] Running epsilon={epsilon}")
-        sa.clear()
-
-        def post_step_hook(subset: set, step: int):
-            result.add_result(epsilon, step, trial_num, size=len(subset), intersection=len(subset.intersection(B)))
-        
-        sa.run_heuristic(
-            G,
-            {
-                "intersection_oracle": lambda x : len(x.intersection(B)),
-                "epsilon": epsilon,
-            },
-            seed=set(random.sample(B, k=HEADSTART_SIZE)),
-            post_step_hook=post_step_hook
-        )
+    # ? Run each epsilon value on the SAME Graph and vertex order, from its own headstart
+    headstarts: List[List[int]] = [rng.choice(B, HEADSTART_SIZE, replace=False).tolist() for _ in epsilon_values]
+    sa: BatchedSuccessiveAugmentation = BatchedSuccessiveAugmentation(G, B, epsilon_values, prune=False)
+    sa.run(np.tile(G.vertex_list(), (len(epsilon_values), 1)), headstarts, trace=True)
+    return sa.step_sizes[:, ::step_interval], sa.step_intersections[:, ::step_interval]
 
 
 """
@@ -61,18 +68,32 @@ def _run_trial(n: int, planted_size: int, trial_num: int, verbose: bool, result:
 @click.option("--num-trials",   required=True,  multiple=False, type=int)
 @click.option("--verbose",      required=False, is_flag=True, default=False)
 @click.option("--transient",    required=False, is_flag=True, default=False)
-def suc_aug_concentration(n, min_epsilon, max_epsilon, num_trials, verbose, transient):
+@click.option("--seed",         required=False, type=int, default=None, help="Root seed for graph generation. Graphs are reproducible across runs when set.")
+@click.option("--cache",        required=False, is_flag=True, default=False, help="Reuse graph instances from the instance cache. Requires --seed.")
+@click.option("--workers",      required=False, type=int, default=1, help="The number of processes to run trials in.")
+@click.option("--step-interval", required=False, type=int, default=1, help="Only record every k-th step of each trial, for very large n.")
+@click.option("--out-of-core",  required=False, is_flag=True, default=False, help="Keep the result tensors memory-mapped on disk rather than in RAM.")
+def suc_aug_concentration(n, min_epsilon, max_epsilon, num_trials, verbose, transient, seed, cache, workers, step_interval, out_of_core):
     #? Validate arguments
     validate(num_trials > 0, f"Cannot run experiment with ({num_trials} < 1) trials")
     validate(min_epsilon <= max_epsilon, f"min_epsilon cannot be less than max_epsilon")
     validate(n > 0, f"n={n} must be positive.")
+    validate(seed is not None or not cache, f"The instance cache can only be used with a seed.")
+    validate(step_interval > 0, f"step_interval={step_interval} must be positive.")
     planted_size: int = planted_ind_set_size(n)
-    result: SucAugConcentrationResults = SucAugConcentrationResults(n, min_epsilon, max_epsilon, num_trials, HEADSTART_SIZE, planted_size)
+    directory: str = results_tensor_directory("independent_set", SucAugConcentrationResults) if out_of_core else None
+    result: SucAugConcentrationResults = SucAugConcentrationResults(n, min_epsilon, max_epsilon, num_trials, HEADSTART_SIZE, planted_size, step_interval, directory)
+    result.root_seed = resolve_root_seed(seed)
 
-    for t in result.trial_values:
-        _run_trial(n, planted_size, t, verbose, result)
+    trials = [((t,), (n, planted_size, t, verbose, result.epsilon_values, seed, cache, step_interval)) for t in result.trial_values]
+    for (t,), (sizes, intersections) in run_trials(_run_trial, trials, workers, result.root_seed):
+        result.add_trial_results(t, sizes, intersections)
     
     if not transient: 
         store_results("independent_set", result)
     elif verbose:
         print(f"[V] Skipping store step because transient was set to true.")
+
+    # The stored result links to the memory-mapped tensors itself, so their directory is no longer needed
+    if directory is not None:
+        shutil.rmtree(directory)
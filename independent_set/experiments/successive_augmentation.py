@@ -3,22 +3,26 @@ import copy
 import cProfile
 import math
 import pstats
-import random
+import shutil
 import sys
 import time
-from typing import List
+from typing import List, Tuple
 
 import click
+import numpy as np
 
 from independent_set.heuristics.successive_augmentation import \
     SuccessiveAugmentation
 from independent_set.result_models.sa_results import SuccAugResults
 from util.misc import guess_timing
 from util.models.graph_subset_tracker import GraphSubsetTracker
+from util.models.planted_oracle import PlantedOracle
+from util.models.step_trace import StepTrace
 from util.new_graph.models.graph import generate_planted_ind_set_graph
 from util.new_graph.models.ind_boundary_ind_set_graph import \
     generate_planted_ind_set_model
-from util.storage import store_results
+from util.storage import results_tensor_directory, store_results
+from util.trial_executor import resolve_root_seed, run_trials
 
 
 def planted_ind_set_size(n: int) -> int:
@@ -29,41 +33,51 @@ EPSILON: int = 1
 HEADSTART_SIZE: int = 5
 
 
-def run_successive_augmentation(n, num_trials, verbose) -> SuccAugResults:
+def _run_trial(n: int, step_interval: int, rng: np.random.Generator) -> Tuple[StepTrace, int, int]:
+    """
+        Runs successive augmentation on a fresh graph, returning the trace of the size and
+        intersection after every `step_interval`-th step along with the final size and intersection.
+    """
+    # Construct graph and run experiment
+    (G, B) = generate_planted_ind_set_model(n, EDGE_PROBABILITY, planted_ind_set_size(n), rng)
+    sa: SuccessiveAugmentation = SuccessiveAugmentation(verbose=True)
+    trace: StepTrace = StepTrace(n - HEADSTART_SIZE, ["size", "intersection"], every=step_interval)
+    oracle: PlantedOracle = PlantedOracle(B)
+    sa.run_heuristic(
+        G, 
+        {
+            "intersection_oracle": oracle,
+            "epsilon": EPSILON
+        }, 
+        seed=set(rng.choice(B, HEADSTART_SIZE, replace=False).tolist()), 
+        rng=rng,
+        step_trace=trace,
+    )
+    return (trace, len(sa.solution), len(sa.solution.intersection(B)))
+
+
+def run_successive_augmentation(
+    n, num_trials, verbose, workers: int = 1, seed: int = None, step_interval: int = 1, directory: str = None
+) -> SuccAugResults:
     #? Run the heuristic, then persist results
     results: SuccAugResults = SuccAugResults(
-        n, planted_ind_set_size(n), EPSILON, num_trials, HEADSTART_SIZE
+        n, planted_ind_set_size(n), EPSILON, num_trials, HEADSTART_SIZE, step_interval, directory=directory
     )
-    sa: SuccessiveAugmentation = SuccessiveAugmentation(verbose=True)
+    results.root_seed = seed = resolve_root_seed(seed)
     timings: List[float] = []
-    for t in results:
-        start: float = time.time()
-
-        # Construct graph and run experiment
-        (G, B) = generate_planted_ind_set_model(n, EDGE_PROBABILITY, planted_ind_set_size(n))
-        sa.clear()
-
-        def post_step_hook(subset: set, step: int):
-            results.add_result(step, t, size=len(subset), intersection=len(subset.intersection(B)))
-
-        sa.run_heuristic(
-            G, 
-            {
-                "intersection_oracle": lambda x : len(x.intersection(B)),
-                "epsilon": EPSILON
-            }, 
-            seed=set(random.sample(B, k=HEADSTART_SIZE)), 
-            post_step_hook=post_step_hook
-        )
+    start: float = time.time()
+    trials = [((t,), (n, step_interval)) for t in results]
+    for (t,), (trace, size, intersection_size) in run_trials(_run_trial, trials, workers, seed):
         #? Gather final results and store
-        intersection_size: int = len(sa.solution.intersection(B))
-        size: int = len(sa.solution)
+        results.add_step_trace(t, trace)
         results.add_final_results(size, intersection_size)
         end: float = time.time()
+        # Time between completions rather than per trial, so estimates hold with multiple workers
         timings.append(end - start)
+        start = end
         completed, remaining, upper_bound, total = guess_timing(timings, num_trials)
         if verbose:
-            print(f"[V] {t+1} / {num_trials}\tElapsed: {completed:.2f}\tRemaining: {remaining:.2f} ({upper_bound:.2f})\tTotal: {total:.2f}\tSize: {size}\tIntersection: {intersection_size}")
+            print(f"[V] {len(timings)} / {num_trials}\tElapsed: {completed:.2f}\tRemaining: {remaining:.2f} ({upper_bound:.2f})\tTotal: {total:.2f}\tSize: {size}\tIntersection: {intersection_size}")
     return results
 
 
@@ -75,15 +89,27 @@ def run_successive_augmentation(n, num_trials, verbose) -> SuccAugResults:
 @click.option("--num-trials", required=True, multiple=False, type=int)
 @click.option("--verbose", required=False, is_flag=True, default=False)
 @click.option("--transient", required=False, is_flag=True, default=False)
-def successive_augmentation(n, num_trials, verbose, transient):
+@click.option("--workers", required=False, type=int, default=1, help="The number of processes to run trials in.")
+@click.option("--seed", required=False, type=int, default=None, help="Root seed for the trials. Runs are reproducible when set.")
+@click.option("--step-interval", required=False, type=int, default=1, help="Only record every k-th step of each trial, for very large n.")
+@click.option("--out-of-core", required=False, is_flag=True, default=False, help="Keep the result tensors memory-mapped on disk rather than in RAM.")
+def successive_augmentation(n, num_trials, verbose, transient, workers, seed, step_interval, out_of_core):
     #? Validate arguments
     if num_trials < 1:
         click.secho("Unable to run experiment without a positive number of trials", fg="red")
         sys.exit(1)
+    if step_interval < 1:
+        click.secho("Unable to record steps with a non-positive step interval", fg="red")
+        sys.exit(1)
     
-    results: SuccAugResults = run_successive_augmentation(n, num_trials, verbose)
+    directory: str = results_tensor_directory("independent_set", SuccAugResults) if out_of_core else None
+    results: SuccAugResults = run_successive_augmentation(n, num_trials, verbose, workers, seed, step_interval, directory)
 
     if not transient: 
         store_results("independent_set", results)
     elif verbose:
         print(f"[V] Skipping store step because transient was set to true.")
+
+    # The stored result links to the memory-mapped tensors itself, so their directory is no longer needed
+    if directory is not None:
+        shutil.rmtree(directory)
@@ -0,0 +1,142 @@
+from typing import List, Set, Union
+
+import numpy as np
+
+from util.models.graph_subset_tracker import GraphSubsetTracker
+from util.new_graph.models.abstract_graph import AbstractGraph
+from util.new_graph.util import greedily_recover_ind_subset
+
+# The number of columns of the trials' orders scanned at once for the next accepted vertex.
+# The window doubles after every scan which accepts nothing, and resets after an accept.
+MIN_WINDOW: int = 32
+
+
+class BatchedSuccessiveAugmentation(object):
+    """
+    Runs many trials of (pruning) successive augmentation over one graph at once, where the
+    intersection oracle of every trial is the size of its intersection with the planted set.
+    Trial t visits the vertices in the order of `permutations[t]`, starting from the vertices in
+    `headstarts[t]`, and makes exactly the same choices as PruningSuccessiveAugmentation given
+    the same order and headstart. `epsilon` is either shared by all trials or given per trial,
+    which runs an epsilon sweep in lockstep.
+
+    NOTE: Solutions are rows of a T x n boolean matrix, alongside a T x n matrix of how many
+    neighbors each vertex has in each solution. A trial's threshold only changes when it accepts a
+    vertex, so rather than stepping one vertex at a time, all trials scan a window of their orders
+    for the first vertex any of them accepts, and jump together to that column. A vertex accepted
+    by several trials has its neighbor array fetched once, shared by all of them.
+    """
+
+    def __init__(self, G: AbstractGraph, planted: List[int], epsilon: Union[int, List[int]], prune: bool = True):
+        if not G.has_explicit_edges:
+            raise Exception("Batched successive augmentation requires a graph which stores its edges.")
+        self.G: AbstractGraph = G
+        self.epsilon: np.ndarray = np.asarray(epsilon)
+        self.prune: bool = prune
+        self.in_planted: np.ndarray = np.zeros(G.size, dtype=bool)
+        self.in_planted[np.asarray(planted, dtype=np.int64)] = True
+        # The solution size / planted intersection of every trial after each of its steps, see `run`
+        self.step_sizes: np.ndarray = None
+        self.step_intersections: np.ndarray = None
+
+
+    def run(self, permutations: np.ndarray, headstarts: np.ndarray, trace: bool = False) -> List[Set[int]]:
+        """
+        Runs a trial for every row of the T x n `permutations` and the T x h `headstarts`,
+        returning the final solution of each trial.
+
+        With `trace`, also sets `step_sizes` and `step_intersections`, the T x (n - h) matrices of
+        the size and planted intersection of every trial's solution after each of its steps, where
+        a step visits a vertex outside of the solution (as in SuccessiveAugmentation's post step hook).
+        """
+        order: np.ndarray = np.asarray(permutations, dtype=np.int64)
+        headstarts = np.asarray(headstarts, dtype=np.int64)
+        num_trials, n = order.shape
+        rows: np.ndarray = np.arange(num_trials)[:, None]
+
+        #? Initialize the solutions to their headstarts
+        in_solution: np.ndarray = np.zeros((num_trials, n), dtype=bool)
+        in_solution[rows, headstarts] = True
+        counts: np.ndarray = np.zeros((num_trials, n), dtype=np.int32)
+        for j in range(headstarts.shape[1]):
+            counts += self.G.adjacency_rows(headstarts[:, j])
+        initial_sizes: np.ndarray = in_solution.sum(axis=1)
+        initial_intersections: np.ndarray = in_solution[:, self.in_planted].sum(axis=1)
+        sizes: np.ndarray = initial_sizes.copy()
+        intersections: np.ndarray = initial_intersections.copy()
+        epsilons: np.ndarray = np.broadcast_to(self.epsilon, (num_trials,))
+        thresholds: np.ndarray = np.maximum((sizes - intersections) / 2 - epsilons, 0)
+        # Cells are gathered through flat indices, which is far cheaper than 2D fancy indexing
+        flat_counts: np.ndarray = counts.reshape(-1)
+        flat_in_solution: np.ndarray = in_solution.reshape(-1)
+        row_offsets: np.ndarray = rows * n
+
+        #? Jump every trial to the next column of its order at which any trial accepts
+        accepted_trials: List[np.ndarray] = []
+        accepted_columns: List[np.ndarray] = []
+        i, width = 0, MIN_WINDOW
+        while i < n:
+            cells: np.ndarray = row_offsets + order[:, i:i + width]
+            acceptable: np.ndarray = (flat_counts.take(cells) <= thresholds[:, None]) & ~flat_in_solution.take(cells)
+            hit: np.ndarray = acceptable.any(axis=1)
+            if not hit.any():
+                i += width
+                width *= 2
+                continue
+            first: np.ndarray = np.where(hit, acceptable.argmax(axis=1), width)
+            column: int = int(first.min())
+            accepted: np.ndarray = np.flatnonzero(first == column)
+            added: np.ndarray = order[accepted, i + column]
+
+            flat_in_solution[cells[accepted, column]] = True
+            sizes[accepted] += 1
+            intersections[accepted] += self.in_planted[added]
+            thresholds[accepted] = np.maximum((sizes[accepted] - intersections[accepted]) / 2 - epsilons[accepted], 0)
+            if len(accepted) == 1:
+                flat_counts[row_offsets[accepted[0], 0] + self.G.neighbor_array(added[0])] += 1
+            else:
+                distinct, inverse = np.unique(added, return_inverse=True)
+                neighbors: List[np.ndarray] = [self.G.neighbor_array(u) for u in distinct]
+                flat_counts[np.concatenate([row_offsets[t, 0] + neighbors[j] for t, j in zip(accepted, inverse)])] += 1
+
+            accepted_trials.append(accepted)
+            accepted_columns.append(np.full(len(accepted), i + column))
+            i, width = i + column + 1, MIN_WINDOW
+
+        if trace:
+            self.__trace(order, headstarts, initial_sizes, initial_intersections, accepted_trials, accepted_columns)
+        solutions: List[Set[int]] = [set(np.flatnonzero(row).tolist()) for row in in_solution]
+        if self.prune:
+            solutions = [greedily_recover_ind_subset(self.G, GraphSubsetTracker(self.G, s)) for s in solutions]
+        return solutions
+
+
+    def __trace(
+        self,
+        order: np.ndarray,
+        headstarts: np.ndarray,
+        initial_sizes: np.ndarray,
+        initial_intersections: np.ndarray,
+        accepted_trials: List[np.ndarray],
+        accepted_columns: List[np.ndarray],
+    ):
+        """
+        Rebuilds the per step sizes and intersections from the accepted vertices, where the step of
+        a vertex is its column less the number of headstart vertices before it in the trial's order
+        """
+        num_trials, n = order.shape
+        rows: np.ndarray = np.arange(num_trials)[:, None]
+        positions: np.ndarray = np.empty_like(order)
+        positions[rows, order] = np.arange(n)
+        headstart_columns: np.ndarray = positions[rows, headstarts]
+
+        trials: np.ndarray = np.concatenate(accepted_trials + [np.zeros(0, dtype=np.int64)])
+        columns: np.ndarray = np.concatenate(accepted_columns + [np.zeros(0, dtype=np.int64)])
+        steps: np.ndarray = columns - (headstart_columns[trials] < columns[:, None]).sum(axis=1)
+        num_steps: int = n - headstarts.shape[1]
+
+        added: np.ndarray = np.zeros((num_trials, num_steps), dtype=np.int64)
+        added[trials, steps] = 1
+        self.step_sizes = initial_sizes[:, None] + np.cumsum(added, axis=1)
+        added[trials, steps] = self.in_planted[order[trials, columns]]
+        self.step_intersections = initial_intersections[:, None] + np.cumsum(added, axis=1)
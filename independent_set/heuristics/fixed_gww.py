@@ -1,4 +1,3 @@
-import random
 from typing import List, Set
 
 from networkx.algorithms.similarity import debug_print
@@ -32,7 +31,7 @@ class FixedGWW(IndependentSetHeuristic):
         given size
     """
     def __select_initial_subset(self, size: int) -> GraphSubsetTracker:
-        return GraphSubsetTracker(self.G, uniformly_sample_subset(self.G, size))
+        return GraphSubsetTracker(self.G, uniformly_sample_subset(self.G, size, self.rng), self.rng)
 
 
     """
@@ -106,7 +105,7 @@ class FixedGWW(IndependentSetHeuristic):
                 self.verbose_print(f"WARNING: Unable to replicate points because no subsets survived.")
                 return
             while len(temp_subsets) < num_particles:
-                temp_subsets.append(random.choice(list(temp_subsets)).replicate())
+                temp_subsets.append(temp_subsets[self.rng.integers(len(temp_subsets))].replicate())
             subsets = temp_subsets
 
 
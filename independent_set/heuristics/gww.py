@@ -1,4 +1,3 @@
-import random
 from typing import List, Set
 
 from independent_set.heuristics.independent_set_heuristic import \
@@ -28,7 +27,7 @@ class GWW(IndependentSetHeuristic):
         given size
     """
     def __select_initial_subset(self, size: int) -> GraphSubsetTracker:
-        return GraphSubsetTracker(self.G, uniformly_sample_subset(self.G, size))
+        return GraphSubsetTracker(self.G, uniformly_sample_subset(self.G, size, self.rng), self.rng)
 
 
     """
@@ -46,7 +45,7 @@ class GWW(IndependentSetHeuristic):
                 subset.remove_random_node()
                 size -= 1
             else:
-                if random.randint(0, 1):
+                if self.rng.integers(2):
                     subset.add_random_node()
                     size += 1
                 else:
@@ -105,7 +104,7 @@ class GWW(IndependentSetHeuristic):
                 self.verbose_print(f"WARNING: Unable to replicate points because no subsets survived.")
                 return
             while len(temp_subsets) < num_particles:
-                temp_subsets.append(random.choice(list(temp_subsets)).replicate())
+                temp_subsets.append(temp_subsets[self.rng.integers(len(temp_subsets))].replicate())
             subsets = temp_subsets
 
 
@@ -1,5 +1,4 @@
 import math
-import random
 
 import util.formulas as formulas
 from independent_set.heuristics.independent_set_heuristic import \
@@ -23,10 +22,10 @@ class Metropolis(IndependentSetHeuristic):
         return threshold
 
 
-    def __select_initial_subset(self):
+    def __select_initial_subset(self) -> GraphSubsetTracker:
         # Right now just select a random point
-        x = random.choice(self.G.vertex_list())
-        return set([x])
+        x = int(self.rng.choice(self.G.vertex_list()))
+        return GraphSubsetTracker(self.G, set([x]), self.rng)
 
 
     def _run_heuristic(self, temperature, max_steps):
@@ -38,7 +37,7 @@ class Metropolis(IndependentSetHeuristic):
             k: int = solution.size()
 
             #? Generate a candidate and calculate new density
-            node: int = random.choice(self.G.vertex_list())
+            node: int = int(self.rng.integers(self.G.size))
             removing: bool = node in solution
             internal_degree: int = solution.internal_degree(node)
             if removing:
@@ -48,7 +47,7 @@ class Metropolis(IndependentSetHeuristic):
 
             #? Calculate acceptance threshold, determine action
             threshold: float = self.__calc_threshold(new_density, temperature)
-            if random.random() <= threshold:
+            if self.rng.random() <= threshold:
                 if removing:
                     solution.remove_node(node)
                 else:
@@ -19,5 +19,5 @@ class PhaseHeuristic(IndependentSetHeuristic):
             raise RuntimeError("Phase independent_set_heuristics was run with invalid length of metadata.")
 
         for i, h in enumerate(self.heuristics):
-            h.run_heuristic(self.G, metadata[i], seed=self.solution) # Note: self.solution is a shallow copy, so solution subset is same throughout.
+            h.run_heuristic(self.G, metadata[i], seed=self.solution, rng=self.rng) # Note: self.solution is a shallow copy, so solution subset is same throughout.
         self.solution = self.heuristics[len(self.heuristics) - 1].solution
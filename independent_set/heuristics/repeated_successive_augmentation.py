@@ -1,13 +1,13 @@
 import copy
-import random
 import sys
-from typing import Callable, List, Set
+from typing import Callable, List, Set, Union
 
 from independent_set.heuristics.independent_set_heuristic import \
     IndependentSetHeuristic
 from independent_set.heuristics.successive_augmentation import \
     SuccessiveAugmentation
 from util.models.graph_subset_tracker import GraphSubsetTracker
+from util.models.planted_oracle import IntersectionOracle
 from util.new_graph.util import greedily_recover_ind_subset
 
 
@@ -34,7 +34,7 @@ class RepeatedSuccessiveAugmentation(IndependentSetHeuristic):
             True, verbose, debug
         )
 
-    def _run_heuristic(self, intersection_oracle: Callable):
+    def _run_heuristic(self, intersection_oracle: Union[IntersectionOracle, Callable]):
         assert (
             self.solution is not None
         ), "Repeated successive augmentaiton requires a seed set"
@@ -49,6 +49,7 @@ class RepeatedSuccessiveAugmentation(IndependentSetHeuristic):
                 self.G,
                 {"intersection_oracle": intersection_oracle, "epsilon": epsilon},
                 seed=self.solution,
+                rng=self.rng,
             )
             # self.solution = self.successive_augmentation.solution
             self.solution = greedily_recover_ind_subset(self.G, GraphSubsetTracker(self.G, self.successive_augmentation.solution))
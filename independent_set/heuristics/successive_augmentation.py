@@ -1,11 +1,13 @@
 import copy
-import random
 import sys
 from typing import Callable, List, Set
 
+import numpy as np
+
 from independent_set.heuristics.independent_set_heuristic import \
     IndependentSetHeuristic
 from util.models.graph_subset_tracker import GraphSubsetTracker
+from util.models.planted_oracle import IntersectionOracle, as_intersection_oracle
 from util.new_graph.util import greedily_recover_ind_subset
 
 
@@ -16,6 +18,14 @@ class SuccessiveAugmentation(IndependentSetHeuristic):
 
         prune_final_solution        Whether or not to greedily construct final solution out of result
         permute_vertices            Whether or not to permute vertices at the start of each run
+
+    The `intersection_oracle` metadata is either an IntersectionOracle (e.g. a PlantedOracle), which
+    is kept up to date as vertices are added, or a callable `oracle(solution) -> int`. A step trace
+    passed to `run_heuristic` records the `size` and `intersection` of the solution after each step.
+
+    NOTE: On graphs which store their edges, the number of neighbors each vertex has in the solution
+    is kept in a count vector which is updated from the neighbor array of every added vertex. The
+    accept test is then a single lookup rather than an edge boundary query per vertex.
     """
 
     def __init__(self, permute_vertices: bool = False, verbose: bool = False, debug: bool = False):
@@ -30,23 +40,40 @@ class SuccessiveAugmentation(IndependentSetHeuristic):
         self.permute_vertices: bool = permute_vertices
     
 
+    def __solution_neighbor_counts(self) -> np.ndarray:
+        """Returns the number of neighbors every vertex has in the current solution"""
+        counts: np.ndarray = np.zeros(self.G.size, dtype=np.int32)
+        for u in self.solution:
+            counts[self.G.neighbor_array(u)] += 1
+        return counts
+
+
     def _run_heuristic(self, intersection_oracle, epsilon):
         #? Set initial solution to empty value
         if self.solution is None:
             self.solution = set()
         self.node_list = self.G.vertex_list()
         if self.permute_vertices:
-            random.shuffle(self.node_list)
+            self.node_list = self.rng.permutation(self.node_list).tolist()
+        counts: np.ndarray = self.__solution_neighbor_counts() if self.G.has_explicit_edges else None
+        oracle: IntersectionOracle = as_intersection_oracle(intersection_oracle)
+        oracle.reset(self.solution)
         step: int = 0
         for v in self.node_list:
             if v in self.solution:
                 continue
             s: int = len(self.solution)
-            k: int = intersection_oracle(self.solution)
+            k: int = oracle.intersection()
             threshold: int = max((s - k) /2 - epsilon, 0)
-            if self.G.edge_boundary(v, self.solution) <= threshold:
+            boundary: int = counts[v] if counts is not None else self.G.edge_boundary(v, self.solution)
+            if boundary <= threshold:
                 self.solution.add(v)
+                oracle.add(v)
+                if counts is not None:
+                    counts[self.G.neighbor_array(v)] += 1
             self.call_post_step_hook(self.solution, step)
+            if self.wants_step(step):
+                self.step_trace.record(step, size=len(self.solution), intersection=oracle.intersection())
             step += 1
 
 
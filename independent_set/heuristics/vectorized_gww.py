@@ -0,0 +1,139 @@
+from typing import Set
+
+import numpy as np
+
+from independent_set.heuristics.independent_set_heuristic import \
+    IndependentSetHeuristic
+
+
+class VectorizedFixedGWW(IndependentSetHeuristic):
+    """
+    FixedGWW with the whole population stored as matrices, so that every random walk step,
+    threshold cull, and replenish is a handful of NumPy operations over all particles at once
+    rather than a python loop over particles. Takes the same metadata as FixedGWW.
+
+    NOTE: Each particle is a row of `order`, a permutation of the vertices whose first
+    `subset_size` entries are the particle's subset, alongside a row of `degrees` holding the
+    internal degree of every vertex into that subset. A swap exchanges a random entry on either
+    side of the boundary and adds / subtracts the adjacency rows of the two swapped vertices.
+    """
+
+    def __init__(self, verbose: bool = False, debug: bool = False):
+        super().__init__(
+            expected_metadata_keys=[
+                "num_particles",
+                "threshold_added_change",
+                "subset_size",
+                "random_walk_steps",
+                "min_threshold",
+            ],
+            verbose=verbose,
+            debug=debug
+        )
+
+
+    def __select_initial_subsets(self, num_particles: int, subset_size: int):
+        """
+            Selects a uniformly random subset of the given size for every particle, setting
+            the order, internal degree, and edge count of each.
+        """
+        n: int = self.G.size
+        self.order: np.ndarray = np.argsort(self.rng.random((num_particles, n)), axis=1).astype(np.int32)
+        self.degrees: np.ndarray = np.zeros((num_particles, n), dtype=np.int32)
+        for i in range(subset_size):
+            self.degrees += self.G.adjacency_rows(self.order[:, i])
+        particles: np.ndarray = np.arange(num_particles)[:, None]
+        self.num_edges: np.ndarray = self.degrees[particles, self.order[:, :subset_size]].sum(axis=1) // 2
+
+
+    def __random_walk(self, subset_size: int, steps: int):
+        """
+            Performs `steps` random swaps on every particle at once, where each swap exchanges
+            a uniformly random vertex in the subset with one outside of it.
+        """
+        num_particles, n = self.order.shape
+        particles: np.ndarray = np.arange(num_particles)
+        for step in range(steps):
+            i: np.ndarray = self.rng.integers(0, subset_size, size=num_particles)
+            j: np.ndarray = self.rng.integers(subset_size, n, size=num_particles)
+            to_remove: np.ndarray = self.order[particles, i]
+            to_add: np.ndarray = self.order[particles, j]
+            added_rows: np.ndarray = self.G.adjacency_rows(to_add)
+            # Equivalent to adding then removing, where the added vertex counts towards the removed one
+            self.num_edges += (
+                self.degrees[particles, to_add]
+                - self.degrees[particles, to_remove]
+                - added_rows[particles, to_remove]
+            )
+            self.degrees += added_rows
+            self.degrees -= self.G.adjacency_rows(to_remove)
+            self.order[particles, i] = to_add
+            self.order[particles, j] = to_remove
+
+
+    def _get_best_subset(self, subset_size: int) -> Set[int]:
+        return set(self.order[np.argmin(self.num_edges), :subset_size].tolist())
+
+
+    def _run_heuristic(self, num_particles, threshold_added_change, subset_size, random_walk_steps, min_threshold):
+        n: int = self.G.size
+        num_particles: int = num_particles(n)
+        random_walk_steps: int = random_walk_steps(n)
+        subset_size: int = subset_size(n)
+
+        self.verbose_print([
+                f"Running heuristic with the following arguments",
+                f"Num. Particles: {num_particles}",
+                f"Random Walk Steps: {random_walk_steps}",
+                f"Subset Size: {subset_size}",
+                f"[V] ==========="
+        ])
+
+        #? Metadata validation
+        if subset_size > n:
+            self.verbose_print(f"Running fixed gww with subset size too large ({subset_size} > {n}). Returning empty set")
+            self.solution = set()
+            return
+
+        if num_particles < 1:
+            raise Exception("Cannot run GWW with non-positive number of points")
+
+        if min_threshold < 0:
+            raise Exception("Minimum threshold for GWW can not be less than 0.")
+
+        if threshold_added_change > min_threshold:
+            raise Exception(f"A threshold density change of {threshold_added_change} will go past 0, as min_threshold is set to {min_threshold} for GWW.")
+
+        #? Initialize trackers
+        self.__select_initial_subsets(num_particles, subset_size)
+        pos_edges: int = max((subset_size * (subset_size - 1)) // 2, 1)
+        # The threshold that all points should satisfy
+        threshold: float = 0.6
+
+        while threshold > min_threshold:
+            self.debug_print(f"Threshold: {threshold}")
+            #? Take a random walk at each point
+            self.__random_walk(subset_size, random_walk_steps)
+
+            #? Remove all subsets which are not below the threshold
+            survivors: np.ndarray = np.flatnonzero(self.num_edges / pos_edges <= threshold)
+            self.debug_print(f"{len(survivors)} / {num_particles} surviving particles.")
+
+            # Check if subsets is empty
+            if len(survivors) == 0:
+                self.solution = self._get_best_subset(subset_size)
+                self.verbose_print(f"WARNING: Unable to replicate points because no subsets survived.")
+                return
+
+            #? Replicate subsets until points are replenished
+            replicas: np.ndarray = self.rng.choice(survivors, size=num_particles - len(survivors))
+            kept: np.ndarray = np.concatenate([survivors, replicas])
+            self.order = self.order[kept]
+            self.degrees = self.degrees[kept]
+            self.num_edges = self.num_edges[kept]
+
+            #? Reduce the threshold for next iteration
+            densities: np.ndarray = np.sort(self.num_edges / pos_edges)
+            threshold = densities[len(densities) // 2] + threshold_added_change
+
+        self.solution = self._get_best_subset(subset_size)
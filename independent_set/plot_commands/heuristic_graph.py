@@ -1,5 +1,3 @@
-import os
-import sys
 from typing import List
 
 import click
@@ -10,7 +8,6 @@ import util.plot.scatter as scatter
 from independent_set.result_models.heuristic_results import (HeuristicResults,
                                                              StatInfo)
 from util.commands import verify_and_load_results_v2
-from util.storage import load
 
 
 @click.command()
@@ -65,23 +62,3 @@ def plot_heuristics_graphs(today, folder):
         y_spacing=0.25
     )
     plot.save_plot(file_name="subset-sizes", project_name="independent_set", folder=folder)
-
-@click.command()
-@click.option("--today", required=False, is_flag=True, default=False, help="Flag to indicate to use results from today")
-@click.option("--folder", required=True, help="The folder to save the graphs into")
-def plot_heuristics_graphs(today, folder):
-    if not today:
-        pickle_name = click.prompt("Please enter the file for the results", type=str)
-    else:
-        pickle_name = f"results/{generate_heuristic_results_file_name()}"
-
-    if not os.path.isfile(f"{pickle_name}.pkl"):
-        click.secho(f"The file at {pickle_name}.pkl could not be found.", err=True)
-        sys.exit(0)
-    
-    results: HeuristicResults = load(pickle_name)
-    if not results:
-        click.secho("Could not load results.", err=True)
-        sys.exit(0)
-
-    __generate_graphs(results, folder)
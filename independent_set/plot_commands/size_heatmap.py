@@ -7,7 +7,6 @@ import util.plot.heatmap as heatmap
 import util.plot.plot as plot
 from independent_set.result_models.size_results import SizeResults
 from util.commands import verify_and_load_results_v2
-from util.storage import load
 
 
 @click.command()
@@ -16,8 +16,9 @@ class SADistributionResults(Result):
     result_identifier: str = "sa-distribution"
 
     def __init__(self, G: Graph, planted_ind_set: Set[int], epsilon: int, num_trials: int, headstart_size: int):
-        # Store metadata
-        self.G: Graph = G
+        # Store metadata. Only the size of the graph is kept, as the graph itself is far larger than
+        # the results and can be regenerated from the root seed.
+        self.n: int = G.size
         self.planted_ind_set = planted_ind_set
         self.epsilon: int = epsilon
         self.num_trials: int = num_trials
@@ -28,7 +29,7 @@ class SADistributionResults(Result):
         self.final_intersections: List[int] = [None] * self.num_trials
         self.final_solutions: List[set] = [None] * self.num_trials
         # Mapping from node -> # of times it appears in the final solutions
-        self.final_solution_appearances: List[int] = [0] * G.size
+        self.final_solution_appearances: List[int] = [0] * self.n
 
     def add_result(self, trial_num: int, vertex_permutation: List[int], solution: set):
         self.vertex_permutations[trial_num] = vertex_permutation
@@ -38,6 +39,11 @@ class SADistributionResults(Result):
         for vertex in solution:
             self.final_solution_appearances[vertex] += 1
 
+    def add_results(self, trial_nums: List[int], vertex_permutations: List[List[int]], solutions: List[set]):
+        """Adds the results of a batch of trials, where the i-th trial has number `trial_nums[i]`"""
+        for trial_num, vertex_permutation, solution in zip(trial_nums, vertex_permutations, solutions):
+            self.add_result(trial_num, vertex_permutation, solution)
+
     def get_num_appearances_for_each_planted_vertex(self) -> List[Tuple[int, int]]:
         """
         List of (vertex, num_appearances) to map out how often each vertex
@@ -5,6 +5,7 @@ from typing import Callable, List, Tuple
 import numpy as np
 
 from util.models.result import Result
+from util.models.step_trace import StepTrace
 from util.results.result_tensor import ResultTensor
 from util.tensor import tensor
 
@@ -13,25 +14,38 @@ class SuccAugResults(Result):
 
     result_identifier: str = "sa-results"
 
-    def __init__(self, n: int, planted_size: int, epsilon: int, trials: int, headstart_size: int):
+    def __init__(
+        self,
+        n: int,
+        planted_size: int,
+        epsilon: int,
+        trials: int,
+        headstart_size: int,
+        step_interval: int = 1,
+        dtype=np.int32,
+        directory: str = None,
+    ):
         # Store metadata
         self.trials = trials
         self.headstart_size: int = headstart_size
         self.epsilon: int = epsilon
+        # Only every `step_interval`-th step is stored, see StepTrace
+        self.step_interval: int = step_interval
 
         # Store ranges / keys for tracker
         self.trial_values = list(range(trials))
-        self.step_values = list(range(n - headstart_size))
+        self.step_values = list(range(0, n - headstart_size, step_interval))
         self.n = n
         self.planted_size = planted_size
 
-        # Initialize tracking tensors for the results
-        self.size_results: ResultTensor = ResultTensor()
+        # Initialize tracking tensors for the results. Passing a directory keeps them memory-mapped
+        # on disk rather than in RAM (see ResultTensor).
+        self.size_results: ResultTensor = ResultTensor(dtype, None if directory is None else f"{directory}/size")
         self.size_results.add_dimension("step", self.step_values)
         self.size_results.add_dimension("trial", self.trial_values)
         self.size_results.fix_dimensions()
 
-        self.intersection_results: ResultTensor = ResultTensor()
+        self.intersection_results: ResultTensor = ResultTensor(dtype, None if directory is None else f"{directory}/intersection")
         self.intersection_results.add_dimension("step", self.step_values)
         self.intersection_results.add_dimension("trial", self.trial_values)
         self.intersection_results.fix_dimensions()
@@ -45,6 +59,18 @@ class SuccAugResults(Result):
         self.intersection_results.add_result(intersection, step=step, trial=trial)
     
 
+    def add_trial_results(self, trial: int, sizes: List[int], intersections: List[int]):
+        """Adds the size and intersection at every stored step of a trial, in the order of `step_values`"""
+        self.size_results.add_results_bulk(sizes, step=self.step_values, trial=trial)
+        self.intersection_results.add_results_bulk(intersections, step=self.step_values, trial=trial)
+
+
+    def add_step_trace(self, trial: int, trace: StepTrace):
+        """Adds the sizes and intersections recorded in the step trace of a trial"""
+        self.size_results.add_results_bulk(trace.column("size"), step=trace.steps(), trial=trial)
+        self.intersection_results.add_results_bulk(trace.column("intersection"), step=trace.steps(), trial=trial)
+
+
     def add_final_results(self, size: int, intersection: int):
         self.final_size: int = size
         self.final_intersection: int = intersection
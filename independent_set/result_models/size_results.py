@@ -10,6 +10,9 @@ from util.results.result_tensor import ResultTensor
 class SizeResults(Result):
 
     result_identifier: str = "size-results"
+    # The --seed the sweep was run with, or None when its graphs were drawn from the trial
+    # generators instead. Resumed sweeps take it from here, so they regenerate the same graphs.
+    seed: int = None
 
     def __init__(self, n_values: List[int], k_values: List[int], trials: int):
         # Store metadata
@@ -32,6 +35,15 @@ class SizeResults(Result):
         self.result.add_result(value, n=n, k=k, t=t)
 
 
+    def is_collected(self, n: int, k: int, t: int) -> bool:
+        return self.result.is_collected(n=n, k=k, t=t)
+
+
+    def matches(self, n_values: List[int], k_values: List[int], trials: int) -> bool:
+        """ Returns whether these results are for the sweep with the provided parameters """
+        return list(self.n_values) == list(n_values) and list(self.k_values) == list(k_values) and self.trials == trials
+
+
     def get_avg_heatmap_values(self):
         if not self.result.all_results_collected():
             raise Warning(f"Attempt to get heatmap values for SizeResults with only {self.result.results_collected} / {self.result.results_total}")
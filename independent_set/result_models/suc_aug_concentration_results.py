@@ -16,22 +16,49 @@ class SucAugConcentrationResults(Result):
 
     result_identifier: str = "sa-concentratino-results"
 
-    def __init__(self, n: int, min_epsilon: int, max_epsilon: int, num_trials: int, headstart_size: int, planted_ind_set_size: int):
+    def __init__(
+        self,
+        n: int,
+        min_epsilon: int,
+        max_epsilon: int,
+        num_trials: int,
+        headstart_size: int,
+        planted_ind_set_size: int,
+        step_interval: int = 1,
+        directory: str = None,
+    ):
         self.n = n
         self.min_epsilon = min_epsilon
         self.max_epsilon = max_epsilon
         self.num_trials = num_trials
         self.headstart_size = headstart_size
         self.planted_ind_set_size = planted_ind_set_size
+        self.step_interval = step_interval
         self.epsilon_values: List[int] = list(range(min_epsilon, max_epsilon + 1))
         self.trial_values: List[int] = list(range(num_trials))
-        self.results: Dict[int, SuccAugResults] = { epsilon: SuccAugResults(self.n, self.planted_ind_set_size, epsilon, self.num_trials, self.headstart_size) for epsilon in self.epsilon_values}
+        self.results: Dict[int, SuccAugResults] = {
+            epsilon: SuccAugResults(
+                self.n,
+                self.planted_ind_set_size,
+                epsilon,
+                self.num_trials,
+                self.headstart_size,
+                self.step_interval,
+                directory=None if directory is None else f"{directory}/epsilon={epsilon}",
+            )
+            for epsilon in self.epsilon_values
+        }
 
     def add_result(self, epsilon: int, step: int, trial: int, size: int, intersection: int) -> bool:
         validate(epsilon in self.epsilon_values, f"Cannot add result for {epsilon} which is not in the set epsilon values of {self.epsilon_values}")
         result: SuccAugResults = self.results[epsilon]
         return result.add_result(step, trial, size, intersection)
 
+    def add_trial_results(self, trial: int, sizes: np.ndarray, intersections: np.ndarray):
+        """Adds every stored step of a trial, where row i of `sizes` and `intersections` is for the i-th epsilon value"""
+        for epsilon, epsilon_sizes, epsilon_intersections in zip(self.epsilon_values, sizes, intersections):
+            self.results[epsilon].add_trial_results(trial, epsilon_sizes, epsilon_intersections)
+
     def get_results_for_epsilon(self, epsilon: int) -> SuccAugResults:
         validate(epsilon in self.epsilon_values, f"Cannot add result for {epsilon} which is not in the set epsilon values of {self.epsilon_values}")
         return self.results[epsilon]
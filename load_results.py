@@ -3,7 +3,7 @@ import sys
 
 import click
 
-from util.storage import load_from_path
+from util.storage import load_from_path, load_results_from_path
 
 if __name__ == "__main__":
     if len(sys.argv) != 2:
@@ -12,10 +12,16 @@ if __name__ == "__main__":
     
     path = sys.argv[1]
 
-    if not os.path.isfile(path):
+    if os.path.isdir(path):
+        # Columnar results directories, whose fields load as they are accessed
+        result = load_results_from_path(path)
+    elif os.path.isfile(path):
+        result = load_from_path(path)
+    else:
         click.echo("Error: Invalid path provided")
         sys.exit(1)
 
-    result = load_from_path(path)
     print(f"The requested result has been loaded from {path}. It may be accessed through the `results` object")
-    print(f"Keys: {list(result.__dict__.keys())}")
+    # Fields of columnar results which have not been accessed yet are still listed
+    keys = [k for k in result.__dict__.keys() if k != "_field_loaders"] + list(result.__dict__.get("_field_loaders", {}))
+    print(f"Keys: {keys}")
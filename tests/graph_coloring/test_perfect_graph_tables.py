@@ -0,0 +1,123 @@
+import math
+import os
+import tempfile
+import unittest
+from typing import List
+
+import networkx as nx
+import numpy as np
+import sympy
+from mpmath import mp
+
+from util.graph import (SPLIT_GRAPH_BACKENDS, LogStirlingTable,
+                        PerfectGraphGenerator, PerfectGraphTableCache,
+                        get_log_stirling_table, log_bell_table,
+                        max_bipartite_independent_set, random_k_partition,
+                        singleton_probability)
+
+
+class TestCase(unittest.TestCase):
+    """Validates the log-space tables against the exact mpmath computation they replaced"""
+
+    def setUp(self) -> None:
+        self.n: int = 60
+        self.generator: PerfectGraphGenerator = PerfectGraphGenerator(self.n)
+        # The mpmath A table, A_i = sum_{m < i} C(i - 1, m) A_m
+        self.A: List[mp.mpf] = [mp.mpf(1)]
+        for i in range(1, self.n + 1):
+            self.A.append(mp.fsum([mp.fmul(math.comb(i - 1, m), self.A[m]) for m in range(i)]))
+
+
+    def test_bell_table(self) -> None:
+        expected: np.ndarray = np.array([float(mp.log(int(sympy.bell(i)))) for i in range(self.n + 1)])
+        assert(np.allclose(log_bell_table(self.n), expected, rtol=1e-12))
+        assert(np.allclose(self.generator.log_A, [float(mp.log(a)) for a in self.A], rtol=1e-12))
+
+
+    def test_partition_prob(self) -> None:
+        for m in range(1, self.n + 1):
+            expected: np.ndarray = np.array([float(mp.fmul(math.comb(m - 1, k), mp.fdiv(self.A[k], self.A[m]))) for k in range(m)])
+            expected /= expected.sum()
+            assert(np.allclose(self.generator.get_partition_prob(self.n, m), expected, rtol=1e-9, atol=1e-15))
+
+
+    def test_central_clique_prob(self) -> None:
+        for n in [1, 10, self.n]:
+            l: List[mp.mpf] = [
+                mp.fmul(math.comb(n, k), mp.fmul(int(sympy.bell(n - k)), mp.power(2, k * (n - k)))) for k in range(n + 1)
+            ]
+            expected: np.ndarray = np.array([float(mp.fdiv(x, mp.fsum(l))) for x in l])
+            assert(np.allclose(self.generator.get_central_clique_prob(n), expected, rtol=1e-9, atol=1e-15))
+
+
+    def test_large_n(self) -> None:
+        """Test the tables stay finite where the values themselves overflow doubles"""
+        generator: PerfectGraphGenerator = PerfectGraphGenerator(3000)
+        assert(np.all(np.isfinite(generator.log_bell)))
+        assert(np.isclose(generator.get_central_clique_prob(3000).sum(), 1))
+        assert(np.isclose(generator.get_partition_prob(3000, 3000).sum(), 1))
+
+
+    def test_table_cache(self) -> None:
+        """Test one stored table set serves every smaller n, and is replaced by larger ones"""
+        with tempfile.TemporaryDirectory() as directory:
+            cache: PerfectGraphTableCache = PerfectGraphTableCache(directory)
+            computed: np.ndarray = cache.get_or_compute(100)["log_bell"]
+            loaded: np.ndarray = cache.get_or_compute(50)["log_bell"]
+            assert(isinstance(loaded, np.memmap))
+            assert(np.array_equal(loaded, computed[:51]) and np.array_equal(loaded, log_bell_table(50)))
+            cache.get_or_compute(200)
+            assert(os.listdir(directory) == [f"v{PerfectGraphTableCache.VERSION}-n200"])
+
+            generator: PerfectGraphGenerator = PerfectGraphGenerator(self.n, cache)
+            assert(np.array_equal(generator.log_bell, log_bell_table(self.n)))
+            G, _ = generator.generate_random_split_graph(.5, False, n=20)
+            assert(len(G) == 20)
+            self.assertRaises(IndexError, lambda: generator.generate_random_split_graph(.5, False, n=self.n + 1))
+            del loaded, generator
+
+
+    def test_split_graph_backends(self) -> None:
+        """Test every backend returns the same graph for the same seed"""
+        graphs: dict = {}
+        for backend in SPLIT_GRAPH_BACKENDS:
+            np.random.seed(0)
+            graphs[backend] = self.generator.generate_random_split_graph(.5, True, n=30, backend=backend)
+        A, cheat = graphs["dense"]
+        assert(np.array_equal(A, A.T) and not A.diagonal().any())
+        assert(np.array_equal(nx.to_numpy_array(graphs["networkx"][0], nodelist=range(30)) != 0, A))
+        assert(np.array_equal(graphs["csr"][0].adjacency_matrix() != 0, A))
+        assert(np.array_equal(graphs["bitset"][0].adjacency_matrix() != 0, A))
+        assert(all(graph_cheat == cheat for _, graph_cheat in graphs.values()))
+        self.assertRaises(Exception, lambda: self.generator.generate_random_split_graph(.5, True, backend="matrix"))
+
+
+    def test_max_bipartite_independent_set(self) -> None:
+        """Test the König independent set is independent, and as large as the maximum matching allows"""
+        rng: np.random.Generator = np.random.default_rng(0)
+        for _ in range(100):
+            B: np.ndarray = rng.random((rng.integers(0, 9), rng.integers(0, 9))) < rng.random()
+            in_rows, in_cols = max_bipartite_independent_set(B)
+            assert(not B[np.ix_(in_rows, in_cols)].any())
+            G: nx.Graph = nx.Graph()
+            G.add_nodes_from(range(sum(B.shape)))
+            G.add_edges_from((i, B.shape[0] + j) for i, j in zip(*np.nonzero(B)))
+            assert(in_rows.sum() + in_cols.sum() == len(G) - len(nx.max_weight_matching(G, maxcardinality=True)))
+
+
+    def test_stirling_table(self) -> None:
+        """Test the shared Stirling table is exact as it grows, and keeps partitions of thousands of vertices finite"""
+        table: LogStirlingTable = LogStirlingTable()
+        table.get(10, 3)
+        table.get(5, 12)
+        log_stirling: np.ndarray = table.get(self.n, 12)
+        for i in range(self.n + 1):
+            for j in range(13):
+                expected: int = int(sympy.functions.combinatorial.numbers.stirling(i, j))
+                assert(log_stirling[i, j] == -np.inf if expected == 0 else np.isclose(log_stirling[i, j], float(mp.log(expected)), rtol=1e-12))
+
+        log_stirling = get_log_stirling_table(3000, 30)
+        assert(np.all(np.isfinite(log_stirling[30:3001, 1:31])))
+        assert(0 < singleton_probability(log_stirling, 2999, 30) < 1)
+        partition: list = random_k_partition(set(range(3000)), 30, np.random.default_rng(0))
+        assert(len(partition) == 30 and set().union(*partition) == set(range(3000)))
@@ -1,3 +1,5 @@
+import gc
+
 import mpmath
 from tqdm import tqdm
 
@@ -1,8 +1,19 @@
 import time
 
-from util.graph import PerfectGraphGenerator
+from util.graph import SPLIT_GRAPH_BACKENDS, PerfectGraphGenerator
+
+"""
+Times building the generator tables, and generating a split graph in each backend.
+Run from the repository root with `python -m tests.graph_coloring.time_graph_generation`
+"""
 
 print("starting")
-start = time.time()
-PerfectGraphGenerator(n=1000).generate_random_split_graph(.5, False)
-print("finished", time.time() - start)
+for n in [1000, 3000]:
+    start = time.time()
+    generator = PerfectGraphGenerator(n=n)
+    print(f"n={n}\ttables\t{time.time() - start:.2f}s")
+generator = PerfectGraphGenerator(n=1000)
+for backend in SPLIT_GRAPH_BACKENDS:
+    start = time.time()
+    generator.generate_random_split_graph(.5, False, backend=backend)
+    print(f"n=1000\t{backend}\t{time.time() - start:.2f}s")
@@ -0,0 +1,36 @@
+import time
+
+import numpy as np
+
+from util.graph import random_k_partition
+
+"""
+Times repeated random k-partitions of 1,000 vertices, as `generate_random_color_partition` makes on
+every restart of a local search, with the shared log-space Stirling table against rebuilding the
+float Stirling table on every call.
+Run from the repository root with `python -m tests.graph_coloring.time_random_k_partition`
+"""
+
+N = 1000
+NUM_COLORS = 10
+NUM_PARTITIONS = 20
+
+
+def rebuild_stirling_table(n: int) -> np.ndarray:
+    """The previous per-call table, which overflows to inf past n of a few hundred"""
+    stirling: np.ndarray = np.zeros((n + 1, n + 1))
+    stirling[0, 0] = 1
+    for i in range(len(stirling) - 1):
+        for j in range(1, len(stirling[i])):
+            stirling[i + 1, j] = j * stirling[i, j] + stirling[i, j - 1]
+    return stirling
+
+
+for name, partition in [
+    ("rebuilt", lambda: (rebuild_stirling_table(N), random_k_partition(set(range(N)), NUM_COLORS))),
+    ("shared", lambda: random_k_partition(set(range(N)), NUM_COLORS)),
+]:
+    start = time.time()
+    for _ in range(NUM_PARTITIONS):
+        partition()
+    print(f"n={N}\t{name}\t{NUM_PARTITIONS} partitions in {time.time() - start:.2f}s")
@@ -0,0 +1,39 @@
+import time
+
+import numpy as np
+
+from util.graph import PerfectGraphGenerator
+
+"""
+Times sampling the unipolar partitions of 1,000 split graphs at n = 1,000, with the cached
+cumulative distributions of the generator against rebuilding each distribution on every draw.
+Both draw the same partitions from the same seed.
+Run from the repository root with `python -m tests.graph_coloring.time_random_partition`
+"""
+
+N = 1000
+NUM_GRAPHS = 1000
+
+
+def sample_uncached(generator: PerfectGraphGenerator, n: int):
+    """The previous sampling, where every draw rebuilds its distribution"""
+    k: int = int(np.random.choice(a=range(n + 1), p=generator.get_central_clique_prob(n)))
+    U: list = list(range(k, n))
+    m: int = len(U)
+    while m != 0:
+        k = np.random.choice(a=range(m), p=generator.get_partition_prob(n, m))
+        U.pop(np.argmax(U))
+        U = list(np.random.permutation(U))[:k]
+        m = k
+
+
+generator: PerfectGraphGenerator = PerfectGraphGenerator(N)
+for name, sample in [
+    ("uncached", lambda: sample_uncached(generator, N)),
+    ("cached", lambda: generator.generate_random_unipolar_partition(N)),
+]:
+    np.random.seed(0)
+    start = time.time()
+    for _ in range(NUM_GRAPHS):
+        sample()
+    print(f"n={N}\t{name}\t{NUM_GRAPHS} partitions in {time.time() - start:.2f}s")
@@ -0,0 +1,53 @@
+import unittest
+
+import numpy as np
+
+from independent_set.heuristics.batched_successive_augmentation import \
+    BatchedSuccessiveAugmentation
+from independent_set.heuristics.successive_augmentation import (
+    PruningSuccessiveAugmentation, SuccessiveAugmentation)
+from util.new_graph.models.graph import generate_planted_ind_set_graph
+
+
+class TestCase(unittest.TestCase):
+
+    def test_matches_pruning_successive_augmentation(self) -> None:
+        for backend in ["csr", "bitset"]:
+            G, I = generate_planted_ind_set_graph(200, 0.5, 15, backend, rng=np.random.default_rng(8))
+            permutations, headstarts, expected = [], [], []
+            for t in range(12):
+                rng: np.random.Generator = np.random.default_rng(t)
+                headstart = rng.choice(I, 5, replace=False).tolist()
+                sa: PruningSuccessiveAugmentation = PruningSuccessiveAugmentation(permute_vertices=True)
+                sa.run_heuristic(G, {
+                        "intersection_oracle": lambda x: len(x.intersection(I)),
+                        "epsilon": 3,
+                    },
+                    seed=set(headstart),
+                    rng=rng,
+                )
+                permutations.append(sa.node_list)
+                headstarts.append(headstart)
+                expected.append(sa.solution)
+            solutions = BatchedSuccessiveAugmentation(G, I, 3).run(np.array(permutations), np.array(headstarts))
+            assert(solutions == expected)
+
+
+    def test_epsilon_sweep_matches_successive_augmentation(self) -> None:
+        G, I = generate_planted_ind_set_graph(150, 0.5, 13, "csr", rng=np.random.default_rng(4))
+        epsilon_values = [0, 1, 2, 3]
+        headstarts = [np.random.default_rng(e).choice(I, 5, replace=False).tolist() for e in epsilon_values]
+        sa_batch: BatchedSuccessiveAugmentation = BatchedSuccessiveAugmentation(G, I, epsilon_values, prune=False)
+        solutions = sa_batch.run(np.tile(G.vertex_list(), (len(epsilon_values), 1)), headstarts, trace=True)
+        for i, epsilon in enumerate(epsilon_values):
+            expected = []
+            sa: SuccessiveAugmentation = SuccessiveAugmentation()
+            sa.run_heuristic(G, {
+                    "intersection_oracle": lambda x: len(x.intersection(I)),
+                    "epsilon": epsilon,
+                },
+                seed=set(headstarts[i]),
+                post_step_hook=lambda subset, step: expected.append((len(subset), len(subset.intersection(I)))),
+            )
+            assert(solutions[i] == sa.solution)
+            assert(list(zip(sa_batch.step_sizes[i], sa_batch.step_intersections[i])) == expected)
@@ -59,5 +59,17 @@ class TestExperiment(unittest.TestCase):
         )
         self._assert_success(response)
 
+
+    def test_parallel_trials(self) -> None:
+        """
+        Tests that experiments run with trials split across worker processes
+        """
+        response: CompletedProcess = run(
+            args="./exp.py ind-set heuristic -n 100 --num-trials 2 --transient --workers 2 --seed 0",
+            capture_output=True,
+            shell=True
+        )
+        self._assert_success(response)
+
 if __name__ == "__main__":
     unittest.main()
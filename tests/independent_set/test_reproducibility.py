@@ -0,0 +1,57 @@
+import unittest
+
+import numpy as np
+
+from independent_set.heuristics.fixed_gww import FixedGWW
+from independent_set.heuristics.gww import GWW
+from independent_set.heuristics.metropolis import Metropolis
+from independent_set.heuristics.successive_augmentation import \
+    SuccessiveAugmentation
+from util.new_graph.models.graph import generate_planted_ind_set_graph
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.n: int = 120
+        self.planted_size: int = 11
+
+
+    def _run_twice(self, heuristic, metadata: dict, backend: str = "csr") -> None:
+        """Runs the heuristic from the same seed twice, asserting graphs and solutions match"""
+        solutions = []
+        for _ in range(2):
+            rng: np.random.Generator = np.random.default_rng(12)
+            G, B = generate_planted_ind_set_graph(self.n, 0.5, self.planted_size, backend, rng=rng)
+            heuristic.run_heuristic(G, metadata(B), rng=rng)
+            solutions.append((sorted(B), sorted(heuristic.solution)))
+        assert(solutions[0] == solutions[1])
+
+
+    def test_successive_augmentation(self) -> None:
+        self._run_twice(
+            SuccessiveAugmentation(permute_vertices=True),
+            lambda B: {"intersection_oracle": lambda x: len(x.intersection(B)), "epsilon": 1},
+            backend="networkx",
+        )
+
+
+    def test_gww(self) -> None:
+        self._run_twice(FixedGWW(), lambda B: {
+            "num_particles": lambda n: 10,
+            "threshold_added_change": 0.0,
+            "subset_size": lambda n: 12,
+            "random_walk_steps": lambda n: 5,
+            "min_threshold": 0.1,
+        })
+        self._run_twice(GWW(), lambda B: {
+            "num_particles": lambda n: 10,
+            "min_subset_size": 12,
+            "threshold_added_change": 0.05,
+            "random_walk_steps": lambda n: 5,
+            "min_threshold": 0.1,
+        })
+
+
+    def test_metropolis(self) -> None:
+        self._run_twice(Metropolis(), lambda B: {"temperature": 0.5, "max_steps": 200})
@@ -0,0 +1,70 @@
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import click
+import numpy as np
+
+import independent_set.experiments.size as size_experiment
+from independent_set.result_models.size_results import SizeResults
+from util.new_graph.instance_cache import GraphInstanceCache
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory: str = tempfile.mkdtemp()
+        self.args: list = [
+            "--min-n", "30", "--max-n", "40", "--n-step", "10",
+            "--min-k", "4", "--max-k", "5", "--k-step", "1",
+            "--trials", "2",
+        ]
+        self.stored: list = []
+        self.patches: list = [
+            mock.patch("util.storage.get_experiment_results_directory", lambda project_name: self.directory),
+            mock.patch.object(size_experiment, "store_results", lambda project_name, res: self.stored.append(res)),
+            mock.patch.object(size_experiment, "load_instance_cache", lambda project_name: GraphInstanceCache(f"{self.directory}/instances", max_bytes=10 ** 9)),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self) -> None:
+        for patch in self.patches:
+            patch.stop()
+        shutil.rmtree(self.directory)
+
+
+    def _run(self, args: list):
+        size_experiment.size.main(args, standalone_mode=False)
+
+
+    def test_resume_without_seed(self) -> None:
+        """Test a seeded sweep resumed without --seed collects the same results as an uninterrupted one"""
+        self._run(self.args + ["--seed", "3"])
+        uninterrupted: SizeResults = self.stored.pop()
+
+        #? Interrupt the sweep after a few cells, which checkpoints it
+        run_trials = size_experiment.run_trials
+        def interrupted_run_trials(*args, **kwargs):
+            for i, result in enumerate(run_trials(*args, **kwargs)):
+                if i == 3:
+                    raise KeyboardInterrupt()
+                yield result
+        with mock.patch.object(size_experiment, "run_trials", interrupted_run_trials):
+            self.assertRaises((KeyboardInterrupt, click.exceptions.Abort), lambda: self._run(self.args + ["--seed", "3"]))
+        assert(len(self.stored) == 0)
+
+        self._run(self.args + ["--resume", "--cache"])
+        resumed: SizeResults = self.stored.pop()
+        assert(resumed.seed == 3 and resumed.root_seed == uninterrupted.root_seed)
+        assert(np.array_equal(resumed.result.results, uninterrupted.result.results))
+
+
+    def test_vectorized(self) -> None:
+        """Test the sweep runs GWW with the vectorized engine when requested"""
+        with mock.patch.object(size_experiment, "VectorizedFixedGWW", wraps=size_experiment.VectorizedFixedGWW) as engine:
+            self._run(self.args + ["--seed", "3", "--vectorized"])
+        assert(engine.call_count == 8)
+        results: SizeResults = self.stored.pop()
+        assert(results.get_results_collected() == results.get_total_results())
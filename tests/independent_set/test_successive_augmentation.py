@@ -0,0 +1,70 @@
+import unittest
+
+import numpy as np
+
+from independent_set.heuristics.phase_heuristic import PhaseHeuristic
+from independent_set.heuristics.repeated_successive_augmentation import \
+    RepeatedSuccessiveAugmentation
+from independent_set.heuristics.successive_augmentation import \
+    SuccessiveAugmentation
+from util.models.planted_oracle import PlantedOracle
+from util.models.step_trace import StepTrace
+from util.new_graph.models.graph import generate_planted_ind_set_graph
+
+
+class TestCase(unittest.TestCase):
+
+    def _run(self, G, B, seed=None) -> set:
+        heuristic: SuccessiveAugmentation = SuccessiveAugmentation(permute_vertices=True)
+        metadata: dict = {"intersection_oracle": lambda x: len(x.intersection(B)), "epsilon": 1}
+        heuristic.run_heuristic(G, metadata, seed=seed, rng=np.random.default_rng(3))
+        return heuristic.solution
+
+
+    def test_counts_match_edge_boundary_queries(self) -> None:
+        for backend in ["networkx", "csr", "bitset"]:
+            G, B = generate_planted_ind_set_graph(150, 0.5, 12, backend, rng=np.random.default_rng(5))
+            fast: set = self._run(G, B, seed=set(B[:4]))
+            # Force the edge boundary query path on this instance
+            G.has_explicit_edges = False
+            assert(fast == self._run(G, B, seed=set(B[:4])))
+
+
+    def test_planted_oracle_matches_callable(self) -> None:
+        G, B = generate_planted_ind_set_graph(150, 0.5, 12, "csr", rng=np.random.default_rng(6))
+        for oracle in [PlantedOracle(B), lambda x: len(x.intersection(B))]:
+            solutions = []
+            sa: SuccessiveAugmentation = SuccessiveAugmentation(permute_vertices=True)
+            sa.run_heuristic(G, {"intersection_oracle": oracle, "epsilon": 1}, seed=set(B[:4]), rng=np.random.default_rng(1))
+            solutions.append(sa.solution)
+            rep: RepeatedSuccessiveAugmentation = RepeatedSuccessiveAugmentation(3, 4, lambda x: x - 2)
+            rep.run_heuristic(G, {"intersection_oracle": oracle}, seed=set(B[:4]), rng=np.random.default_rng(1))
+            solutions.append(rep.solution)
+            phase: PhaseHeuristic = PhaseHeuristic(SuccessiveAugmentation(), SuccessiveAugmentation())
+            phase.run_heuristic(G, {"metadata": [
+                {"intersection_oracle": oracle, "epsilon": 3},
+                {"intersection_oracle": oracle, "epsilon": 0},
+            ]}, rng=np.random.default_rng(1))
+            solutions.append(phase.solution)
+            if isinstance(oracle, PlantedOracle):
+                expected = solutions
+            else:
+                assert(solutions == expected)
+
+
+    def test_step_trace_matches_post_step_hook(self) -> None:
+        G, B = generate_planted_ind_set_graph(120, 0.5, 11, "csr", rng=np.random.default_rng(2))
+        for every in [1, 7]:
+            expected = []
+            trace: StepTrace = StepTrace(115, ["size", "intersection"], every=every)
+            sa: SuccessiveAugmentation = SuccessiveAugmentation()
+            sa.run_heuristic(
+                G,
+                {"intersection_oracle": PlantedOracle(B), "epsilon": 1},
+                seed=set(B[:5]),
+                post_step_hook=lambda subset, step: expected.append((step, len(subset), len(subset.intersection(B)))),
+                step_trace=trace,
+            )
+            assert(len(expected) == 115)
+            recorded = list(zip(trace.steps().tolist(), trace.column("size").tolist(), trace.column("intersection").tolist()))
+            assert(recorded == expected[::every])
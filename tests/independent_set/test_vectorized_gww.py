@@ -0,0 +1,35 @@
+import unittest
+
+import numpy as np
+
+from independent_set.heuristics.vectorized_gww import VectorizedFixedGWW
+from util.new_graph.models.graph import generate_planted_ind_set_graph
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.n: int = 200
+        self.planted_size: int = 20
+        self.metadata: dict = {
+            "num_particles": lambda n: 40,
+            "threshold_added_change": 0.0,
+            "subset_size": lambda n: 15,
+            "random_walk_steps": lambda n: 8,
+            "min_threshold": 0.1,
+        }
+
+
+    def test_population_consistent_after_run(self) -> None:
+        """Test that the degree and edge trackers of every particle match the graph after a run"""
+        for backend in ["networkx", "csr", "bitset"]:
+            G, _ = generate_planted_ind_set_graph(self.n, 0.5, self.planted_size, backend=backend)
+            gww: VectorizedFixedGWW = VectorizedFixedGWW()
+            gww.run_heuristic(G, self.metadata)
+            assert(len(gww.solution) == 15)
+            assert(G.edges(gww.solution) == gww.num_edges.min())
+            for p in range(len(gww.order)):
+                subset = gww.order[p, :15]
+                assert(sorted(gww.order[p].tolist()) == list(range(self.n)))
+                assert(np.array_equal(gww.degrees[p], G.adjacency_rows(subset).sum(axis=0)))
+                assert(G.edges(set(subset.tolist())) == gww.num_edges[p])
@@ -0,0 +1,54 @@
+import random
+import time
+import tracemalloc
+from typing import List
+
+from util.models.graph_subset_tracker import GraphSubsetTracker
+from util.new_graph.models.graph import generate_planted_ind_set_graph
+from util.new_graph.util import uniformly_sample_subset
+
+"""
+Times the replenish phase of `FixedGWW._run_heuristic` (culling half of the particles, then
+replicating survivors until the population is full again) with eager and copy-on-write
+replication, reporting the wall time and the peak memory allocated by the phase.
+Run from the repository root with `python -m tests.independent_set.time_gww_replenish`
+"""
+
+N_VALUES = [1000, 5000, 20000]
+EDGE_PROBABILITY = 0.5
+# Fraction of particles which survive the threshold cull each round
+SURVIVAL_RATE = 0.5
+NUM_ROUNDS = 5
+
+
+def replenish(subsets: List[GraphSubsetTracker], num_particles: int, copy_on_write: bool) -> List[GraphSubsetTracker]:
+    survivors: List[GraphSubsetTracker] = subsets[:max(1, int(len(subsets) * SURVIVAL_RATE))]
+    while len(survivors) < num_particles:
+        survivors.append(random.choice(survivors).replicate(copy_on_write=copy_on_write))
+    return survivors
+
+
+for n in N_VALUES:
+    G, _ = generate_planted_ind_set_graph(n, EDGE_PROBABILITY, int(n ** 0.5), backend="csr")
+    num_particles: int = int(2 * n ** 0.5)
+    subset_size: int = int(n ** 0.5)
+    for copy_on_write in [False, True]:
+        random.seed(0)
+        subsets: List[GraphSubsetTracker] = [
+            GraphSubsetTracker(G, uniformly_sample_subset(G, subset_size)) for _ in range(num_particles)
+        ]
+        elapsed: float = 0
+        peak: int = 0
+        for _ in range(NUM_ROUNDS):
+            random.shuffle(subsets)
+            tracemalloc.start()
+            start = time.time()
+            subsets = replenish(subsets, num_particles, copy_on_write)
+            elapsed += time.time() - start
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+            # Walk a few of the particles, as only the replicas which move pay for their copy
+            for subset in subsets[:num_particles // 4]:
+                subset.swap_random_nodes()
+        mode: str = "copy-on-write" if copy_on_write else "eager"
+        print(f"n={n}\tparticles={num_particles}\t{mode:<14}{elapsed / NUM_ROUNDS * 1000:.2f}ms\t{peak / 2 ** 20:.2f}MiB peak")
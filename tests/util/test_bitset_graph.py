@@ -0,0 +1,76 @@
+import random
+import unittest
+from typing import Set, Tuple
+
+import networkx as nx
+import numpy as np
+
+from util.new_graph.models.bitset_graph import (BitsetGraph, pack_mask,
+                                                unpack_words)
+from util.new_graph.models.graph import Graph, add_planted_set
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # Not a multiple of 64 so that the last word of every row is partially used
+        self.n: int = 150
+        self.subset_size: int = 30
+
+    def _generate_test_graphs_and_subset(self) -> Tuple[Graph, BitsetGraph, Set[int]]:
+        seed: nx.Graph = nx.erdos_renyi_graph(self.n, 0.5)
+        subset: set = set(random.sample(range(self.n), self.subset_size))
+        return (Graph(seed), BitsetGraph.from_networkx(seed), subset)
+
+
+    def test_pack_round_trip(self) -> None:
+        mask: np.ndarray = np.random.rand(3, self.n) < 0.5
+        assert(np.array_equal(unpack_words(pack_mask(mask), self.n), mask))
+
+
+    def test_degree_and_neighbors(self) -> None:
+        G, B, _ = self._generate_test_graphs_and_subset()
+        for v in G.vertex_list():
+            assert(G.degree(v) == B.degree(v))
+            assert(set(G.neighbors(v)) == set(B.neighbors(v)))
+        assert(B.max_degree()[1] == max(G.degree(v) for v in G.vertex_list()))
+
+
+    def test_edge_boundary(self) -> None:
+        """Test edge boundaries agree for set, mask, and packed subsets"""
+        G, B, subset = self._generate_test_graphs_and_subset()
+        mask: np.ndarray = np.zeros(self.n, dtype=bool)
+        mask[list(subset)] = True
+        packed: np.ndarray = B.pack_subset(subset)
+        for v in G.vertex_list():
+            expected: int = G.edge_boundary(v, subset)
+            assert(expected == B.edge_boundary(v, subset))
+            assert(expected == B.edge_boundary(v, mask))
+            assert(expected == B.edge_boundary(v, packed))
+
+
+    def test_edges_and_density(self) -> None:
+        G, B, subset = self._generate_test_graphs_and_subset()
+        assert(G.edges(subset) == B.edges(subset))
+        assert(G.density(subset) == B.density(subset))
+
+
+    def test_adjacency_matrix(self) -> None:
+        G, B, _ = self._generate_test_graphs_and_subset()
+        assert(np.array_equal(G.adjacency_matrix(), B.adjacency_matrix()))
+        assert(np.array_equal(B.adjacency_matrix(), BitsetGraph.from_dense(G.adjacency_matrix()).adjacency_matrix()))
+
+
+    def test_planted_set(self) -> None:
+        _, B, _ = self._generate_test_graphs_and_subset()
+        ind_set_graph, ind_set = add_planted_set(B, self.subset_size, clique=False)
+        assert(ind_set_graph.edges(set(ind_set)) == 0)
+        clique_graph, clique = add_planted_set(B, self.subset_size, clique=True)
+        assert(clique_graph.density(set(clique)) == 1)
+        assert(all(not clique_graph.has_edge(v, v) for v in clique))
+
+
+    def test_adjacency_rows(self) -> None:
+        G, B, subset = self._generate_test_graphs_and_subset()
+        vertices: list = list(subset)
+        assert(np.array_equal(G.adjacency_rows(vertices), B.adjacency_rows(vertices)))
@@ -0,0 +1,82 @@
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from independent_set.result_models.sa_distribution_results import \
+    SADistributionResults
+from independent_set.result_models.suc_aug_concentration_results import \
+    SucAugConcentrationResults
+from util.new_graph.models.graph import generate_planted_ind_set_graph
+from util.results.columnar import (is_columnar_results, load_columnar,
+                                   store_columnar)
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory: str = tempfile.mkdtemp()
+        self.path: str = f"{self.directory}/results"
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+
+    def test_round_trip(self) -> None:
+        """Test every field of a stored result is loaded back, with tensors memory-mapped"""
+        result: SucAugConcentrationResults = SucAugConcentrationResults(50, 0, 1, 3, 5, 8)
+        result.root_seed = 2 ** 100
+        sizes: np.ndarray = np.arange(2 * 45).reshape(2, 45)
+        result.add_trial_results(1, sizes, sizes // 2)
+        store_columnar(result, self.path)
+        assert(is_columnar_results(self.path))
+
+        loaded: SucAugConcentrationResults = load_columnar(self.path)
+        assert(type(loaded) == SucAugConcentrationResults)
+        assert(loaded.root_seed == result.root_seed)
+        assert(loaded.epsilon_values == result.epsilon_values)
+        assert(list(loaded.results.keys()) == [0, 1])
+        tensor = loaded.get_results_for_epsilon(1).size_results
+        assert(isinstance(tensor.results, np.memmap))
+        assert(np.array_equal(tensor.results, result.results[1].size_results.results))
+        assert(tensor.get_results(step=44, trial=1) == sizes[1, 44])
+        assert(tensor.results_collected == 45)
+
+
+    def test_lazy_fields(self) -> None:
+        """Test fields are only read once accessed, and a loaded result can be stored again"""
+        G, I = generate_planted_ind_set_graph(60, 0.5, 8, "csr", seed=1)
+        result: SADistributionResults = SADistributionResults(G, I, 1, 2, 5)
+        result.add_results([0, 1], [list(range(60)), list(range(60))[::-1]], [{0, 1, 2}, {3, 4}])
+        store_columnar(result, self.path)
+
+        loaded: SADistributionResults = load_columnar(self.path)
+        assert("final_sizes" not in vars(loaded))
+        assert(loaded.get_final_sizes_minus_intersections() == result.get_final_sizes_minus_intersections())
+        assert("final_sizes" in vars(loaded) and "final_solutions" not in vars(loaded))
+        assert(loaded.final_solutions == [{0, 1, 2}, {3, 4}])
+
+        #? Storing over an existing result replaces it
+        store_columnar(loaded, self.path)
+        reloaded: SADistributionResults = pickle.loads(pickle.dumps(load_columnar(self.path)))
+        assert(reloaded.vertex_permutations == result.vertex_permutations)
+        assert(reloaded.final_solution_appearances == result.final_solution_appearances)
+
+
+    def test_memory_mapped_tensors_linked(self) -> None:
+        """Test memory-mapped tensors are linked rather than copied, and outlive their directory"""
+        tensor_directory: str = f"{self.directory}/tensors"
+        result: SucAugConcentrationResults = SucAugConcentrationResults(50, 0, 0, 2, 5, 8, directory=tensor_directory)
+        sizes: np.ndarray = np.arange(2 * 45).reshape(2, 45)
+        result.add_trial_results(1, sizes, sizes // 2)
+        store_columnar(result, self.path)
+        tensor = result.get_results_for_epsilon(0).size_results
+        assert(os.path.samefile(f"{tensor.directory}/results.npy", f"{self.path}/results/0/size_results.results.npy"))
+
+        shutil.rmtree(tensor_directory)
+        loaded: SucAugConcentrationResults = load_columnar(self.path)
+        assert(np.array_equal(loaded.get_results_for_epsilon(0).size_results.results, tensor.results))
+        assert(loaded.get_results_for_epsilon(0).size_results.get_results(step=44, trial=1) == sizes[0, 44])
@@ -0,0 +1,97 @@
+import random
+import unittest
+from typing import Set, Tuple
+
+import networkx as nx
+import numpy as np
+
+from util.models.graph_subset_tracker import GraphSubsetTracker
+from util.new_graph.models.csr_graph import CSRGraph
+from util.new_graph.models.graph import (Graph, add_planted_set,
+                                         generate_planted_ind_set_graph)
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.n: int = 100
+        self.subset_size: int = 20
+
+    def _generate_test_graphs_and_subset(self) -> Tuple[Graph, CSRGraph, Set[int]]:
+        seed: nx.Graph = nx.erdos_renyi_graph(self.n, 0.5)
+        subset: set = set(random.sample(range(self.n), self.subset_size))
+        return (Graph(seed), CSRGraph.from_networkx(seed), subset)
+
+
+    def test_degree(self) -> None:
+        G, C, _ = self._generate_test_graphs_and_subset()
+        for v in G.vertex_list():
+            assert(G.degree(v) == C.degree(v))
+        assert(C.max_degree()[1] == max(G.degree(v) for v in G.vertex_list()))
+        assert(C.min_degree()[1] == min(G.degree(v) for v in G.vertex_list()))
+
+
+    def test_neighbors(self) -> None:
+        G, C, _ = self._generate_test_graphs_and_subset()
+        for v in G.vertex_list():
+            assert(set(G.neighbors(v)) == set(C.neighbors(v)))
+            assert(set(G.neighbors(v)) == set(C.neighbor_array(v).tolist()))
+
+
+    def test_edge_boundary(self) -> None:
+        """Test edge boundaries agree for both set and mask subsets"""
+        G, C, subset = self._generate_test_graphs_and_subset()
+        mask: np.ndarray = np.zeros(self.n, dtype=bool)
+        mask[list(subset)] = True
+        for v in G.vertex_list():
+            assert(G.edge_boundary(v, subset) == C.edge_boundary(v, subset))
+            assert(G.edge_boundary(v, subset) == C.edge_boundary(v, mask))
+        assert(C.edge_boundary(0, set()) == 0)
+
+
+    def test_edges_and_density(self) -> None:
+        G, C, subset = self._generate_test_graphs_and_subset()
+        assert(G.edges(subset) == C.edges(subset))
+        assert(G.density(subset) == C.density(subset))
+        assert(G.edges(G.vertex_set()) == C.edges(C.vertex_set()))
+
+
+    def test_adjacency_matrix(self) -> None:
+        G, C, _ = self._generate_test_graphs_and_subset()
+        assert(np.array_equal(G.adjacency_matrix(), C.adjacency_matrix()))
+
+
+    def test_planted_set(self) -> None:
+        """Test planted independent sets and cliques are planted in the csr graph"""
+        _, C, _ = self._generate_test_graphs_and_subset()
+        ind_set_graph, ind_set = add_planted_set(C, self.subset_size, clique=False)
+        assert(ind_set_graph.edges(set(ind_set)) == 0)
+        clique_graph, clique = add_planted_set(C, self.subset_size, clique=True)
+        assert(clique_graph.density(set(clique)) == 1)
+        # Edges outside of the planted set are untouched
+        other: set = C.vertex_set().difference(ind_set)
+        assert(ind_set_graph.edges(other) == C.edges(other))
+
+
+    def test_backend_generation(self) -> None:
+        G, B = generate_planted_ind_set_graph(self.n, 0.5, self.subset_size, backend="csr")
+        assert(isinstance(G, CSRGraph))
+        assert(G.size == self.n)
+        assert(G.edges(set(B)) == 0)
+
+
+    def test_tracker(self) -> None:
+        """Test the subset tracker works unchanged on top of the csr graph"""
+        _, C, subset = self._generate_test_graphs_and_subset()
+        tracker: GraphSubsetTracker = GraphSubsetTracker(C, subset)
+        tracker.swap_random_nodes()
+        for v in C.vertex_list():
+            assert(C.edge_boundary(v, tracker.subset) == tracker.internal_degree(v))
+        assert(C.edges(tracker.subset) == tracker.num_edges())
+
+
+    def test_adjacency_rows(self) -> None:
+        G, C, subset = self._generate_test_graphs_and_subset()
+        vertices: list = list(subset)
+        assert(np.array_equal(G.adjacency_rows(vertices), C.adjacency_rows(vertices)))
+        assert(np.array_equal(C.adjacency_rows(vertices), C.adjacency_matrix()[vertices] == 1))
@@ -0,0 +1,55 @@
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+
+from util.results.dynamic_result_tensor import DynamicResultTensor
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tensor: DynamicResultTensor = DynamicResultTensor()
+        self.tensor.set_dynamic_dimension("step", chunk_size=4)
+        self.tensor.add_dimension("t", [0, 1, 2])
+        self.tensor.fix_dimensions()
+
+
+    def test_chunked_growth(self) -> None:
+        """Test results past the first chunk are kept, and the view tracks later writes"""
+        for step in range(10):
+            self.tensor.add_result(step, step=step, t=1)
+        assert(self.tensor.capacity == 12)
+        assert(np.array_equal(self.tensor.get_results()[:, 1], np.arange(10)))
+        # Writes inside the materialized view update it in place, and ones past it grow it
+        self.tensor.add_result(-1, step=2, t=0)
+        assert(self.tensor.results[2, 0] == -1)
+        self.tensor.add_result(5, step=13, t=2)
+        assert(self.tensor.get_results().shape == (14, 3))
+        assert(self.tensor.get_results()[13, 2] == 5)
+
+
+    def test_append(self) -> None:
+        expected: np.ndarray = np.arange(30).reshape(10, 3)
+        for row in expected:
+            self.tensor.append(row)
+        assert(np.array_equal(self.tensor.get_results(), expected))
+        assert(self.tensor.results_collected == 30)
+        loaded: DynamicResultTensor = pickle.loads(pickle.dumps(self.tensor))
+        assert(np.array_equal(loaded.get_results(), expected))
+
+
+    def test_out_of_core(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            tensor: DynamicResultTensor = DynamicResultTensor(directory)
+            tensor.set_dynamic_dimension("step", chunk_size=4)
+            tensor.add_dimension("t", [0, 1])
+            tensor.fix_dimensions()
+            for step in range(9):
+                tensor.append([step, -step])
+            loaded: DynamicResultTensor = pickle.loads(pickle.dumps(tensor))
+            assert(np.array_equal(loaded.get_results()[:, 1], -np.arange(9)))
+            loaded.append([9, -9])
+            assert(loaded.get_results().shape == (10, 2))
+            del tensor, loaded
@@ -0,0 +1,52 @@
+import unittest
+
+import numpy as np
+
+import util.new_graph.generation as generation
+from util.new_graph.generation import generate_planted_graph
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        # Use small blocks so that graphs span several blocks in each direction
+        self.block_size: int = generation.BLOCK_SIZE
+        generation.BLOCK_SIZE = 64
+        self.n: int = 200
+        self.planted_size: int = 25
+
+    def tearDown(self) -> None:
+        generation.BLOCK_SIZE = self.block_size
+
+
+    def test_symmetric_without_loops(self) -> None:
+        G, _ = generate_planted_graph(self.n, 0.5, self.planted_size, backend="csr", seed=1)
+        A: np.ndarray = G.adjacency_matrix()
+        assert(np.array_equal(A, A.T))
+        assert(not A.diagonal().any())
+
+
+    def test_planted_ind_set(self) -> None:
+        G, B = generate_planted_graph(self.n, 0.5, self.planted_size, clique=False, backend="csr")
+        assert(len(set(B)) == self.planted_size)
+        assert(G.edges(set(B)) == 0)
+
+
+    def test_planted_clique(self) -> None:
+        G, B = generate_planted_graph(self.n, 0.5, self.planted_size, clique=True, backend="bitset")
+        assert(G.density(set(B)) == 1)
+
+
+    def test_seeded_backends_agree(self) -> None:
+        """Test the same seed gives the same graph for every backend, and across calls"""
+        C, B1 = generate_planted_graph(self.n, 0.3, self.planted_size, backend="csr", seed=7)
+        B, B2 = generate_planted_graph(self.n, 0.3, self.planted_size, backend="bitset", seed=7)
+        assert(B1 == B2)
+        assert(np.array_equal(C.adjacency_matrix(), B.adjacency_matrix()))
+        other, _ = generate_planted_graph(self.n, 0.3, self.planted_size, backend="csr", seed=8)
+        assert(not np.array_equal(C.adjacency_matrix(), other.adjacency_matrix()))
+
+
+    def test_edge_probability(self) -> None:
+        G, _ = generate_planted_graph(self.n, 0.2, 0, backend="csr")
+        assert(abs(G.density(G.vertex_set()) - 0.2) < 0.02)
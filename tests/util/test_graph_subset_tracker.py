@@ -81,3 +81,38 @@ class TestCase(unittest.TestCase):
         subset.add(added)
         subset.remove(removed)
         assert(G.edges(subset) == tracker.num_edges())
+
+
+    def test_swap_and_replicate(self) -> None:
+        """Test random swaps keep membership consistent and replicas are independent"""
+        G, subset, tracker = self._generate_test_graph_and_subset()
+        other: GraphSubsetTracker = tracker.replicate()
+        for _ in range(50):
+            tracker.swap_random_nodes()
+        assert(tracker.size() == len(subset))
+        assert(tracker.subset.isdisjoint(tracker.subset_complement))
+        assert(tracker.subset.union(tracker.subset_complement) == G.vertex_set())
+        assert(all(v in tracker for v in tracker.subset))
+        assert(G.edges(tracker.subset) == tracker.num_edges())
+        assert(other.subset == subset)
+        for v in G.vertex_list():
+            assert(G.edge_boundary(v, tracker.subset) == tracker.internal_degree(v))
+            assert(G.edge_boundary(v, subset) == other.internal_degree(v))
+
+
+    def test_copy_on_write_replicate(self) -> None:
+        """Test that mutating either side of a copy-on-write replica leaves the other untouched"""
+        G, subset, tracker = self._generate_test_graph_and_subset()
+        replicas = [tracker.replicate() for _ in range(3)]
+        eager: GraphSubsetTracker = tracker.replicate(copy_on_write=False)
+        tracker.swap_random_nodes()
+        replicas[0].add_random_node()
+        for other in replicas[1:] + [eager]:
+            assert(other.subset == subset)
+            assert(G.edges(subset) == other.num_edges())
+            for v in G.vertex_list():
+                assert(G.edge_boundary(v, subset) == other.internal_degree(v))
+        assert(replicas[0].size() == len(subset) + 1)
+        for v in G.vertex_list():
+            assert(G.edge_boundary(v, tracker.subset) == tracker.internal_degree(v))
+            assert(G.edge_boundary(v, replicas[0].subset) == replicas[0].internal_degree(v))
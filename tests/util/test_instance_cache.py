@@ -0,0 +1,60 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from util.new_graph.instance_cache import GraphInstanceCache
+from util.new_graph.models.graph import generate_planted_ind_set_graph
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.directory: str = tempfile.mkdtemp()
+        self.cache: GraphInstanceCache = GraphInstanceCache(self.directory, max_bytes=10 ** 9)
+        self.n: int = 300
+        self.planted_size: int = 20
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.directory)
+
+
+    def test_cache_hit(self) -> None:
+        """Test a cached instance is identical to the generated instance and memory-mapped"""
+        for backend in ["csr", "bitset"]:
+            G1, B1 = generate_planted_ind_set_graph(self.n, 0.5, self.planted_size, backend, seed=3, cache=self.cache)
+            G2, B2 = generate_planted_ind_set_graph(self.n, 0.5, self.planted_size, backend, seed=3, cache=self.cache)
+            assert(B1 == B2)
+            assert(np.array_equal(G1.adjacency_matrix(), G2.adjacency_matrix()))
+            assert(isinstance(G2.to_arrays()["degrees"], np.memmap))
+            assert(G2.edges(set(B2)) == 0)
+
+
+    def test_keys(self) -> None:
+        """Test every generator parameter and the seed address a different instance"""
+        base: tuple = (self.n, 0.5, self.planted_size, False, "csr", 1)
+        keys: set = {GraphInstanceCache.key(*base)}
+        for i, value in enumerate([self.n + 1, 0.25, self.planted_size + 1, True, "bitset", 2]):
+            params: list = list(base)
+            params[i] = value
+            keys.add(GraphInstanceCache.key(*params))
+        assert(len(keys) == 7)
+        assert(GraphInstanceCache.key(*base[:-1], (1, 0)) != GraphInstanceCache.key(*base[:-1], (1, 1)))
+
+
+    def test_lru_eviction(self) -> None:
+        """Test the least recently used instances are evicted once the cache is too large"""
+        self.cache.get_or_generate(self.n, 0.5, self.planted_size, seed=0)
+        entry_size: int = self.cache.size()
+        self.cache.max_bytes = 2 * entry_size
+        first: str = GraphInstanceCache.key(self.n, 0.5, self.planted_size, False, "csr", 0)
+        self.cache.get_or_generate(self.n, 0.5, self.planted_size, seed=1)
+        # Touch the first instance so that the second is the least recently used
+        os.utime(f"{self.directory}/{first}", (0, 2 ** 31 - 1))
+        self.cache.get_or_generate(self.n, 0.5, self.planted_size, seed=2)
+        remaining: set = set(os.listdir(self.directory))
+        assert(first in remaining)
+        assert(GraphInstanceCache.key(self.n, 0.5, self.planted_size, False, "csr", 1) not in remaining)
+        assert(self.cache.size() <= self.cache.max_bytes)
@@ -0,0 +1,32 @@
+import unittest
+
+from util.models.planted_oracle import (CallableOracle, PlantedOracle,
+                                        as_intersection_oracle)
+
+
+class TestCase(unittest.TestCase):
+
+    def test_planted_oracle(self) -> None:
+        oracle: PlantedOracle = PlantedOracle([1, 3, 5, 7])
+        subset: set = {1, 2, 3}
+        oracle.reset(subset)
+        assert(oracle.intersection() == 2)
+        oracle.add(5)
+        oracle.add(6)
+        assert(oracle.intersection() == 3)
+        oracle.remove(1)
+        assert(oracle.intersection() == 2)
+        assert(oracle({7, 8}) == 1)
+
+
+    def test_callable_oracle(self) -> None:
+        oracle = as_intersection_oracle(lambda x: len(x.intersection({1, 3})))
+        assert(isinstance(oracle, CallableOracle))
+        subset: set = {1, 2}
+        oracle.reset(subset)
+        assert(oracle.intersection() == 1)
+        subset.add(3)
+        oracle.add(3)
+        assert(oracle.intersection() == 2)
+        planted: PlantedOracle = PlantedOracle([1])
+        assert(as_intersection_oracle(planted) is planted)
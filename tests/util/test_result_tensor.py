@@ -0,0 +1,88 @@
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+
+from util.results.result_tensor import ResultTensor
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.tensor: ResultTensor = ResultTensor()
+        self.tensor.add_dimension("n", [10, 20, 30])
+        self.tensor.add_dimension("k", [1, 2])
+        self.tensor.add_dimension("t", [0, 1, 2, 3])
+        self.tensor.fix_dimensions()
+
+
+    def test_collected_mask(self) -> None:
+        assert(not self.tensor.is_collected(n=20, k=2, t=3))
+        self.tensor.add_result(5, n=20, k=2, t=3)
+        assert(self.tensor.is_collected(n=20, k=2, t=3))
+        assert(self.tensor.collected.sum() == 1 == self.tensor.results_collected)
+        assert(self.tensor.get_results(n=20, k=2, t=3) == 5)
+
+
+    def test_collapse_to_matrix(self) -> None:
+        for i, (n, k, t) in enumerate(self.tensor.get_index_list()):
+            self.tensor.add_result(i, n=n, k=k, t=t)
+        assert(self.tensor.all_results_collected())
+        expected: np.ndarray = np.arange(24).reshape(3, 2, 4).mean(axis=2)
+        assert(np.allclose(self.tensor.collapse_to_matrix(), expected))
+
+
+    def test_add_results_bulk(self) -> None:
+        self.tensor.add_results_bulk([7, 8, 9], n=[10, 20, 30], k=2, t=1)
+        assert(self.tensor.get_results(n=20, k=2, t=1) == 8)
+        assert(self.tensor.results_collected == 3)
+        block: np.ndarray = np.arange(8).reshape(2, 4)
+        self.tensor.add_results_bulk(block, n=30, k=[1, 2], t=range(4))
+        assert(self.tensor.get_results(n=30, k=1, t=3) == 3)
+        assert(self.tensor.get_results(n=30, k=2, t=1) == 5)
+        # (30, 2, 1) was already collected, so only 7 new cells are counted
+        assert(self.tensor.results_collected == 10)
+        self.assertRaises(Exception, lambda: self.tensor.add_results_bulk([1], n=[40], k=1, t=0))
+        self.assertRaises(Exception, lambda: self.tensor.add_results_bulk([1], k=1, n=[10], t=0))
+
+
+    def test_collapse_matches_loop(self) -> None:
+        self.tensor.results[:] = np.random.default_rng(0).random(self.tensor.results.shape)
+        loop_mean = lambda X: sum(X) / X.size
+        assert(np.allclose(self.tensor.collapse_to_matrix(), self.tensor.collapse_to_matrix(loop_mean)))
+        assert(np.allclose(self.tensor.collapse_to_list(), self.tensor.collapse_to_list(lambda X: X.mean())))
+
+
+    def test_out_of_core(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            tensor: ResultTensor = ResultTensor(np.int32, f"{directory}/tensor")
+            tensor.add_dimension("step", list(range(1000)))
+            tensor.add_dimension("trial", list(range(50)))
+            tensor.fix_dimensions()
+            assert(isinstance(tensor.results, np.memmap))
+            assert(tensor.results.dtype == np.int32)
+            tensor.add_results_bulk(np.arange(1000), step=range(1000), trial=7)
+            stored: bytes = pickle.dumps(tensor)
+            # Only the path of the results is pickled, not their 1000 x 50 cells
+            assert(len(stored) < tensor.results.nbytes)
+            loaded: ResultTensor = pickle.loads(stored)
+            assert(isinstance(loaded.results, np.memmap))
+            assert(loaded.get_results(step=999, trial=7) == 999)
+            assert(loaded.is_collected(step=3, trial=7) and not loaded.is_collected(step=3, trial=8))
+            assert(loaded.results_collected == 1000)
+            del tensor, loaded
+
+
+    def test_out_of_core_directory_not_reused(self) -> None:
+        """Test a second tensor refuses the directory of a live one instead of truncating its results"""
+        with tempfile.TemporaryDirectory() as directory:
+            tensor: ResultTensor = ResultTensor(np.int32, directory)
+            tensor.add_dimension("step", list(range(5)))
+            tensor.fix_dimensions()
+            tensor.add_results_bulk(np.arange(5), step=range(5))
+            other: ResultTensor = ResultTensor(np.int32, directory)
+            other.add_dimension("step", list(range(5)))
+            self.assertRaises(Exception, other.fix_dimensions)
+            assert(np.array_equal(tensor.results, np.arange(5)))
+            del tensor
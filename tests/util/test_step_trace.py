@@ -0,0 +1,28 @@
+import unittest
+
+from util.models.step_trace import StepTrace
+
+
+class TestCase(unittest.TestCase):
+
+    def test_record_every_step(self) -> None:
+        trace: StepTrace = StepTrace(4, ["size", "intersection"])
+        for step in range(6):
+            if trace.wants(step):
+                trace.record(step, size=step + 1, intersection=step // 2)
+        # Recording past the expected number of steps grows the columns
+        assert(len(trace) == 6)
+        assert(trace.steps().tolist() == list(range(6)))
+        assert(trace.column("size").tolist() == [1, 2, 3, 4, 5, 6])
+        assert(trace.column("intersection").tolist() == [0, 0, 1, 1, 2, 2])
+
+
+    def test_sampled_steps(self) -> None:
+        trace: StepTrace = StepTrace(10, ["size"], every=4)
+        for step in range(10):
+            if trace.wants(step):
+                trace.record(step, size=step)
+        assert(trace.steps().tolist() == [0, 4, 8])
+        assert(trace.column("size").tolist() == [0, 4, 8])
+        trace.clear()
+        assert(len(trace) == 0)
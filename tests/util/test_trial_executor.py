@@ -0,0 +1,38 @@
+import random
+import unittest
+from typing import Tuple
+
+import numpy as np
+
+from util.trial_executor import run_trials, trial_rng
+
+
+def _sample(offset: int, rng: np.random.Generator) -> Tuple[float, float, float]:
+    return (random.random() + offset, float(np.random.rand()), float(rng.random()))
+
+
+class TestCase(unittest.TestCase):
+
+    def setUp(self) -> None:
+        self.trials = [((t,), (t,)) for t in range(6)]
+
+
+    def test_deterministic_across_workers(self) -> None:
+        """Test that trial results only depend on the root seed, not the number of workers"""
+        serial: dict = dict(run_trials(_sample, self.trials, workers=1, root_seed=7))
+        parallel: dict = dict(run_trials(_sample, self.trials, workers=3, root_seed=7))
+        assert(serial == parallel)
+        assert(len(set(serial.values())) == len(self.trials))
+
+
+    def test_root_seed_changes_results(self) -> None:
+        first: dict = dict(run_trials(_sample, self.trials, root_seed=1))
+        second: dict = dict(run_trials(_sample, self.trials, root_seed=2))
+        assert(first != second)
+
+
+    def test_replay_single_trial(self) -> None:
+        """Test that a trial replayed on its own sees the same generator as in the full run"""
+        results: dict = dict(run_trials(_sample, self.trials, workers=2, root_seed=3))
+        assert(dict(run_trials(_sample, self.trials[4:5], root_seed=3)) == {(4,): results[(4,)]})
+        assert(results[(4,)][2] == trial_rng(3, (4,)).random())
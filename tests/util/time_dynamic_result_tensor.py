@@ -0,0 +1,61 @@
+import multiprocessing
+import resource
+import time
+from typing import List
+
+import numpy as np
+
+from util.results.dynamic_result_tensor import DynamicResultTensor
+
+"""
+Times appending entries to the dynamic dimension of a DynamicResultTensor with chunked growth,
+against the previous growth which doubled the capacity with `np.pad` (copying every result so
+far), reporting the append throughput and the peak RSS of each. Every run is in a fresh process
+so that peak RSS is not shared between them.
+Run from the repository root with `python -m tests.util.time_dynamic_result_tensor`
+"""
+
+NUM_ENTRIES = [10 ** 4, 10 ** 5, 4 * 10 ** 5]
+# The number of cells in the fixed dimensions of every entry, e.g. the trials of a step
+FIXED_SIZE = 100
+INITIAL_CAPACITY = 64
+
+
+def append_padded(num_entries: int, row: np.ndarray):
+    """The previous growth, where a full tensor is padded to the next power of 2"""
+    results: np.ndarray = np.zeros([INITIAL_CAPACITY, FIXED_SIZE])
+    for i in range(num_entries):
+        if i >= results.shape[0]:
+            results = np.pad(results, [(0, results.shape[0])] + [(0, 0)], "constant", constant_values=(0))
+        results[i] = row
+
+
+def append_chunked(num_entries: int, row: np.ndarray):
+    tensor: DynamicResultTensor = DynamicResultTensor()
+    tensor.set_dynamic_dimension("step", chunk_size=INITIAL_CAPACITY)
+    tensor.add_dimension("t", list(range(FIXED_SIZE)))
+    tensor.fix_dimensions()
+    for _ in range(num_entries):
+        tensor.append(row)
+
+
+def run(method: str, num_entries: int, output: multiprocessing.Queue):
+    row: np.ndarray = np.arange(FIXED_SIZE, dtype=np.float64)
+    baseline: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.time()
+    append_padded(num_entries, row) if method == "pad" else append_chunked(num_entries, row)
+    elapsed: float = time.time() - start
+    # ru_maxrss is in KiB on linux
+    output.put((elapsed, (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - baseline) / 1024))
+
+
+if __name__ == "__main__":
+    context = multiprocessing.get_context("spawn")
+    for num_entries in NUM_ENTRIES:
+        for method in ["pad", "chunked"]:
+            output: multiprocessing.Queue = context.Queue()
+            process = context.Process(target=run, args=(method, num_entries, output))
+            process.start()
+            elapsed, peak = output.get()
+            process.join()
+            print(f"entries={num_entries}\t{method}\t{num_entries / elapsed:,.0f} appends/s\tpeak RSS +{peak:.1f} MiB")
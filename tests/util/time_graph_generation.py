@@ -0,0 +1,26 @@
+import time
+
+from util.new_graph.generation import generate_planted_graph
+from util.new_graph.models.graph import add_planted_set, generate_erdos_renyi_graph
+
+"""
+Times graph generation for the networkx path (erdos-renyi then copy to plant) against the
+vectorized generator for each array-backed backend.
+Run from the repository root with `python -m tests.util.time_graph_generation`
+"""
+
+N_VALUES = [1000, 5000, 20000]
+# The networkx path is quadratic in python, so only time it for the smaller graphs
+MAX_NETWORKX_N = 5000
+EDGE_PROBABILITY = 0.5
+
+for n in N_VALUES:
+    planted_size = int(n ** 0.5)
+    if n <= MAX_NETWORKX_N:
+        start = time.time()
+        add_planted_set(generate_erdos_renyi_graph(n, EDGE_PROBABILITY), planted_size, clique=False)
+        print(f"n={n}\tnetworkx\t{time.time() - start:.2f}s")
+    for backend in ["csr", "bitset"]:
+        start = time.time()
+        generate_planted_graph(n, EDGE_PROBABILITY, planted_size, backend=backend)
+        print(f"n={n}\t{backend}\t\t{time.time() - start:.2f}s")
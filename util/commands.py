@@ -1,4 +1,3 @@
-import os
 import sys
 from typing import Callable
 
@@ -6,7 +5,7 @@ import click
 
 from util.config import get_experiment_results_directory
 from util.models.result import Result
-from util.storage import load
+from util.storage import load_results_from_path, results_exist
 
 """
     Verifies the provided pickle name, getting input from user if it is invalid
@@ -21,7 +20,7 @@ def verify_pickle_name(today: str, gen_default_file_name: Callable, project_name
     else:
         pickle_name = f"{directory}/{gen_default_file_name()}"
     #? Verifies valid file on the os and returns 
-    if not os.path.isfile(f"{pickle_name}.pkl"):
+    if not results_exist(pickle_name):
         click.secho(f"The file provided could not be found.", err=True)
         sys.exit(0)
     return pickle_name
@@ -40,7 +39,7 @@ def verify_and_load_results(
 ):
     #? Verifies path and loads results
     pickle_path = verify_pickle_name(today, gen_default_file_name, project_name)
-    results: results_class = load(pickle_path)
+    results: results_class = load_results_from_path(pickle_path)
     #? Verifies results loaded correctly and returns
     if results is None:
         click.secho("Could not load results. Exiting.", err=True)
@@ -57,7 +56,8 @@ def verify_and_load_results_v2(
     today: str,
 ):
     pickle_path = verify_pickle_name(today, results_class.generate_file_name, project_name)
-    results: results_class = load(pickle_path)
+    # Fields are loaded lazily, so plots only read the arrays they touch
+    results: results_class = load_results_from_path(pickle_path)
     if results is None:
         click.secho("Could not load results. Exiting.", err=True)
         sys.exit(0)
@@ -19,3 +19,19 @@ def get_experiment_results_directory(project_name: str) -> str:
     if not os.path.isdir(path):
         raise Exception(f"The experiment results directory could not be found at {path}.")
     return path
+
+def get_instance_cache_directory(project_name: str) -> str:
+    """ Returns the directory in which generated graph instances should be cached, creating it if needed """
+    path: str = load_project_config(project_name)["instance_cache_directory"]
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def get_instance_cache_max_bytes(project_name: str) -> int:
+    """ Returns the maximum size of the graph instance cache in bytes """
+    return int(load_project_config(project_name)["instance_cache_max_gb"] * (1024 ** 3))
+
+def get_table_cache_directory(project_name: str) -> str:
+    """ Returns the directory in which precomputed combinatorics tables should be cached, creating it if needed """
+    path: str = load_project_config(project_name)["table_cache_directory"]
+    os.makedirs(path, exist_ok=True)
+    return path
@@ -1,18 +1,27 @@
 import copy
-import gc
 import itertools
 import math
+import os
 import random
+import re
+import shutil
+import tempfile
 import time
 
-from mpmath import mp
-
-mp.dps = 10
-
-from typing import Dict, List, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 import networkx as nx
 import numpy as np
+from scipy import sparse, special
+from scipy.sparse import csgraph
+
+from util.config import get_table_cache_directory
+from util.misc import get_rng
+from util.new_graph.models.bitset_graph import BitsetGraph
+from util.new_graph.models.csr_graph import CSRGraph
+
+# The representations PerfectGraphGenerator.generate_random_split_graph can return
+SPLIT_GRAPH_BACKENDS: List[str] = ["networkx", "dense", "csr", "bitset"]
 
 
 # Returns a list of nodes in a random 'headstart' set of size l with k nodes inside the independence set
@@ -67,124 +76,161 @@ def count_edge_boundary(G: nx.Graph, v: int, subset: set) -> int:
     return len(set(G.neighbors(v)).intersection(subset))
 
 
+def adjacency_to_networkx(A: np.ndarray, nodes: np.ndarray) -> nx.Graph:
+    """Builds the networkx graph of the dense adjacency matrix `A` in one bulk call, adding its vertices in the order of `nodes`"""
+    G: nx.Graph = nx.Graph()
+    G.add_nodes_from(np.asarray(nodes).tolist())
+    u, v = np.nonzero(np.triu(A, 1))
+    G.add_edges_from(zip(u.tolist(), v.tolist()))
+    return G
+
+
 def binomial_coefficient(n: int, k: int) -> int:
     raise AttributeError("This function is no longer supported")
 
 
-def bell_table(n: int) -> list:
-    if (n > 3015):
-        raise ArithmeticError(f'{n} is larger than what bell table currently supports')
-
-    bell: List[int] = []
-    bell_file = open('./graph_coloring/preprocessing_directory/bell_numbers_upto3015.txt', 'r')
-    for line in bell_file:
-        bell.append(int(line.split()[1]))
-    # print('Generated bell table thank god.')
-    return bell
-
-    bell: list = [[0 for i in range(n + 1)] for j in range(n + 1)]
-    bell[0][0] = 1
-    for i in range(1, n + 1):
-
-        # Explicitly fill for j = 0
-        bell[i][0] = bell[i - 1][i - 1]
-
-        # Fill for remaining values of j
-        for j in range(1, i + 1):
-            bell[i][j] = bell[i - 1][j - 1] + bell[i][j - 1]
-    return bell
-
-
-def binom_table(n: int) -> List[List[int]]:
-    # r = [[special.comb(j, i) for i in range(n + 1)] for j in range(n + 1)]
-    # good_r = [[mp.mpmathify(special.binom(j, i)) for i in range(n + 1)] for j in range(n + 1)]
-    # lets try using stirlings formula
-    good_r = []
-    for j in range(n + 1):
-        to_add: list = []
-        if j == 0:
-            to_add = [0] * (n + 1)
-            good_r.append(to_add)
-            continue
-        for i in range(n + 1):
-            if i == 0 or i == j:
-                to_add.append(1)
-                continue
-            if i > j:
-                to_add.append(0)
-                continue
-            to_add.append(
-                mp.fmul(
-                    to_add[-1],
-                    mp.fdiv(
-                        mp.fadd(
-                            mp.fsub(j, i),
-                            1
-                        ), i
-                    )
-                )
-            )
-            # to_add.append(mp.power(mp.fdiv(mp.fmul(j, math.e), i), i))
-        good_r.append(to_add)
-    # good_r = [[mp.fdiv(mp.power(mp.fmul(j, math.e), i), i) for i in range(n + 1)] for j in range(n + 1)]
-    # assert r == float('inf') or r == good_r
-    # print('Generated binom table thank god')
-    return good_r
+def log_factorial_table(n: int) -> np.ndarray:
+    """Returns log(i!) for i = 0..n as float64"""
+    return special.gammaln(np.arange(n + 1) + 1)
 
 
-class PerfectGraphGenerator:
+def log_bell_table(n: int) -> np.ndarray:
+    """
+    Returns log(B_i) for the Bell numbers B_0..B_n as float64, from the recurrence
+    B_{i+1} = sum_k C(i, k) B_k summed in log space. Takes O(n^2) time and O(n) memory.
+    """
+    log_factorial: np.ndarray = log_factorial_table(n)
+    log_bell: np.ndarray = np.zeros(n + 1)
+    for i in range(n):
+        k: np.ndarray = np.arange(i + 1)
+        log_bell[i + 1] = special.logsumexp(log_factorial[i] - log_factorial[k] - log_factorial[i - k] + log_bell[:i + 1])
+    return log_bell
 
-    def __init__(self, n: int):
-        self.n = n
 
-        # TODO:
-        start_time = time.time()
-        self.bell = bell_table(self.n)
-        self.binom = binom_table(self.n)
-        # problem_area: tuple = (self.binomial_coefficient(n, 192), self.bell_number(n - 192), mp.power(2, 192 * (n - 192)))
+class PerfectGraphTableCache:
+    """
+    On-disk store of the log-space tables of PerfectGraphGenerator, as .npy files which are
+    memory-mapped on load. Entry i of every table only depends on i, so a single table set for the
+    largest n computed so far serves every smaller n as a prefix, and is replaced whenever a larger
+    n is requested.
+    """
+
+    # Bumped whenever the tables change, invalidating stored ones
+    VERSION: int = 1
+    TABLE_NAMES: List[str] = ["log_factorial", "log_bell"]
+
+    def __init__(self, directory: str):
+        self.directory: str = directory
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get_or_compute(self, n: int) -> Dict[str, np.ndarray]:
+        """Returns the tables for 0..n, loading them from the cache when a large enough set is stored"""
+        stored_n: Optional[int] = self.__largest_stored_n()
+        if stored_n is not None and stored_n >= n:
+            path: str = self.__entry_path(stored_n)
+            return {name: np.load(f"{path}/{name}.npy", mmap_mode="r")[:n + 1] for name in self.TABLE_NAMES}
+        tables: Dict[str, np.ndarray] = {"log_factorial": log_factorial_table(n), "log_bell": log_bell_table(n)}
+        self.put(n, tables)
+        return tables
+
+    def put(self, n: int, tables: Dict[str, np.ndarray]):
+        """Stores the tables for 0..n, then removes every table set it supersedes"""
+        # Write into a temporary directory and rename it into place, so that concurrent writers
+        # and interrupted runs never leave a partially written table set behind.
+        tmp_path: str = tempfile.mkdtemp(dir=self.directory, prefix=".tmp-")
+        for name in self.TABLE_NAMES:
+            np.save(f"{tmp_path}/{name}.npy", tables[name])
+        try:
+            os.rename(tmp_path, self.__entry_path(n))
+        except OSError:
+            # Another process stored the same table set first
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        for entry in os.listdir(self.directory):
+            if not entry.startswith(".") and self.__entry_n(entry) != n:
+                shutil.rmtree(f"{self.directory}/{entry}", ignore_errors=True)
+
+    def __entry_path(self, n: int) -> str:
+        return f"{self.directory}/v{self.VERSION}-n{n}"
+
+    def __entry_n(self, entry: str) -> Optional[int]:
+        """Returns the n of a stored table set of the current version, or None for any other entry"""
+        match = re.fullmatch(rf"v{self.VERSION}-n(\d+)", entry)
+        return int(match.group(1)) if match else None
+
+    def __largest_stored_n(self) -> Optional[int]:
+        stored: List[int] = [n for n in map(self.__entry_n, os.listdir(self.directory)) if n is not None]
+        return max(stored) if stored else None
+
+
+def load_table_cache(project_name: str) -> PerfectGraphTableCache:
+    """Returns the PerfectGraphGenerator table cache configured for the provided project"""
+    return PerfectGraphTableCache(get_table_cache_directory(project_name))
 
-        self.A = []
 
-        # Fill the A matrix (should take n^2 time I think)
-        self.A.append(1)
-        for i in range(1, n + 1):
-            tosum: list = [mp.fmul(self.binomial_coefficient(i - 1, m), self.A[m]) for m in range(len(self.A))]
+class PerfectGraphGenerator:
+    """
+    Generates random perfect (split and unipolar) graphs on up to `n` vertices. A single generator
+    serves every order up to `n`, and passing a `cache` loads its tables from disk rather than
+    computing them.
+    """
+
+    def __init__(self, n: int, cache: PerfectGraphTableCache = None):
+        self.n = n
 
-            self.A.append(mp.fsum(tosum))
+        # NOTE: The tables hold the natural log of their values as float64, as the values themselves
+        # overflow doubles past n ~ 200 (e.g. B_3000 ~ 10^6500), and sampling only needs their ratios.
+        start_time = time.time()
+        if cache is None:
+            self.log_factorial: np.ndarray = log_factorial_table(self.n)
+            self.log_bell: np.ndarray = log_bell_table(self.n)
+        else:
+            tables: Dict[str, np.ndarray] = cache.get_or_compute(self.n)
+            self.log_factorial: np.ndarray = tables["log_factorial"]
+            self.log_bell: np.ndarray = tables["log_bell"]
+        # A_i = sum_{m < i} C(i - 1, m) A_m with A_0 = 1 is the Bell recurrence, so A is the Bell table
+        self.log_A: np.ndarray = self.log_bell
+        # The cumulative distributions sampled from, built on first use and reused by every later
+        # graph, as they only depend on m (resp. n) rather than on the graph being generated
+        self.__partition_cdfs: Dict[int, np.ndarray] = {}
+        self.__central_clique_cdfs: Dict[int, np.ndarray] = {}
 
         print(f'finished making tables after {time.time() - start_time} seconds')
-        assert mp.fsum(self.A) < mp.inf
 
     def bell_number(self, n: int) -> int:
+        """
+        Returns B_n rounded from its log, which is exact while it fits a double's mantissa (n <= 20).
+        Use `log_bell` beyond that.
+        """
         if n < 0:
             raise IndexError("Bell number is not defined for negatives")
         elif n > self.n:
             raise IndexError("Bell number is beyond what we have initialized")
-        return self.bell[n]
-
-    # TODO: duplicate, remove?
-    def bell_table(n: int) -> list:
-
-        bell: list = [[0 for i in range(n + 1)] for j in range(n + 1)]
-        bell[0][0] = 1
-        for i in range(1, n + 1):
-
-            # Explicitly fill for j = 0
-            bell[i][0] = bell[i - 1][i - 1]
-
-            # Fill for remaining values of j
-            for j in range(1, i + 1):
-                bell[i][j] = bell[i - 1][j - 1] + bell[i][j - 1]
-        return bell
+        return round(math.exp(self.log_bell[n]))
 
     def get_partition_prob(self, n: int, m: int) -> np.array:
-
-        r: np.array = np.array(
-            [float(mp.fmul(self.binomial_coefficient(m - 1, k), mp.fdiv(self.A[k], self.A[m]))) for k in range(m)])
-        # r: np.array = np.array([self.binomial_coefficient(m - 1, k) * (self.A[k] / self.A[m]) for k in range(m)])
+        # P(k) = C(m - 1, k) A_k / A_m, normalized from log space against its largest term
+        k: np.ndarray = np.arange(m)
+        log_r: np.ndarray = self.log_binomial_coefficient(m - 1, k) + self.log_A[k] - self.log_A[m]
+        r: np.array = np.exp(log_r - log_r.max())
         r /= r.sum()
         return r
 
+    def __sample(self, cdfs: Dict[int, np.ndarray], key: int, get_prob: Callable[[], np.array]) -> int:
+        """
+        Samples from the distribution cached in `cdfs` under `key`, building it from `get_prob` on
+        first use. Draws the same value as np.random.choice(p=get_prob()) from the same state.
+        """
+        cdf: np.ndarray = cdfs.get(key)
+        if cdf is None:
+            cdf = get_prob().cumsum()
+            cdf /= cdf[-1]
+            cdfs[key] = cdf
+        return int(cdf.searchsorted(np.random.random_sample(), side="right"))
+
+    def sample_partition_size(self, m: int) -> int:
+        """Samples the k of `get_partition_prob` for m remaining vertices"""
+        return self.__sample(self.__partition_cdfs, m, lambda: self.get_partition_prob(self.n, m))
+
     def generate_random_partition(self, U: [int]) -> List[Set[int]]:
         n = len(U)
 
@@ -193,7 +239,7 @@ class PerfectGraphGenerator:
         P: list = []
         while m != 0:
             # Pick a k for this partition
-            k: int = np.random.choice(a=range(m), p=self.get_partition_prob(n, m))
+            k: int = self.sample_partition_size(m)
 
             # Sample the partition from what we have left
             l: int = U.pop(np.argmax(U))
@@ -211,19 +257,16 @@ class PerfectGraphGenerator:
         return P
 
     # From https://www2.math.upenn.edu/~wilf/website/Method%20and%20two%20algorithms.pdf
-    def get_central_clique_size(self, n: int) -> int:
-        l: list = [
-            mp.fmul(
-                self.binomial_coefficient(n, k), mp.fmul(
-                    self.bell_number(n - k), mp.power(2, (k * (n - k)))
-                )
-            ) for k in range(n + 1)]
-
-        L: mp.mpf = mp.fsum(l)
-        probabilities: np.array = np.array([float(mp.fdiv(x, L)) for x in l])
+    def get_central_clique_prob(self, n: int) -> np.array:
+        # P(k) is proportional to C(n, k) B_{n - k} 2^{k (n - k)}, normalized in log space
+        k: np.ndarray = np.arange(n + 1)
+        log_l: np.ndarray = self.log_binomial_coefficient(n, k) + self.log_bell[n - k] + k * (n - k) * math.log(2)
+        probabilities: np.array = np.exp(log_l - special.logsumexp(log_l))
         probabilities /= probabilities.sum()
-        k: int = np.random.choice(a=range(n + 1), p=probabilities)
-        return int(k)
+        return probabilities
+
+    def get_central_clique_size(self, n: int) -> int:
+        return self.__sample(self.__central_clique_cdfs, n, lambda: self.get_central_clique_prob(n))
 
     def generate_random_unipolar_partition(self, n: int) -> List[Set[int]]:
         k: int = self.get_central_clique_size(n)
@@ -234,150 +277,232 @@ class PerfectGraphGenerator:
             p: float = .5,
             co_split: bool = False,
             preset_center_set: int = -1,
-            present_side_parts: int = -1) -> [nx.Graph, int]:
+            present_side_parts: int = -1,
+            n: int = None,
+            backend: str = "networkx") -> [nx.Graph, int]:
         """
         :param: preset_colors: int, maybe we want to plant a coloring
+        :param: n: int, the order of the graph, at most (and by default) the n of the generator
+        :param: backend: str, one of SPLIT_GRAPH_BACKENDS. "dense" returns the boolean adjacency matrix
         :return: [nx.Graph, int], generates random perfect graph with a cheat
         """
+        if backend not in SPLIT_GRAPH_BACKENDS:
+            raise Exception(f"Cannot generate a split graph with the {backend} backend. Expected one of {SPLIT_GRAPH_BACKENDS}.")
+        n = self.n if n is None else n
+        if n > self.n:
+            raise IndexError(f"Cannot generate a graph of order {n} from tables initialized up to {self.n}")
 
         # Normal case
         if preset_center_set == -1 and present_side_parts == -1:
-            partition: List[Set[int]] = self.generate_random_unipolar_partition(self.n)
+            partition: List[Set[int]] = self.generate_random_unipolar_partition(n)
 
 
         elif preset_center_set != -1 and present_side_parts != -1:
             central_set_size = preset_center_set
             partition: List[Set[int]] = random_k_partition(
-                set(range(central_set_size, self.n)),
+                set(range(central_set_size, n)),
                 present_side_parts
             )
             # Add the central clique to the beginning
             partition.insert(0, set(range(central_set_size)))
         elif preset_center_set == -1:
             central_set_size = preset_center_set
-            partition: List[Set[int]] = self.generate_random_partition(list(range(central_set_size, self.n)))
+            partition: List[Set[int]] = self.generate_random_partition(list(range(central_set_size, n)))
             # Add the central clique to the beginning
             partition.insert(0, set(range(central_set_size)))
         else:
-            central_set_size: int = self.get_central_clique_size(self.n)
+            central_set_size: int = self.get_central_clique_size(n)
             partition: List[Set[int]] = random_k_partition(
-                set(range(central_set_size, self.n)),
+                set(range(central_set_size, n)),
                 present_side_parts
             )
             # Add the central clique to the beginning
             partition.insert(0, set(range(central_set_size)))
 
-        S = set()
-        for par in partition:
-            for el in par:
-                S.add(el)
-        assert len(S) == self.n
-
-        # print(partition)
-        G: nx.Graph = nx.Graph()
+        #? Label every vertex with the index of its part, with the vertices in the order the parts list them
+        parts: List[np.ndarray] = [np.fromiter(par, dtype=np.int64, count=len(par)) for par in partition]
+        nodes: np.ndarray = np.concatenate(parts)
+        assert len(np.unique(nodes)) == n
+        label: np.ndarray = np.empty(n, dtype=np.int64)
+        label[nodes] = np.repeat(np.arange(len(parts)), [len(par) for par in parts])
 
         # Either the chromatic number is the number of cliques + 1 or + 0, or it is just the number of independent sets
         # cheat = len(partition) if co_split else max([len(par) for par in partition])
 
         # Make sure all parts are themselves cliques
-        for par in partition:
-            par = list(par)
-            for i in range(len(par)):
-                G.add_node(par[i])
-                for j in range(i + 1, len(par)):
-                    G.add_edge(par[i], par[j])
-
-        assert len(G) == self.n
-
-        # Add the edges from the central clique
-        center: list = partition[0]
-        for v in center:
-            for par in partition[1:]:
-                for u in par:
-                    if np.random.binomial(1, p):
-                        G.add_edge(u, v)
-
-        G_comp = nx.complement(G)
-        # Get size of the max clique of the graph. True method this time.
-        max_clique: Set[int] = find_max_stable_set_in_unipolar_graph(G, G_comp, partition) if co_split else (
-            find_max_clique_in_unipolar_graph(G, G_comp, partition)
-        )
-
-        # for i in max_clique:
-        #     for j in max_clique:
-        #         if i == j: continue
-        #         assert (j not in shc[i] if co_split else j in shc[i])
+        A: np.ndarray = label[:, None] == label[None, :]
+        np.fill_diagonal(A, False)
 
-        # assert len(nx.maximal_independent_set(shc, max_clique)) == len(max_clique)
+        # Add the edges from the central clique, drawing the whole center x side block at once. The
+        # draws are in the order the previous per-pair loop made them, so a seed gives the same graph
+        center: np.ndarray = parts[0]
+        side: np.ndarray = nodes[len(center):]
+        block: np.ndarray = np.random.binomial(1, p, size=(len(center), len(side))).astype(bool)
+        A[np.ix_(center, side)] = block
+        A[np.ix_(side, center)] = block.T
 
-        G = G_comp if co_split else G
+        # Get size of the max clique of the graph. True method this time.
+        max_clique: Set[int] = find_max_stable_set_in_unipolar_graph(A, partition) if co_split else (
+            find_max_clique_in_unipolar_graph(A, partition)
+        )
 
-        # assert len(nx.maximal_independent_set(nx.complement(shc), max_clique)) == len(max_clique)
+        if co_split:
+            A = ~A
+            np.fill_diagonal(A, False)
 
         cheat = len(max_clique)
 
-        # Permute graph
-        nodes: list = list(G.nodes)
-        permutation = np.random.permutation(nodes)
+        # Permute graph, where vertex nodes[i] becomes permutation[i]
+        permutation: np.ndarray = np.random.permutation(nodes)
+        original: np.ndarray = np.empty(n, dtype=np.int64)
+        original[permutation] = nodes
+        A = A[np.ix_(original, original)]
         # Return permutted graph
-        return nx.relabel_nodes(G, dict(zip(nodes, permutation)), copy=True), cheat
+        if backend == "networkx":
+            return adjacency_to_networkx(A, permutation), cheat
+        if backend == "dense":
+            return A, cheat
+        u, v = np.nonzero(np.triu(A, 1))
+        if backend == "csr":
+            return CSRGraph.from_edge_arrays(n, u, v), cheat
+        return BitsetGraph.from_dense(A), cheat
+
+    def log_binomial_coefficient(self, n: int, k: np.ndarray) -> np.ndarray:
+        """Returns log C(n, k) for every entry of `k`, which is -inf where k is outside of 0..n"""
+        k = np.asarray(k)
+        in_range: np.ndarray = (0 <= k) & (k <= n)
+        clipped: np.ndarray = np.clip(k, 0, n)
+        log_binom: np.ndarray = self.log_factorial[n] - self.log_factorial[clipped] - self.log_factorial[n - clipped]
+        return np.where(in_range, log_binom, -np.inf)
 
     def binomial_coefficient(self, n: int, k: int) -> int:
-        return self.binom[n][k]
-
-
-def find_max_stable_set_in_unipolar_graph(G: nx.Graph, G_comp: nx.Graph, partition: List[Set[int]]) -> Set[int]:
-    # Go through each vertex...
-    for x in partition[0]:
-        side_non_neighbors: Set[int] = set(G_comp[x])
-        side_covered: Dict[int, int] = {}
-        # ...and take a look at their side neighborhoods...
-        for y in side_non_neighbors:
-            # ...to see if we cover all the partition with independent vertices
-            if y in G[x]:
-                continue
-            for i in range(1, len(partition)):
-                if y in partition[i]:
-                    side_covered[i] = y
-                    break
-        # If we added a num_parts entries to the dictionary, then we made an independent set!
-        if len(side_covered.keys()) == len(partition) - 1:
-            return set(side_covered.values()).union([x])
+        """Returns C(n, k) rounded from its log, which is exact while it fits a double's mantissa"""
+        return round(math.exp(self.log_binomial_coefficient(n, k)))
 
-    return set([next(iter(part)) for part in partition[1:]])
+
+def max_bipartite_independent_set(B: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Returns a maximum independent set of the bipartite graph with biadjacency matrix `B`, as masks
+    over its rows and its columns. By Konig's theorem it is the complement of the minimum vertex
+    cover found from a maximum matching: the rows reachable from unmatched rows by alternating
+    paths, and the columns which are not.
+    """
+    if B.size == 0:
+        return np.ones(B.shape[0], dtype=bool), np.ones(B.shape[1], dtype=bool)
+    row_match: np.ndarray = csgraph.maximum_bipartite_matching(sparse.csr_matrix(B), perm_type="column")
+    col_match: np.ndarray = np.full(B.shape[1], -1)
+    col_match[row_match[row_match >= 0]] = np.flatnonzero(row_match >= 0)
+
+    # Rows reach every adjacent column, and columns reach only their matched row. Every reached
+    # column is matched, otherwise the matching would have an augmenting path
+    rows_reached: np.ndarray = row_match == -1
+    cols_reached: np.ndarray = np.zeros(B.shape[1], dtype=bool)
+    frontier: np.ndarray = rows_reached
+    while frontier.any():
+        new_cols: np.ndarray = B[frontier].any(axis=0) & ~cols_reached
+        cols_reached |= new_cols
+        frontier = np.zeros(B.shape[0], dtype=bool)
+        frontier[col_match[new_cols]] = True
+        frontier &= ~rows_reached
+        rows_reached |= frontier
+
+    return rows_reached, ~cols_reached
+
+
+def find_max_stable_set_in_unipolar_graph(A: np.ndarray, partition: List[Set[int]]) -> Set[int]:
+    """
+    :param A: np.ndarray, the adjacency matrix of a unipolar graph
+    :param partition: List[Set[int]], its central clique followed by its side cliques
+    :return: Set[int], a maximum stable set of the graph
+    """
+    center: np.ndarray = np.fromiter(partition[0], dtype=np.int64, count=len(partition[0]))
+    side_parts: List[np.ndarray] = [np.fromiter(par, dtype=np.int64, count=len(par)) for par in partition[1:]]
+    # A center vertex makes an independent set with one vertex of every side part iff it has a non-neighbor in each
+    non_adjacent: List[np.ndarray] = [~A[np.ix_(center, par)] for par in side_parts]
+    covers_all: np.ndarray = np.ones(len(center), dtype=bool)
+    for non_adjacent_part in non_adjacent:
+        covers_all &= non_adjacent_part.any(axis=1)
+
+    if covers_all.any():
+        x: int = int(np.argmax(covers_all))
+        return {int(center[x])}.union(int(par[np.argmax(non_adjacent_part[x])]) for par, non_adjacent_part in zip(side_parts, non_adjacent))
+
+    return set([int(par[0]) for par in side_parts])
 
 
-def find_max_clique_in_unipolar_graph(G: nx.Graph, G_comp: nx.Graph, partition: List[Set[int]]) -> Set[int]:
-    # We find minimum vertex covers in shc to get max independent set in G_comp, which gives max clique in shc
+def find_max_clique_in_unipolar_graph(A: np.ndarray, partition: List[Set[int]]) -> Set[int]:
+    """
+    :param A: np.ndarray, the adjacency matrix of a unipolar graph
+    :param partition: List[Set[int]], its central clique followed by its side cliques
+    :return: Set[int], a maximum clique of the graph
+    """
+    # A clique within the center and a side part is an independent set of their bipartite non-edges
+    center: np.ndarray = np.fromiter(partition[0], dtype=np.int64, count=len(partition[0]))
     best_max_clique: set = set()
-    for i in range(1, len(partition)):
-        bipartite_sub = nx.subgraph(G_comp, partition[0].union(partition[i]))
-        gc.collect()
-        matching = nx.algorithms.bipartite.maximum_matching(bipartite_sub, partition[0])
-
-        max_clique: set = set(bipartite_sub.nodes).difference(nx.algorithms.bipartite.to_vertex_cover(
-            bipartite_sub,
-            matching,
-            partition[0]
-        ))
+    for par in partition[1:]:
+        par: np.ndarray = np.fromiter(par, dtype=np.int64, count=len(par))
+        in_center, in_part = max_bipartite_independent_set(~A[np.ix_(center, par)])
+        max_clique: set = set(center[in_center].tolist()).union(par[in_part].tolist())
         if len(best_max_clique) < len(max_clique):
             best_max_clique = max_clique
 
     return best_max_clique
 
 
-def random_k_partition(S: set, num_colors: int) -> List[Set[int]]:
+class LogStirlingTable:
+    """
+    The logs of the Stirling numbers of the second kind, log S(i, j), with -inf where S(i, j) = 0.
+    The table grows to the largest n and k requested so far and is never rebuilt, so one module
+    level table (see `get_log_stirling_table`) is shared by every partition of every restart.
+    """
+
+    def __init__(self):
+        self.table: np.ndarray = np.zeros((1, 1))
+
+    def get(self, n: int, k: int) -> np.ndarray:
+        """Returns the table, covering at least log S(i, j) for i <= n and j <= k"""
+        rows, cols = self.table.shape
+        if n >= rows or k >= cols:
+            self.__grow(max(n + 1, rows), max(k + 1, cols))
+        return self.table
+
+    def __grow(self, rows: int, cols: int):
+        old_rows, old_cols = self.table.shape
+        table: np.ndarray = np.full((rows, cols), -np.inf)
+        table[:old_rows, :old_cols] = self.table
+        log_j: np.ndarray = np.log(np.arange(1, cols))
+        # S(i, j) = j S(i - 1, j) + S(i - 1, j - 1), filling only the new columns of the old rows
+        for i in range(1, rows):
+            start: int = old_cols if i < old_rows else 1
+            table[i, start:] = np.logaddexp(log_j[start - 1:] + table[i - 1, start:], table[i - 1, start - 1:-1])
+        self.table = table
+
+
+_log_stirling_table: LogStirlingTable = LogStirlingTable()
+
+
+def get_log_stirling_table(n: int, k: int) -> np.ndarray:
+    """Returns the shared table of log S(i, j), covering at least i <= n and j <= k"""
+    return _log_stirling_table.get(n, k)
+
+
+def singleton_probability(log_stirling: np.ndarray, m: int, parts: int) -> float:
+    """
+    The probability the partitions below put a vertex in its own part with `m` vertices left over,
+    S(m, parts - 1) / S(m, parts), which is clamped to 1 (and is 1 where S(m, parts) = 0)
+    """
+    if log_stirling[m, parts] == -np.inf:
+        return 1.
+    return min(1., math.exp(log_stirling[m, parts - 1] - log_stirling[m, parts]))
+
+
+def random_k_partition(S: set, num_colors: int, rng: np.random.Generator = None) -> List[Set[int]]:
     if num_colors < 1:
         raise AttributeError('Man, it is not possible to make <1 sets of |S| elements')
     if num_colors > len(S):
         raise AttributeError(f"Man, you can't make {num_colors} non-empty parts of {len(S)} elements!")
-    n: int = len(S)
-    stirling: np.array = np.zeros((n + 1, n + 1))
-    stirling[0, 0] = 1
-
-    for i in range(len(stirling) - 1):
-        for j in range(1, len(stirling[i])):
-            stirling[i + 1, j] = j * stirling[i, j] + stirling[i, j - 1]
+    rng = get_rng(rng)
+    log_stirling: np.ndarray = get_log_stirling_table(len(S), num_colors)
 
     # Initialize data tables
     parts: int = num_colors
@@ -385,19 +510,13 @@ def random_k_partition(S: set, num_colors: int) -> List[Set[int]]:
 
     partition: List[Set[int]] = []
     while len(S) != 0 and parts != 1:
-        v: int = random.choice(list(S))
+        candidates: list = list(S)
+        v: int = candidates[rng.integers(len(candidates))]
         S.discard(v)
 
         # Either we assign v to its own partition
-        # Put v in its own partition with P[Event] = binom_prob
-        binom_prob: float = stirling[len(S), parts - 1] / stirling[len(S)][parts] if stirling[len(S), parts] != 0 else 1
-        if np.random.binomial(1, p=(binom_prob if (
-                binom_prob != None and
-                binom_prob != float('NaN') and
-                0 <= binom_prob <= 1
-        ) else (
-                1 if binom_prob >= 1 else 0
-        ))):
+        # Put v in its own partition with P[Event] = S(|S|, parts - 1) / S(|S|, parts)
+        if rng.binomial(1, p=singleton_probability(log_stirling, len(S), parts)):
             partition.append({v})
             parts -= 1
         else:
@@ -411,7 +530,7 @@ def random_k_partition(S: set, num_colors: int) -> List[Set[int]]:
     assert len(S) == 0 and parts == 0
 
     for v, starting in waiting:
-        partition[random.randrange(starting, len(partition))].add(v)
+        partition[rng.integers(starting, len(partition))].add(v)
 
     return partition
 
@@ -423,13 +542,7 @@ def recursive_random_partition(S: set, num_colors: int) -> List[Set[int]]:
     :return: dict[int, int], color_to_nodes coloring/partitoning
     """
     # Initialize stirling table
-    n: int = len(S)
-    stirling: np.array = np.zeros((n + 1, n + 1))
-    stirling[0, 0] = 1
-
-    for i in range(len(stirling) - 1):
-        for j in range(1, len(stirling[i])):
-            stirling[i + 1, j] = j * stirling[i, j] + stirling[i, j - 1]
+    log_stirling: np.ndarray = get_log_stirling_table(len(S), num_colors)
 
     def rec_random_partition(S: set, parts: int) -> List[Set[int]]:
         if len(S) == 0 or parts == 0:
@@ -445,22 +558,8 @@ def recursive_random_partition(S: set, num_colors: int) -> List[Set[int]]:
 
         P: List[Set[int]] = []
 
-        # FIXME: For some reason binom probability is greater than 1...
-        binom_prob: float = stirling[len(S), parts - 1] / stirling[len(S)][parts] if stirling[len(S), parts] != 0 else 1
-
-        # FIXME: Lets see for now if I can just use sympy stirling
-        #   Seems like we can't...
-
-        # binom_prob = stir(len(S), parts - 1) / stir(len(S), parts) if stir(len(S), parts) != 0 else 0
-
-        # Put v in its own partition with P[Event] = binom_prob
-        if np.random.binomial(1, p=(binom_prob if (
-                binom_prob != None and
-                binom_prob != float('NaN') and
-                0 <= binom_prob <= 1
-        ) else (
-                1 if binom_prob >= 1 else 0
-        ))):
+        # Put v in its own partition with P[Event] = S(|S|, parts - 1) / S(|S|, parts)
+        if np.random.binomial(1, p=singleton_probability(log_stirling, len(S), parts)):
             new_part: list = list(rec_random_partition(S, parts - 1))
             return [{v}] if new_part == None else [{v}] + new_part
 
@@ -477,7 +576,7 @@ def max_degree(G: nx.Graph) -> int:
     return max(G.degree, key=lambda x: x[1])[1]
 
 
-def generate_random_color_partition(G: nx.Graph, num_colors: int) -> Dict[int, Set[int]]:
+def generate_random_color_partition(G: nx.Graph, num_colors: int, rng: np.random.Generator = None) -> Dict[int, Set[int]]:
     """
     :param G: nx.Graph
     :param num_colors: int
@@ -486,7 +585,7 @@ def generate_random_color_partition(G: nx.Graph, num_colors: int) -> Dict[int, S
     # Initialize stirling table
     n: int = len(G)
 
-    partition: List[Set[int]] = random_k_partition(set(G.nodes), num_colors)
+    partition: List[Set[int]] = random_k_partition(set(G.nodes), num_colors, rng)
 
     # Make sure its in the right format to return
     coloring: Dict[int, Set[int]] = {}
@@ -1,8 +1,10 @@
 from typing import Callable, List, Union
 
 import networkx as nx
+import numpy as np
 
-from util.misc import pull_values
+from util.misc import get_rng, pull_values
+from util.models.step_trace import StepTrace
 
 
 class Heuristic:
@@ -31,6 +33,8 @@ class Heuristic:
         self.metadata: dict = None
         self.verbose: bool = verbose
         self.debug: bool = debug
+        self.rng: np.random.Generator = None
+        self.step_trace: StepTrace = None
 
         # The keys which are expected in every metadata passed in, e.g. raise warning
         # if the keys are not found within the provided metadata.
@@ -58,6 +62,13 @@ class Heuristic:
         if self.post_step_hook is not None:
             self.post_step_hook(subset, step)
 
+    """
+        Returns whether `step` should be recorded in the step trace, so heuristics only compute the
+        metrics of steps which are recorded.
+    """
+    def wants_step(self, step: int) -> bool:
+        return self.step_trace is not None and self.step_trace.wants(step)
+
     """
         Clears out the data stored in this heuristic, allowing it to be used again.
     """
@@ -66,6 +77,8 @@ class Heuristic:
         self.solution = None
         self.metadata = None
         self.post_step_hook = None
+        self.rng = None
+        self.step_trace = None
 
     """
         Public function to run the optimization heuristic, which sets metadata before
@@ -79,13 +92,17 @@ class Heuristic:
             metadata:       The metadata to pass to the heuristic. Used to set arguments on a run by run basis
             seed:           An initial solution for the heuristic. Pass in none to set initial solution to None.
             post_step_hook: A function to call after each 'step' of the heuristic (however the heuristic defines step). Leave None to do nothing.
+            rng:            The random generator for all random choices the heuristic makes. Pass one derived from the trial's seed to make runs reproducible.
+            step_trace:     A StepTrace the heuristic records its per step metrics into, a cheaper alternative to post_step_hook. Leave None to record nothing.
     """
     def run_heuristic(
         self, 
         G: nx.graph, 
         metadata: dict = None, 
         seed = None, 
-        post_step_hook: Callable = None
+        post_step_hook: Callable = None,
+        rng: np.random.Generator = None,
+        step_trace: StepTrace = None,
     ) -> None:
         # Clear self just to be completely sure that there is no bad info.
         self.clear()
@@ -101,6 +118,8 @@ class Heuristic:
         self.solution = seed
         self.metadata = metadata
         self.post_step_hook = post_step_hook
+        self.rng = get_rng(rng)
+        self.step_trace = step_trace
 
         # Validate the metadata using the expected keys.
         for key in self.expected_metadata_keys:
@@ -42,6 +42,11 @@ def validate(predicate: bool, message: str):
         raise Exception(message)
 
 
+def get_rng(rng: np.random.Generator = None) -> np.random.Generator:
+    """ Returns `rng`, or a new generator seeded from OS entropy when none is provided """
+    return rng if rng is not None else np.random.default_rng()
+
+
 def pull_values(d: dict, *args) -> List:
     """
     Pulls values from the dictionary provided
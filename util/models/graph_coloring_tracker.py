@@ -1,15 +1,16 @@
 import copy
 import math
-import random
 import time
 from collections import defaultdict
 from typing import Dict, List, Callable
 from typing import Set
 
 import networkx as nx
+import numpy as np
 from heapdict import heapdict
 
 from util.graph import get_big_independent_set
+from util.misc import get_rng
 from util.models.solution import Solution
 
 ### Requested Data strings ###
@@ -29,7 +30,7 @@ class GraphColoringTracker(Solution):
 
     # FIXME: whenever I try to access the color of an uncolored node, I can't do that, nope
     def __init__(self, G: nx.Graph, requested_data: set = set(), coloring: defaultdict = None,
-                 labelling: dict = None):
+                 labelling: dict = None, rng: np.random.Generator = None):
         super(GraphColoringTracker, self).__init__()
 
         available_data: set = {
@@ -49,6 +50,8 @@ class GraphColoringTracker(Solution):
         self.color_to_nodes: dict = defaultdict(set)
         self.node_to_color: dict = {}
         self.calls_to_color_node: int = 0
+        # The generator random nodes and colors are chosen with
+        self.rng: np.random.Generator = get_rng(rng)
 
         self.requested_data = requested_data
         # Make sure we didn't get asked for more/wrong data then we wanted
@@ -284,7 +287,8 @@ class GraphColoringTracker(Solution):
         self.init_requested_data_POSTCOLORING()
 
     def get_random_node(self):
-        return random.choice(list(self.G.nodes))
+        nodes: list = list(self.G.nodes)
+        return nodes[self.rng.integers(len(nodes))]
 
     def get_random_available_color(self, node: int, make_new: bool = False):
         if len(self.available_colors_at[node]) == 0 and make_new:
@@ -292,7 +296,8 @@ class GraphColoringTracker(Solution):
         elif len(self.available_colors_at[node]) == 0:
             raise ValueError(f'There are no colors to color {node} with!')
         else:
-            return random.choice(list(self.available_colors_at[node]))
+            colors: list = list(self.available_colors_at[node])
+            return colors[self.rng.integers(len(colors))]
 
     def add_new_color(self, node: int, new_color: int):
         if AVAILABLE_COLORS_AT in self.requested_data:
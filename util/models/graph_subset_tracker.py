@@ -1,29 +1,39 @@
-import copy
-import random as random
 from typing import List, Tuple
 
+import numpy as np
+
 import util.formulas as formulas
 from util.graph import count_edge_boundary
+from util.misc import get_rng
 from util.models.solution import Solution
 from util.new_graph.models.graph import Graph
 
 """
     Tracks a subset of a provided graph along with some relevant meetadata, allowing limited
     access to the subset to speed up metadata access / tracking.
+
+    NOTE: Membership is kept as an indexable set, e.g. a permutation `order` of the vertices where
+    the first `size` entries are the subset, along with the `position` of each vertex in `order`.
+    Adding or removing a vertex swaps it across the boundary, so membership tests, random member /
+    non-member sampling, and adds / removes are O(1) apart from the O(deg) degree update.
+
+    NOTE: `replicate` is copy-on-write by default. The replica shares the arrays of the original,
+    and whichever of the two is mutated first takes a private copy at that point, so replicas that
+    are culled before they move never allocate.
 """
 class GraphSubsetTracker(Solution):
 
-    def __init__(self, G: Graph = None, initial_subset: set = set()):
+    def __init__(self, G: Graph = None, initial_subset: set = set(), rng: np.random.Generator = None):
         #? If passed relevant context, proceed otherwise mark as
         #? not initialized and wait for initialize call.
         if G is None:
             # Whether or not the tracker has been initialized yet
             self.initialized = False    # Test
         else:
-            self.initialize(G, initial_subset)
+            self.initialize(G, initial_subset, rng)
     
 
-    def initialize(self, G: Graph, initial_subset: set):
+    def initialize(self, G: Graph, initial_subset: set, rng: np.random.Generator = None):
         """ Initializes the graph subset tracker if not already initialized """
         #? Check arguments
         if not isinstance(initial_subset, set):
@@ -31,17 +41,55 @@ class GraphSubsetTracker(Solution):
         #? Set metadata
         self.G: Graph = G
         self.__graph_size: int = G.size
+        # The generator random nodes are sampled with, shared with any replicas
+        self.rng: np.random.Generator = get_rng(rng)
         self.set_subset(initial_subset)
         self.initialized = True
 
 
     def set_subset(self, subset: set):
         """ Manually sets all subset information for the provided subset """
-        self.subset, self.subset_complement = self.G.partition_vertices(copy.copy(subset))
-        self.__internal_degrees: List[int] = [
-            self.G.edge_boundary(v, self.subset) for v in self.G.vertex_list()
-        ]
-        self.__num_edges: int = self.G.edges(subset)
+        members: np.ndarray = np.fromiter(subset, dtype=np.int64, count=len(subset))
+        in_subset: np.ndarray = np.zeros(self.__graph_size, dtype=bool)
+        in_subset[members] = True
+        self.__order: np.ndarray = np.concatenate([members, np.flatnonzero(~in_subset)])
+        self.__position: np.ndarray = np.empty(self.__graph_size, dtype=np.int64)
+        self.__position[self.__order] = np.arange(self.__graph_size)
+        self.__size: int = len(members)
+        self.__internal_degrees: np.ndarray = np.zeros(self.__graph_size, dtype=np.int64)
+        for v in members:
+            self.__internal_degrees[self.G.neighbor_array(v)] += 1
+        self.__num_edges: int = int(self.__internal_degrees[members].sum()) // 2
+        # Whether the arrays above may be shared with a replica, and must be copied before writing
+        self.__shared: bool = False
+
+
+    def __ensure_private(self):
+        """ Takes a private copy of the tracked arrays if they may be shared with a replica """
+        if self.__shared:
+            self.__order = self.__order.copy()
+            self.__position = self.__position.copy()
+            self.__internal_degrees = self.__internal_degrees.copy()
+            self.__shared = False
+
+
+    @property
+    def subset(self) -> set:
+        """ The vertices currently in the subset, as a new set """
+        return set(self.__order[:self.__size].tolist())
+
+
+    @property
+    def subset_complement(self) -> set:
+        """ The vertices currently outside of the subset, as a new set """
+        return set(self.__order[self.__size:].tolist())
+
+
+    def __swap_positions(self, i: int, j: int):
+        """ Swaps the vertices at positions i and j of the order """
+        u, v = self.__order[i], self.__order[j]
+        self.__order[i], self.__order[j] = v, u
+        self.__position[u], self.__position[v] = j, i
 
 
     def add_node(self, node: int):
@@ -52,15 +100,15 @@ class GraphSubsetTracker(Solution):
         #? Validate arguments
         if not self.initialized:
             raise Exception("Cannot add a node without initialization.")
-        if node in self.subset:
-            raise Exception("Cannot add a node already in subset")
         if node >= self.__graph_size:
             raise Exception("Cannot add a node not in graph.")
+        if node in self:
+            raise Exception("Cannot add a node already in subset")
         #? Add node. Update trackers.
-        self.subset.add(node)
-        self.subset_complement.remove(node)
-        for neighbor in self.G.neighbors(node):
-            self.__internal_degrees[neighbor] += 1
+        self.__ensure_private()
+        self.__swap_positions(self.__position[node], self.__size)
+        self.__size += 1
+        self.__internal_degrees[self.G.neighbor_array(node)] += 1
         self.__num_edges += self.internal_degree(node)
 
     
@@ -74,15 +122,23 @@ class GraphSubsetTracker(Solution):
             raise Exception("Cannot add a node without initialization.")
         if node >= self.__graph_size:
             raise Exception("Cannot add a node not in graph.")#? Validate arguments
-        if node not in self.subset:
+        if node not in self:
             raise Exception("Cannot add a node already in subset")
         #? Remove node. Update trackers.
-        self.subset.remove(node)
-        self.subset_complement.add(node)
-        for neighbor in self.G.neighbors(node):
-            self.__internal_degrees[neighbor] -= 1
+        self.__ensure_private()
+        self.__size -= 1
+        self.__swap_positions(self.__position[node], self.__size)
+        self.__internal_degrees[self.G.neighbor_array(node)] -= 1
         self.__num_edges -= self.internal_degree(node)
 
+
+    def __random_member(self) -> int:
+        return int(self.__order[self.rng.integers(self.__size)])
+
+
+    def __random_non_member(self) -> int:
+        return int(self.__order[self.rng.integers(self.__size, self.__graph_size)])
+
     
     def add_random_node(self) -> int:
         """
@@ -95,7 +151,7 @@ class GraphSubsetTracker(Solution):
         if self.size() == self.__graph_size:
             raise Exception("Cannot add a random node with complete subset.")
         #? Add node
-        node: int = random.choice(list(self.subset_complement))
+        node: int = self.__random_non_member()
         self.add_node(node)
         return node
 
@@ -111,7 +167,7 @@ class GraphSubsetTracker(Solution):
         if self.size() == 0:
             raise Exception("Cannot remove a random node from empty subset.")
         #? Remove node
-        node = random.choice(list(self.subset))
+        node = self.__random_member()
         self.remove_node(node)
         return node
 
@@ -131,8 +187,8 @@ class GraphSubsetTracker(Solution):
             raise Exception("Cannot swap random nodes with empty subset.")
         if self.size() == self.__graph_size:
             raise Exception("Cannot swap random nodes with full subset.")
-        to_add: int = random.choice(list(self.subset_complement))
-        to_remove: int = random.choice(list(self.subset))
+        to_add: int = self.__random_non_member()
+        to_remove: int = self.__random_member()
         self.add_node(to_add)
         self.remove_node(to_remove)
 
@@ -145,7 +201,7 @@ class GraphSubsetTracker(Solution):
             raise Exception("Cannot get internal degree without initialization.")
         if node >= self.__graph_size:
             raise Exception("Cannot get internal degree of invalid node.")
-        return self.__internal_degrees[node]
+        return int(self.__internal_degrees[node])
 
 
     def max_internal_degree(self, S: set) -> Tuple[int, int]:
@@ -164,7 +220,7 @@ class GraphSubsetTracker(Solution):
         """
         if not self.initialized:
             raise Exception("Cannot get size without initialization.")
-        return len(self.subset)
+        return self.__size
 
 
     def density(self) -> float:
@@ -189,27 +245,41 @@ class GraphSubsetTracker(Solution):
         return self.__num_edges
         
 
-    def replicate(self) -> "GraphSubsetTracker":
+    def replicate(self, copy_on_write: bool = True) -> "GraphSubsetTracker":
         """
-            Returns a copy of this tracker with a deep reference to the graph.
+            Returns a copy of this tracker with a deep reference to the graph. When
+            `copy_on_write` is set the copy shares this tracker's arrays until either is mutated,
+            otherwise the arrays are copied immediately.
         """
         if not self.initialized:
             raise Exception("Cannot replicate an uninitialized subset tracker")
         other = GraphSubsetTracker()
         other.G = self.G
+        other.rng = self.rng
         other.__graph_size = self.__graph_size
-        other.subset = copy.copy(self.subset)
-        other.subset_complement = copy.copy(self.subset_complement)
-        other.__internal_degrees = copy.copy(self.__internal_degrees)
+        other.__order = self.__order
+        other.__position = self.__position
+        other.__size = self.__size
+        other.__internal_degrees = self.__internal_degrees
         other.__num_edges = self.__num_edges
         other.initialized = True
+        if copy_on_write:
+            self.__shared = True
+            other.__shared = True
+        else:
+            other.__shared = True
+            other.__ensure_private()
         return other
 
 
+    def __contains__(self, node: int) -> bool:
+        return self.__position[node] < self.__size
+
+
     def __iter__(self):
         if not self.initialized:
             raise Exception("Cannot iterate through uninitialized graph subset tracker.")
-        return iter(self.subset)
+        return iter(self.__order[:self.__size].tolist())
 
 
     def __str__(self) -> str:
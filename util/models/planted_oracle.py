@@ -0,0 +1,96 @@
+from typing import Callable, Iterable, Set, Union
+
+"""
+    Intersection oracles report how many vertices of a heuristic's current solution lie in the
+    planted set. Heuristics `reset` the oracle to their starting solution, notify it of every vertex
+    they `add` or `remove`, and read the current `intersection` at any point.
+
+    NOTE: Heuristics still accept a plain `oracle(subset) -> int` callable, e.g.
+    `lambda x: len(x.intersection(B))`, which is wrapped so that it is called on the tracked subset
+    whenever the intersection is read.
+"""
+class IntersectionOracle:
+
+    def reset(self, subset: Set[int]):
+        """ Starts tracking `subset`, which the heuristic then mutates through `add` and `remove` """
+        raise NotImplementedError()
+
+
+    def add(self, v: int):
+        """ Notifies the oracle that `v` was added to the tracked subset """
+        raise NotImplementedError()
+
+
+    def remove(self, v: int):
+        """ Notifies the oracle that `v` was removed from the tracked subset """
+        raise NotImplementedError()
+
+
+    def intersection(self) -> int:
+        """ Returns the number of planted vertices in the tracked subset """
+        raise NotImplementedError()
+
+
+class PlantedOracle(IntersectionOracle):
+    """
+    Tracks the intersection of a subset with a known planted set as a running count, so that
+    reading it is O(1) and each add / remove is a single set membership test.
+    """
+
+    def __init__(self, planted: Iterable[int]):
+        self.planted: Set[int] = set(planted)
+        self.__intersection: int = 0
+
+
+    def reset(self, subset: Set[int]):
+        self.__intersection = len(self.planted.intersection(subset))
+
+
+    def add(self, v: int):
+        if v in self.planted:
+            self.__intersection += 1
+
+
+    def remove(self, v: int):
+        if v in self.planted:
+            self.__intersection -= 1
+
+
+    def intersection(self) -> int:
+        return self.__intersection
+
+
+    def __call__(self, subset: Set[int]) -> int:
+        """ Returns the intersection of an arbitrary subset, as the callable form of the oracle """
+        return len(self.planted.intersection(subset))
+
+
+class CallableOracle(IntersectionOracle):
+    """ Adapts an `oracle(subset) -> int` callable, calling it on the tracked subset on every read """
+
+    def __init__(self, oracle: Callable[[Set[int]], int]):
+        self.oracle: Callable[[Set[int]], int] = oracle
+        self.__subset: Set[int] = None
+
+
+    def reset(self, subset: Set[int]):
+        self.__subset = subset
+
+
+    def add(self, v: int):
+        pass
+
+
+    def remove(self, v: int):
+        pass
+
+
+    def intersection(self) -> int:
+        return self.oracle(self.__subset)
+
+
+def as_intersection_oracle(oracle: Union[IntersectionOracle, Callable[[Set[int]], int]]) -> IntersectionOracle:
+    """ Returns `oracle` if it is already an IntersectionOracle, and wraps a plain callable otherwise """
+    if isinstance(oracle, IntersectionOracle):
+        return oracle
+    return CallableOracle(oracle)
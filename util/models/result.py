@@ -1,4 +1,5 @@
 from datetime import date
+from typing import Callable, Dict
 
 from networkx.drawing.layout import rescale_layout_dict
 
@@ -9,6 +10,9 @@ class Result:
     """
 
     result_identifier: str = None
+    # The root seed the trials were run with, from which each trial's generator is derived (see
+    # util/trial_executor.py). None when the result predates seeded trials.
+    root_seed: int = None
 
     @classmethod    
     def generate_file_name(cls) -> str:
@@ -17,3 +21,26 @@ class Result:
         create a file name
         """
         return f"{cls.result_identifier}-{date.today()}"
+
+
+    def __getattr__(self, name: str):
+        """
+        Loads a field of a result read from a columnar results directory on its first access (see
+        util/results/columnar.py). Only called for attributes which are not already set.
+        """
+        loaders: Dict[str, Callable] = self.__dict__.get("_field_loaders")
+        if loaders is None or name not in loaders:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        value = loaders.pop(name)()
+        setattr(self, name, value)
+        return value
+
+    def load_all_fields(self):
+        """Loads every field which has not been accessed yet, e.g. before storing the result again"""
+        for name in list(self.__dict__.get("_field_loaders", {})):
+            getattr(self, name)
+        self.__dict__.pop("_field_loaders", None)
+
+    def __getstate__(self) -> dict:
+        self.load_all_fields()
+        return self.__dict__.copy()
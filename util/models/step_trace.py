@@ -0,0 +1,66 @@
+import math
+from typing import Dict, List
+
+import numpy as np
+
+"""
+    Columnar recorder of per step heuristic telemetry. Each metric (e.g. size, intersection) is a
+    preallocated NumPy column, and recording a step writes one entry per column rather than calling
+    back into python for every step. Results objects read the columns in bulk once a run completes.
+
+    NOTE: With `every` = k only steps 0, k, 2k, ... are recorded, so that very large runs keep a
+    trace of n / k entries. Heuristics check `wants(step)` before computing the metrics of a step.
+"""
+class StepTrace:
+
+    def __init__(self, num_steps: int, metrics: List[str], every: int = 1, dtype=np.int64):
+        if every < 1:
+            raise Exception(f"Cannot record every {every} steps, as the interval must be positive.")
+        self.num_steps: int = num_steps
+        self.metrics: List[str] = list(metrics)
+        self.every: int = every
+        capacity: int = max(math.ceil(num_steps / every), 1)
+        self.__steps: np.ndarray = np.zeros(capacity, dtype=np.int64)
+        self.__columns: Dict[str, np.ndarray] = {metric: np.zeros(capacity, dtype=dtype) for metric in self.metrics}
+        self.__length: int = 0
+
+
+    def wants(self, step: int) -> bool:
+        """ Returns whether `step` is one of the sampled steps """
+        return step % self.every == 0
+
+
+    def record(self, step: int, **values):
+        """ Records the provided metric values for `step`, growing the columns if they are full """
+        if self.__length == len(self.__steps):
+            self.__grow()
+        i: int = self.__length
+        self.__steps[i] = step
+        for metric, value in values.items():
+            self.__columns[metric][i] = value
+        self.__length += 1
+
+
+    def steps(self) -> np.ndarray:
+        """ Returns the recorded step numbers """
+        return self.__steps[:self.__length]
+
+
+    def column(self, metric: str) -> np.ndarray:
+        """ Returns the recorded values of `metric`, aligned with `steps()` """
+        return self.__columns[metric][:self.__length]
+
+
+    def clear(self):
+        """ Drops all recorded steps, keeping the allocated columns for the next run """
+        self.__length = 0
+
+
+    def __grow(self):
+        self.__steps = np.concatenate([self.__steps, np.zeros_like(self.__steps)])
+        for metric, column in self.__columns.items():
+            self.__columns[metric] = np.concatenate([column, np.zeros_like(column)])
+
+
+    def __len__(self) -> int:
+        return self.__length
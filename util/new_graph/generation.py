@@ -0,0 +1,127 @@
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
+from util.new_graph.models.abstract_graph import AbstractGraph
+from util.new_graph.models.bitset_graph import BitsetGraph, pack_mask
+from util.new_graph.models.csr_graph import CSRGraph
+
+"""
+Vectorized generation of erdos-renyi graphs with a planted subset, emitting the array-backed
+graphs directly without ever constructing a networkx graph.
+
+The upper triangle of the adjacency matrix is sampled in BLOCK_SIZE x BLOCK_SIZE blocks, where
+block (I, J) with I <= J is drawn from its own random stream spawned from a single seed. Rows
+are then assembled one block of rows at a time, regenerating the transposed upper blocks for
+the part of each row below the diagonal, so peak memory stays at O(BLOCK_SIZE * n) on top of
+the graph itself.
+"""
+
+# The side length of the blocks the upper triangle is sampled in
+BLOCK_SIZE: int = 1024
+
+
+def _sample_upper_block(entropy: int, I: int, J: int, shape: Tuple[int, int], p: float) -> np.ndarray:
+    """Samples block (I, J) of the upper triangle, with I <= J, from its own random stream"""
+    rng: np.random.Generator = np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(I, J)))
+    block: np.ndarray = rng.random(shape, dtype=np.float32) < p
+    if I == J:
+        block = np.triu(block, k=1)
+    return block
+
+
+def _sample_row_blocks(
+    n: int,
+    p: float,
+    planted: np.ndarray,
+    clique: bool,
+    entropy: int,
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Yields (start, rows) where `rows` is the dense boolean adjacency of the vertices
+    [start, start + len(rows)) against all n vertices.
+    """
+    planted_mask: np.ndarray = np.zeros(n, dtype=bool)
+    planted_mask[planted] = True
+    num_blocks: int = (n + BLOCK_SIZE - 1) // BLOCK_SIZE
+    bounds: List[Tuple[int, int]] = [(b * BLOCK_SIZE, min((b + 1) * BLOCK_SIZE, n)) for b in range(num_blocks)]
+
+    for I, (row_start, row_end) in enumerate(bounds):
+        rows: np.ndarray = np.zeros((row_end - row_start, n), dtype=bool)
+        for J, (col_start, col_end) in enumerate(bounds):
+            if J < I:
+                upper: np.ndarray = _sample_upper_block(entropy, J, I, (col_end - col_start, row_end - row_start), p)
+                rows[:, col_start:col_end] = upper.T
+            else:
+                upper: np.ndarray = _sample_upper_block(entropy, I, J, (row_end - row_start, col_end - col_start), p)
+                rows[:, col_start:col_end] |= upper
+                if J == I:
+                    rows[:, col_start:col_end] |= upper.T
+
+        # Zero (or fill) the planted block in place, without touching the diagonal
+        planted_rows: np.ndarray = np.flatnonzero(planted_mask[row_start:row_end])
+        rows[np.ix_(planted_rows, planted)] = clique
+        rows[np.arange(row_end - row_start), np.arange(row_start, row_end)] = False
+        yield row_start, rows
+
+
+def _build_csr(n: int, blocks: Iterator[Tuple[int, np.ndarray]]) -> CSRGraph:
+    counts: np.ndarray = np.zeros(n, dtype=np.int64)
+    indices: List[np.ndarray] = []
+    for start, rows in blocks:
+        counts[start:start + len(rows)] = rows.sum(axis=1)
+        indices.append(np.nonzero(rows)[1].astype(np.int32))
+    indptr_dtype = np.int32 if counts.sum() < np.iinfo(np.int32).max else np.int64
+    indptr: np.ndarray = np.zeros(n + 1, dtype=indptr_dtype)
+    np.cumsum(counts, out=indptr[1:])
+    return CSRGraph(indptr, np.concatenate(indices) if indices else np.zeros(0, dtype=np.int32))
+
+
+def _build_bitset(n: int, blocks: Iterator[Tuple[int, np.ndarray]]) -> BitsetGraph:
+    words: np.ndarray = None
+    for start, rows in blocks:
+        packed: np.ndarray = pack_mask(rows)
+        if words is None:
+            words = np.zeros((n, packed.shape[1]), dtype=np.uint64)
+        words[start:start + len(rows)] = packed
+    return BitsetGraph(words, n)
+
+
+# Builders for each array-backed graph implementation, keyed by backend name
+_BUILDERS: dict = {
+    "csr": _build_csr,
+    "bitset": _build_bitset,
+}
+
+
+def generate_planted_graph(
+    n: int,
+    p: float,
+    planted_size: int,
+    clique: bool = False,
+    backend: str = "csr",
+    seed: int = None,
+    rng: np.random.Generator = None,
+) -> Tuple[AbstractGraph, List[int]]:
+    """
+    Generates an erdos-renyi graph with `n` vertices and edge probability `p`, with a uniformly
+    random planted subset of `planted_size` vertices which is either a clique or an independent
+    set (controlled by the `clique` flag). Returns (graph, planted).
+
+    NOTE: When no seed is provided one is drawn from `rng`, or from the global `np.random` state
+    when no generator is provided either.
+    """
+    if backend not in _BUILDERS:
+        raise Exception(f"Vectorized generation does not support the {backend} backend. Expected one of {list(_BUILDERS.keys())}.")
+    if planted_size > n:
+        raise Exception(f"Attempt to plant a set of {planted_size} vertices in a graph of size {n}")
+    if seed is None and rng is not None:
+        seed = int(rng.integers(np.iinfo(np.int64).max))
+    elif seed is None:
+        seed = int(np.random.randint(np.iinfo(np.int64).max, dtype=np.int64))
+    seed_sequence: np.random.SeedSequence = np.random.SeedSequence(seed)
+    rng: np.random.Generator = np.random.default_rng(seed_sequence)
+    planted: np.ndarray = np.sort(rng.choice(n, size=planted_size, replace=False))
+    entropy: int = int(rng.integers(np.iinfo(np.int64).max))
+    graph: AbstractGraph = _BUILDERS[backend](n, _sample_row_blocks(n, p, planted, clique, entropy))
+    return graph, rng.permutation(planted).tolist()
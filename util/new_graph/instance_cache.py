@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from util.config import (get_instance_cache_directory,
+                         get_instance_cache_max_bytes)
+from util.new_graph.generation import generate_planted_graph
+from util.new_graph.models.abstract_graph import AbstractGraph
+from util.new_graph.models.bitset_graph import BitsetGraph
+from util.new_graph.models.csr_graph import CSRGraph
+
+# The graph implementations that can be stored in the cache, keyed by backend name
+_GRAPH_CLASSES: Dict[str, type] = {
+    "csr": CSRGraph,
+    "bitset": BitsetGraph,
+}
+
+Seed = Union[int, Sequence[int]]
+
+
+class GraphInstanceCache:
+    """
+    Content-addressed on-disk store of generated planted graph instances. Each instance is keyed
+    by its generator parameters and RNG seed, and is stored as a directory of .npy arrays which are
+    memory-mapped on load, so reusing an instance costs milliseconds regardless of its size.
+
+    The cache is bounded by `max_bytes`. When a new instance pushes it over that size the least
+    recently used instances are evicted, where an instance is used whenever it is stored or loaded.
+
+    NOTE: Only seeded generation is cached, as unseeded graphs are never regenerated identically.
+    """
+
+    # Bumped whenever the generator or storage layout changes, invalidating old instances
+    VERSION: int = 1
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory: str = directory
+        self.max_bytes: int = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+
+    @staticmethod
+    def key(n: int, p: float, planted_size: int, clique: bool, backend: str, seed: Seed) -> str:
+        """Returns the content address of the instance with the provided parameters"""
+        params: dict = {
+            "version": GraphInstanceCache.VERSION,
+            "n": n,
+            "p": p,
+            "planted_size": planted_size,
+            "clique": clique,
+            "backend": backend,
+            "seed": list(seed) if isinstance(seed, (list, tuple)) else seed,
+        }
+        return hashlib.sha1(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+
+    def get_or_generate(
+        self,
+        n: int,
+        p: float,
+        planted_size: int,
+        clique: bool = False,
+        backend: str = "csr",
+        seed: Seed = None,
+    ) -> Tuple[AbstractGraph, List[int]]:
+        """
+        Returns the (graph, planted) instance for the provided parameters, loading it from the
+        cache when present and otherwise generating and storing it.
+        """
+        if seed is None:
+            return generate_planted_graph(n, p, planted_size, clique=clique, backend=backend)
+        key: str = self.key(n, p, planted_size, clique, backend, seed)
+        instance: Optional[Tuple[AbstractGraph, List[int]]] = self.get(key)
+        if instance is None:
+            instance = generate_planted_graph(n, p, planted_size, clique=clique, backend=backend, seed=seed)
+            self.put(key, backend, *instance)
+        return instance
+
+
+    def get(self, key: str) -> Optional[Tuple[AbstractGraph, List[int]]]:
+        """Loads the instance stored under `key`, or returns None if it is not cached"""
+        path: str = self.__entry_path(key)
+        if not os.path.isdir(path):
+            return None
+        with open(f"{path}/meta.json") as f:
+            meta: dict = json.load(f)
+        arrays: Dict[str, np.ndarray] = {
+            name: np.load(f"{path}/{name}.npy", mmap_mode="r") for name in meta["arrays"]
+        }
+        planted: List[int] = np.load(f"{path}/planted.npy").tolist()
+        os.utime(path)
+        return _GRAPH_CLASSES[meta["backend"]].from_arrays(arrays), planted
+
+
+    def put(self, key: str, backend: str, graph: AbstractGraph, planted: List[int]):
+        """Stores an instance under `key`, then evicts instances until the cache fits in its size"""
+        path: str = self.__entry_path(key)
+        if os.path.isdir(path):
+            return
+        # Write into a temporary directory and rename it into place, so that concurrent writers
+        # and interrupted runs never leave a partially written instance behind.
+        tmp_path: str = tempfile.mkdtemp(dir=self.directory, prefix=".tmp-")
+        arrays: Dict[str, np.ndarray] = graph.to_arrays()
+        for name, array in arrays.items():
+            np.save(f"{tmp_path}/{name}.npy", array)
+        np.save(f"{tmp_path}/planted.npy", np.asarray(planted, dtype=np.int64))
+        with open(f"{tmp_path}/meta.json", "w") as f:
+            json.dump({"backend": backend, "arrays": list(arrays.keys())}, f)
+        try:
+            os.rename(tmp_path, path)
+        except OSError:
+            # Another process stored the same instance first
+            shutil.rmtree(tmp_path, ignore_errors=True)
+        self.evict(keep=key)
+
+
+    def evict(self, keep: str = None):
+        """Removes least recently used instances until the cache fits within `max_bytes`"""
+        entries: List[Tuple[float, int, str]] = []
+        for key in os.listdir(self.directory):
+            path: str = self.__entry_path(key)
+            if key.startswith(".") or not os.path.isdir(path):
+                continue
+            entries.append((os.path.getmtime(path), _directory_size(path), key))
+        total: int = sum(size for _, size, _ in entries)
+        for _, size, key in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            shutil.rmtree(self.__entry_path(key), ignore_errors=True)
+            total -= size
+
+
+    def size(self) -> int:
+        """Returns the total number of bytes stored in the cache"""
+        return sum(
+            _directory_size(self.__entry_path(key)) for key in os.listdir(self.directory) if not key.startswith(".")
+        )
+
+
+    def __entry_path(self, key: str) -> str:
+        return f"{self.directory}/{key}"
+
+
+def _directory_size(path: str) -> int:
+    return sum(os.path.getsize(f"{path}/{f}") for f in os.listdir(path))
+
+
+def load_instance_cache(project_name: str) -> GraphInstanceCache:
+    """Returns the graph instance cache configured for the provided project"""
+    return GraphInstanceCache(
+        get_instance_cache_directory(project_name),
+        get_instance_cache_max_bytes(project_name),
+    )
@@ -13,6 +13,10 @@ class AbstractGraph(object):
     access are being followed appropriately.
     """
 
+    # Whether the graph stores its edges, so that `neighbor_array` can list them. Query models whose
+    # edge boundaries are drawn as they are asked for set this to False.
+    has_explicit_edges: bool = True
+
     def degree(self, v: int) -> int:
         raise NotImplementedError()
 
@@ -67,5 +71,26 @@ class AbstractGraph(object):
         raise NotImplementedError()
 
 
+    def neighbor_array(self, v: int) -> np.ndarray:
+        """Returns the neighbors of `v` as a NumPy array of vertices"""
+        raise NotImplementedError()
+
+
+    def adjacency_rows(self, vertices: np.ndarray) -> np.ndarray:
+        """Returns the dense boolean adjacency rows of `vertices`, as a len(vertices) x n matrix"""
+        rows: np.ndarray = np.zeros((len(vertices), self.size), dtype=bool)
+        for i, v in enumerate(vertices):
+            rows[i, self.neighbor_array(v)] = True
+        return rows
+
+
+    def with_planted_set(self, planted: List[int], clique: bool) -> "AbstractGraph":
+        """
+        Returns a copy of the graph where all edges within `planted` are either
+        added (`clique`) or removed.
+        """
+        raise NotImplementedError()
+
+
     def adjacency_matrix(self) -> np.array: 
         raise NotImplementedError()
@@ -0,0 +1,217 @@
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+import networkx as nx
+import numpy as np
+
+from util.new_graph.models.abstract_graph import AbstractGraph
+
+# Number of set bits in every possible byte, used to popcount packed words byte by byte
+_POPCOUNT_TABLE: np.ndarray = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    """Returns the number of set bits in each row (last axis) of an array of uint64 words"""
+    words = np.ascontiguousarray(words)
+    return _POPCOUNT_TABLE[words.view(np.uint8)].sum(axis=-1, dtype=np.int64)
+
+
+def num_words(n: int) -> int:
+    """Returns the number of uint64 words needed to store a bit per vertex of [0, n)"""
+    return (n + 63) // 64
+
+
+def pack_mask(mask: np.ndarray) -> np.ndarray:
+    """
+    Packs boolean masks (along the last axis) into little-endian uint64 words, such that
+    vertex u is bit (u % 64) of word (u // 64).
+    """
+    n: int = mask.shape[-1]
+    padded: np.ndarray = np.zeros(mask.shape[:-1] + (num_words(n) * 64,), dtype=bool)
+    padded[..., :n] = mask
+    return np.packbits(padded, axis=-1, bitorder="little").view(np.uint64)
+
+
+def unpack_words(words: np.ndarray, n: int) -> np.ndarray:
+    """Inverse of `pack_mask`, returning boolean masks of length n"""
+    words = np.ascontiguousarray(words)
+    return np.unpackbits(words.view(np.uint8), axis=-1, bitorder="little")[..., :n].astype(bool)
+
+
+class BitsetGraph(AbstractGraph):
+    """
+    An immutable graph backed by a bit-packed n x n adjacency matrix, stored as n rows of
+    ceil(n / 64) uint64 words. Intended for dense graphs (e.g. p = 0.5) where a dict of dicts
+    costs far more memory than one bit per vertex pair. Vertices are considered to be [0, n).
+
+    NOTE: Queries which take a subset accept a python set of vertices, a boolean NumPy mask
+    of length n, or a subset already packed with `pack_subset`. Packed subsets reduce
+    `edge_boundary` to a popcount of the AND of two rows.
+    """
+
+    def __init__(self, rows: np.ndarray, n: int, degrees: np.ndarray = None):
+        self.size: int = n
+        self._rows: np.ndarray = rows
+        self._pre_process(degrees)
+
+
+    def _pre_process(self, degrees: np.ndarray = None):
+        """
+        Sets internal trackers at time of graph creation to allow simple
+        and quick lookup in the future.
+        NOTE: Relies on graphs being an immutable object
+        """
+        self._degrees: np.ndarray = popcount(self._rows).astype(np.int32) if degrees is None else degrees
+        self._max_degree_vertex: int = int(np.argmax(self._degrees)) if self.size > 0 else None
+        self._min_degree_vertex: int = int(np.argmin(self._degrees)) if self.size > 0 else None
+
+
+    @classmethod
+    def from_dense(cls, A: np.ndarray) -> "BitsetGraph":
+        """Constructs a graph from a dense symmetric adjacency matrix"""
+        return cls(pack_mask(A.astype(bool)), A.shape[0])
+
+
+    @classmethod
+    def from_edge_arrays(cls, n: int, u: np.ndarray, v: np.ndarray) -> "BitsetGraph":
+        """
+        Constructs a graph on [0, n) from two arrays of endpoints, where each undirected
+        edge (u[i], v[i]) is listed exactly once.
+        """
+        rows: np.ndarray = np.zeros((n, num_words(n)), dtype=np.uint64)
+        u = np.asarray(u, dtype=np.int64)
+        v = np.asarray(v, dtype=np.int64)
+        for a, b in ((u, v), (v, u)):
+            np.bitwise_or.at(rows, (a, b >> 6), np.left_shift(np.uint64(1), (b & 63).astype(np.uint64)))
+        return cls(rows, n)
+
+
+    @classmethod
+    def from_networkx(cls, g: nx.Graph) -> "BitsetGraph":
+        """Constructs a graph from a networkx graph whose nodes are [0, n)"""
+        edges: np.ndarray = np.array(list(g.edges()), dtype=np.int64).reshape(-1, 2)
+        return cls.from_edge_arrays(len(g.nodes), edges[:, 0], edges[:, 1])
+
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "BitsetGraph":
+        """Inverse of `to_arrays`. The arrays may be memory-mapped."""
+        return cls(arrays["rows"], len(arrays["degrees"]), arrays["degrees"])
+
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Returns the arrays that fully describe this graph, keyed by name"""
+        return {"rows": self._rows, "degrees": self._degrees}
+
+
+    def pack_subset(self, subset: Iterable[int]) -> np.ndarray:
+        """Packs a subset of vertices into a row of uint64 words"""
+        if isinstance(subset, np.ndarray) and subset.dtype == np.uint64:
+            return subset
+        return pack_mask(self._to_mask(subset))
+
+
+    def has_edge(self, u: int, v: int) -> bool:
+        return bool((int(self._rows[u, v >> 6]) >> (v & 63)) & 1)
+
+
+    def degree(self, v: int) -> int:
+        return int(self._degrees[v])
+
+
+    def vertex_list(self) -> List[int]:
+        return list(range(self.size))
+
+
+    def vertex_set(self) -> Set[int]:
+        return set(range(self.size))
+
+
+    def edge_boundary(self, v: int, subset: Set[int]) -> int:
+        """Returns the number of edges between v and set"""
+        if isinstance(subset, np.ndarray):
+            return int(popcount(self._rows[v] & self.pack_subset(subset)))
+        if len(subset) == 0:
+            return 0
+        members: np.ndarray = np.fromiter(subset, dtype=np.int64, count=len(subset))
+        bits: np.ndarray = self._rows[v, members >> 6] >> (members & 63).astype(np.uint64)
+        return int(np.count_nonzero(bits & np.uint64(1)))
+
+
+    def max_degree(self) -> Tuple[int, int]:
+        """Returns (v, deg(v)) where v has the maximum degree and deg(v) is it's degree"""
+        return (self._max_degree_vertex, self.degree(self._max_degree_vertex))
+
+
+    def min_degree(self) -> Tuple[int, int]:
+        """Returns (v, deg(v)) where v has the minimum degree and deg(v) is it's degree"""
+        return (self._min_degree_vertex, self.degree(self._min_degree_vertex))
+
+
+    def partition_vertices(self, subset: Set[int]) -> Tuple[Set[int], Set[int]]:
+        """
+        Returns the vertices of this graph, split into the subset and all other vertices.
+        The order is (subset, other_vertices).
+        """
+        return (subset, self.vertex_set().difference(subset))
+
+
+    def edges(self, subset: Set[int]) -> int:
+        """Returns the number of edges in `subset`"""
+        mask: np.ndarray = self._to_mask(subset)
+        packed: np.ndarray = pack_mask(mask)
+        return int(popcount(self._rows[np.flatnonzero(mask)] & packed).sum()) // 2
+
+
+    def pos_edges(self, subset: Set[int]) -> int:
+        """Returns the total number of possible edges in the subset"""
+        return (len(subset) * (len(subset) - 1)) // 2
+
+
+    def density(self, subset: Set[int]) -> float:
+        """Returns the density as `edges/pos_edges` of the `subset`"""
+        return self.edges(subset) / self.pos_edges(subset)
+
+
+    def neighbors(self, v: int) -> Iterator:
+        return iter(self.neighbor_array(v).tolist())
+
+
+    def neighbor_array(self, v: int) -> np.ndarray:
+        return np.flatnonzero(unpack_words(self._rows[v], self.size))
+
+
+    def adjacency_rows(self, vertices: np.ndarray) -> np.ndarray:
+        """Returns the dense boolean adjacency rows of `vertices`, as a len(vertices) x n matrix"""
+        return unpack_words(self._rows[np.asarray(vertices, dtype=np.int64)], self.size)
+
+
+    def adjacency_matrix(self) -> np.array:
+        return unpack_words(self._rows, self.size).astype(np.int64)
+
+
+    def with_planted_set(self, planted: List[int], clique: bool) -> "BitsetGraph":
+        """
+        Returns a copy of the graph where all edges within `planted` are either
+        added (`clique`) or removed.
+        """
+        rows: np.ndarray = self._rows.copy()
+        planted_array: np.ndarray = np.asarray(planted, dtype=np.int64)
+        packed: np.ndarray = self.pack_subset(planted_array.tolist())
+        if clique:
+            rows[planted_array] |= packed
+            # Clear the diagonal, as vertices are not adjacent to themselves
+            rows[planted_array, planted_array >> 6] &= ~np.left_shift(
+                np.uint64(1), (planted_array & 63).astype(np.uint64)
+            )
+        else:
+            rows[planted_array] &= ~packed
+        return BitsetGraph(rows, self.size)
+
+
+    def _to_mask(self, subset: Iterable[int]) -> np.ndarray:
+        """Converts a subset of vertices into a boolean mask over [0, n)"""
+        if isinstance(subset, np.ndarray) and subset.dtype == np.bool_:
+            return subset
+        mask: np.ndarray = np.zeros(self.size, dtype=bool)
+        mask[np.fromiter(subset, dtype=np.int64, count=len(subset))] = True
+        return mask
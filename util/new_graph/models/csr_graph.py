@@ -0,0 +1,191 @@
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+import networkx as nx
+import numpy as np
+
+from util.new_graph.models.abstract_graph import AbstractGraph
+
+
+class CSRGraph(AbstractGraph):
+    """
+    An immutable graph backed by compressed sparse row (CSR) arrays rather than networkx dicts.
+    Vertices are considered to be [0, n), and the neighbors of each vertex are stored sorted in
+    `indices[indptr[v]:indptr[v+1]]`, which allows membership tests through binary search.
+
+    NOTE: Queries which take a subset accept either a python set of vertices or a boolean NumPy
+    mask of length n. Passing a mask keeps the query entirely inside NumPy.
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, degrees: np.ndarray = None):
+        self.size: int = len(indptr) - 1
+        self._indptr: np.ndarray = indptr
+        self._indices: np.ndarray = indices
+        self._pre_process(degrees)
+
+
+    def _pre_process(self, degrees: np.ndarray = None):
+        """
+        Sets internal trackers at time of graph creation to allow simple
+        and quick lookup in the future.
+        NOTE: Relies on graphs being an immutable object
+        """
+        self._degrees: np.ndarray = np.diff(self._indptr).astype(np.int32) if degrees is None else degrees
+        self._max_degree_vertex: int = int(np.argmax(self._degrees)) if self.size > 0 else None
+        self._min_degree_vertex: int = int(np.argmin(self._degrees)) if self.size > 0 else None
+
+
+    @classmethod
+    def from_edge_arrays(cls, n: int, u: np.ndarray, v: np.ndarray) -> "CSRGraph":
+        """
+        Constructs a graph on [0, n) from two arrays of endpoints, where each undirected
+        edge (u[i], v[i]) is listed exactly once.
+        """
+        rows: np.ndarray = np.concatenate([u, v]).astype(np.int64)
+        cols: np.ndarray = np.concatenate([v, u]).astype(np.int32)
+        order: np.ndarray = np.lexsort((cols, rows))
+        counts: np.ndarray = np.bincount(rows, minlength=n)
+        indptr_dtype = np.int32 if len(rows) < np.iinfo(np.int32).max else np.int64
+        indptr: np.ndarray = np.zeros(n + 1, dtype=indptr_dtype)
+        np.cumsum(counts, out=indptr[1:])
+        return cls(indptr, cols[order])
+
+
+    @classmethod
+    def from_networkx(cls, g: nx.Graph) -> "CSRGraph":
+        """Constructs a graph from a networkx graph whose nodes are [0, n)"""
+        edges: np.ndarray = np.array(list(g.edges()), dtype=np.int64).reshape(-1, 2)
+        return cls.from_edge_arrays(len(g.nodes), edges[:, 0], edges[:, 1])
+
+
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, np.ndarray]) -> "CSRGraph":
+        """Inverse of `to_arrays`. The arrays may be memory-mapped."""
+        return cls(arrays["indptr"], arrays["indices"], arrays["degrees"])
+
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Returns the arrays that fully describe this graph, keyed by name"""
+        return {"indptr": self._indptr, "indices": self._indices, "degrees": self._degrees}
+
+
+    def degree(self, v: int) -> int:
+        return int(self._degrees[v])
+
+
+    def vertex_list(self) -> List[int]:
+        return list(range(self.size))
+
+
+    def vertex_set(self) -> Set[int]:
+        return set(range(self.size))
+
+
+    def edge_boundary(self, v: int, subset: Set[int]) -> int:
+        """Returns the number of edges between v and set"""
+        row: np.ndarray = self.neighbor_array(v)
+        if isinstance(subset, np.ndarray):
+            return int(np.count_nonzero(subset[row]))
+        if len(subset) == 0 or len(row) == 0:
+            return 0
+        members: np.ndarray = np.fromiter(subset, dtype=np.int64, count=len(subset))
+        positions: np.ndarray = np.minimum(np.searchsorted(row, members), len(row) - 1)
+        return int(np.count_nonzero(row[positions] == members))
+
+
+    def max_degree(self) -> Tuple[int, int]:
+        """Returns (v, deg(v)) where v has the maximum degree and deg(v) is it's degree"""
+        return (self._max_degree_vertex, self.degree(self._max_degree_vertex))
+
+
+    def min_degree(self) -> Tuple[int, int]:
+        """Returns (v, deg(v)) where v has the minimum degree and deg(v) is it's degree"""
+        return (self._min_degree_vertex, self.degree(self._min_degree_vertex))
+
+
+    def partition_vertices(self, subset: Set[int]) -> Tuple[Set[int], Set[int]]:
+        """
+        Returns the vertices of this graph, split into the subset and all other vertices.
+        The order is (subset, other_vertices).
+        """
+        return (subset, self.vertex_set().difference(subset))
+
+
+    def edges(self, subset: Set[int]) -> int:
+        """Returns the number of edges in `subset`"""
+        mask: np.ndarray = self._to_mask(subset)
+        members: np.ndarray = np.flatnonzero(mask)
+        return int(np.count_nonzero(mask[self._gather_neighbors(members)])) // 2
+
+
+    def pos_edges(self, subset: Set[int]) -> int:
+        """Returns the total number of possible edges in the subset"""
+        return (len(subset) * (len(subset) - 1)) // 2
+
+
+    def density(self, subset: Set[int]) -> float:
+        """Returns the density as `edges/pos_edges` of the `subset`"""
+        return self.edges(subset) / self.pos_edges(subset)
+
+
+    def neighbors(self, v: int) -> Iterator:
+        return iter(self.neighbor_array(v).tolist())
+
+
+    def neighbor_array(self, v: int) -> np.ndarray:
+        return self._indices[self._indptr[v]:self._indptr[v + 1]]
+
+
+    def adjacency_rows(self, vertices: np.ndarray) -> np.ndarray:
+        """Returns the dense boolean adjacency rows of `vertices`, as a len(vertices) x n matrix"""
+        vertices = np.asarray(vertices, dtype=np.int64)
+        rows: np.ndarray = np.zeros((len(vertices), self.size), dtype=bool)
+        rows[np.repeat(np.arange(len(vertices)), self._degrees[vertices]), self._gather_neighbors(vertices)] = True
+        return rows
+
+
+    def adjacency_matrix(self) -> np.array:
+        A: np.ndarray = np.zeros((self.size, self.size), dtype=np.int64)
+        A[np.repeat(np.arange(self.size), self._degrees), self._indices] = 1
+        return A
+
+
+    def with_planted_set(self, planted: List[int], clique: bool) -> "CSRGraph":
+        """
+        Returns a copy of the graph where all edges within `planted` are either
+        added (`clique`) or removed.
+        """
+        u, v = self._edge_arrays()
+        in_planted: np.ndarray = self._to_mask(planted)
+        keep: np.ndarray = ~(in_planted[u] & in_planted[v])
+        u, v = u[keep], v[keep]
+        if clique:
+            pu, pv = np.triu_indices(len(planted), k=1)
+            planted_array: np.ndarray = np.asarray(planted, dtype=np.int64)
+            u = np.concatenate([u, planted_array[pu]])
+            v = np.concatenate([v, planted_array[pv]])
+        return CSRGraph.from_edge_arrays(self.size, u, v)
+
+
+    def _edge_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns (u, v) listing each undirected edge once with u < v"""
+        rows: np.ndarray = np.repeat(np.arange(self.size, dtype=np.int64), self._degrees)
+        upper: np.ndarray = rows < self._indices
+        return rows[upper], self._indices[upper].astype(np.int64)
+
+
+    def _gather_neighbors(self, vertices: np.ndarray) -> np.ndarray:
+        """Returns the concatenation of the neighbor arrays of `vertices`"""
+        lengths: np.ndarray = self._degrees[vertices].astype(np.int64)
+        if lengths.sum() == 0:
+            return np.zeros(0, dtype=self._indices.dtype)
+        offsets: np.ndarray = np.repeat(self._indptr[vertices] - np.cumsum(lengths) + lengths, lengths)
+        return self._indices[offsets + np.arange(lengths.sum())]
+
+
+    def _to_mask(self, subset: Iterable[int]) -> np.ndarray:
+        """Converts a subset of vertices into a boolean mask over [0, n)"""
+        if isinstance(subset, np.ndarray) and subset.dtype == np.bool_:
+            return subset
+        mask: np.ndarray = np.zeros(self.size, dtype=bool)
+        mask[np.fromiter(subset, dtype=np.int64, count=len(subset))] = True
+        return mask
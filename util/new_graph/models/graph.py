@@ -1,12 +1,16 @@
 import itertools
-import random
 from copy import copy, deepcopy
-from typing import Iterator, List, Set, Tuple
+from typing import Dict, Iterator, List, Set, Tuple
 
 import networkx as nx
 import numpy as np
 
+from util.misc import get_rng
+from util.new_graph.generation import generate_planted_graph
+from util.new_graph.instance_cache import GraphInstanceCache, Seed
 from util.new_graph.models.abstract_graph import AbstractGraph
+from util.new_graph.models.bitset_graph import BitsetGraph
+from util.new_graph.models.csr_graph import CSRGraph
 
 
 class Graph(AbstractGraph):
@@ -84,33 +88,107 @@ class Graph(AbstractGraph):
         return self._graph.neighbors(v)
 
 
+    def neighbor_array(self, v: int) -> np.ndarray:
+        return np.fromiter(self._graph.neighbors(v), dtype=np.int64)
+
+
     def adjacency_matrix(self) -> np.array:
         return nx.adjacency_matrix(self._graph).toarray()
 
 
-def generate_erdos_renyi_graph(n: int, p: float) -> Graph:
+    def with_planted_set(self, planted: List[int], clique: bool) -> "Graph":
+        """
+        Returns a copy of the graph where all edges within `planted` are either
+        added (`clique`) or removed.
+        """
+        edges = list(itertools.combinations(planted, 2))
+        new_graph: nx.Graph = deepcopy(self._graph)
+        if clique:
+            new_graph.add_edges_from(edges)
+        else:
+            new_graph.remove_edges_from(edges)
+        return Graph(new_graph)
+
+
+# The graph implementations which experiments can select between, keyed by name.
+# NOTE: "networkx" is the original dict-backed graph, "csr" is the array-backed graph and
+# "bitset" is the bit-packed adjacency matrix, which is the most compact for dense graphs.
+GRAPH_BACKENDS: Dict[str, type] = {
+    "networkx": Graph,
+    "csr": CSRGraph,
+    "bitset": BitsetGraph,
+}
+
+
+def to_backend(seed: nx.Graph, backend: str) -> AbstractGraph:
+    """Wraps the networkx graph `seed` in the graph implementation named by `backend`"""
+    if backend not in GRAPH_BACKENDS:
+        raise Exception(f"Unknown graph backend {backend}. Expected one of {list(GRAPH_BACKENDS.keys())}.")
+    if backend == "networkx":
+        return Graph(seed)
+    return GRAPH_BACKENDS[backend].from_networkx(seed)
+
+
+def generate_erdos_renyi_graph(n: int, p: float, backend: str = "networkx", rng: np.random.Generator = None) -> AbstractGraph:
     """Generates an erdos-renyi graph with `n` vertices and edge probability `p`"""
-    return Graph(nx.erdos_renyi_graph(n=n, p=p))
+    if backend != "networkx":
+        return generate_planted_graph(n, p, 0, backend=backend, rng=rng)[0]
+    seed: int = None if rng is None else int(rng.integers(np.iinfo(np.int32).max))
+    return to_backend(nx.erdos_renyi_graph(n=n, p=p, seed=seed), backend)
 
 
-def add_planted_set(g: Graph, size: int, clique: bool) -> Tuple[Graph, Set[int]]:
+def add_planted_set(g: AbstractGraph, size: int, clique: bool, rng: np.random.Generator = None) -> Tuple[AbstractGraph, Set[int]]:
     """
     Returns a copy of the graph with a planted set that is either a clique
     or an independent set, controlled by the `clique` flag.
     """
-    planted: list = random.sample(g.vertex_list(), size)
-    edges = list(itertools.combinations(planted, 2))
-    new_graph: nx.Graph = deepcopy(g._graph)
-    if clique:
-        new_graph.add_edges_from(edges)
-    else:
-        new_graph.remove_edges_from(edges)
-    return Graph(new_graph), planted
-
-
-def generate_planted_ind_set_graph(n: int, p: float, planted_size: int) -> Tuple[Graph, Set[int]]:
-    return add_planted_set(generate_erdos_renyi_graph(n, p), size=planted_size, clique=False)
-
-
-def generate_planted_clique_graph(n: int, p: float, planted_size: int) -> Tuple[Graph, Set[int]]:
-    return add_planted_set(generate_erdos_renyi_graph(n, p), size=planted_size, clique=True)
+    planted: list = get_rng(rng).choice(g.vertex_list(), size, replace=False).tolist()
+    return g.with_planted_set(planted, clique), planted
+
+
+# NOTE: Array-backed graphs are generated directly through the vectorized generator, which
+# samples the planted set alongside the graph rather than copying the graph to plant it. Passing a
+# `seed` makes the instance reproducible, and passing a `cache` reuses the instance stored for
+# those parameters (see GraphInstanceCache). Both require an array-backed backend. Unseeded graphs
+# are drawn from `rng` when it is provided.
+def generate_planted_ind_set_graph(
+    n: int,
+    p: float,
+    planted_size: int,
+    backend: str = "networkx",
+    seed: Seed = None,
+    cache: GraphInstanceCache = None,
+    rng: np.random.Generator = None,
+) -> Tuple[AbstractGraph, Set[int]]:
+    return _generate_planted_graph(n, p, planted_size, False, backend, seed, cache, rng)
+
+
+def generate_planted_clique_graph(
+    n: int,
+    p: float,
+    planted_size: int,
+    backend: str = "networkx",
+    seed: Seed = None,
+    cache: GraphInstanceCache = None,
+    rng: np.random.Generator = None,
+) -> Tuple[AbstractGraph, Set[int]]:
+    return _generate_planted_graph(n, p, planted_size, True, backend, seed, cache, rng)
+
+
+def _generate_planted_graph(
+    n: int,
+    p: float,
+    planted_size: int,
+    clique: bool,
+    backend: str,
+    seed: Seed,
+    cache: GraphInstanceCache,
+    rng: np.random.Generator = None,
+) -> Tuple[AbstractGraph, Set[int]]:
+    if backend == "networkx":
+        if seed is not None or cache is not None:
+            raise Exception("Seeded and cached graph generation require an array-backed graph backend.")
+        return add_planted_set(generate_erdos_renyi_graph(n, p, backend, rng), size=planted_size, clique=clique, rng=rng)
+    if cache is not None:
+        return cache.get_or_generate(n, p, planted_size, clique=clique, backend=backend, seed=seed)
+    return generate_planted_graph(n, p, planted_size, clique=clique, backend=backend, seed=seed, rng=rng)
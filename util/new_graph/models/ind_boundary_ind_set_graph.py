@@ -1,9 +1,9 @@
-import random
 from copy import copy
 from typing import List, Set, Tuple
 
-from numpy.random import binomial
+import numpy as np
 
+from util.misc import get_rng
 from util.new_graph.models.graph import Graph
 
 
@@ -18,9 +18,12 @@ class IndBoundaryIndSetGraph(Graph):
     * `p` is the edge probability (ind, erdos-renyi)
     * `S` is a subset of vertices with a different edge probability
     * `q` is the edge probability of the special subset
+    * `rng` is the generator edge boundary responses are drawn from
     """
 
-    def __init__(self, n: int, p: float, S: Set[int], q: float):
+    has_explicit_edges: bool = False
+
+    def __init__(self, n: int, p: float, S: Set[int], q: float, rng: np.random.Generator = None):
         # Validate construction arguments
         assert n > 0, f"n must be a positive value. Value provided was {n}"
         assert 0 <= p <= 1, f"p={p} must lie between 0 and 1"
@@ -33,6 +36,7 @@ class IndBoundaryIndSetGraph(Graph):
         self.S = S
         self.s = len(S)
         self.q = q
+        self.rng: np.random.Generator = get_rng(rng)
         self._queried: List[Set(int)] = [set() for x in range(n)]
         self._vertex_list = range(1, n+1)
         self._vertex_set = set(self._vertex_list)
@@ -57,7 +61,7 @@ class IndBoundaryIndSetGraph(Graph):
         # Generate a response and return as appropriate.
         in_s: int = len(subset.intersection(self.S))
         out_of_s: int = len(subset) - in_s
-        return binomial(out_of_s, self.p) + binomial(in_s, self.q if v in self.S else self.p)
+        return self.rng.binomial(out_of_s, self.p) + self.rng.binomial(in_s, self.q if v in self.S else self.p)
 
 
     def _get_queried(self, v: int) -> Set[int]:
@@ -69,10 +73,11 @@ class IndBoundaryIndSetGraph(Graph):
 
 
 
-def generate_planted_ind_set_model(n: int, p: float, planted_size: int) -> Tuple[IndBoundaryIndSetGraph, Set[int]]:
+def generate_planted_ind_set_model(n: int, p: float, planted_size: int, rng: np.random.Generator = None) -> Tuple[IndBoundaryIndSetGraph, Set[int]]:
     """
     Generates an independent boundary query graph with a planted independent set of
     size `planted_size` and independent edge probability `p` with `n` vertices.
     """
-    planted_set: Set[int] = random.sample(range(1, n+1), planted_size)
-    return IndBoundaryIndSetGraph(n, p, planted_set, 0), planted_set
+    rng = get_rng(rng)
+    planted_set: Set[int] = rng.choice(np.arange(1, n+1), planted_size, replace=False).tolist()
+    return IndBoundaryIndSetGraph(n, p, planted_set, 0, rng), planted_set
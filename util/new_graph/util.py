@@ -1,23 +1,26 @@
-import random
 from typing import List, Set
 
+import numpy as np
+
+from util.misc import get_rng
 from util.models.graph_subset_tracker import GraphSubsetTracker
 from util.new_graph.models.graph import Graph
 
 
-def uniformly_sample_overlap_set(g: Graph, subset: int, overlap: int, non_overlap: int) -> Set[int]:
+def uniformly_sample_overlap_set(g: Graph, subset: int, overlap: int, non_overlap: int, rng: np.random.Generator = None) -> Set[int]:
     """
     Uniformly samples `overlap` elements from `subset` and `non_overlap` elements not from `subset`
     in the provided graph. Returns this subset of `g` as a set.
     """
+    rng = get_rng(rng)
     _, other_vertices = g.partition_vertices(subset)
-    intersection: Set[int] = set(random.sample(subset, overlap))
-    disjoint: Set[int] = set(random.sample(other_vertices, non_overlap))
+    intersection: Set[int] = set(rng.choice(sorted(subset), overlap, replace=False).tolist())
+    disjoint: Set[int] = set(rng.choice(sorted(other_vertices), non_overlap, replace=False).tolist())
     return intersection.union(disjoint)
 
 
-def uniformly_sample_subset(g: Graph, size: int) -> Set[int]:
-    return set(random.sample(g.vertex_list(), size))
+def uniformly_sample_subset(g: Graph, size: int, rng: np.random.Generator = None) -> Set[int]:
+    return set(get_rng(rng).choice(g.vertex_list(), size, replace=False).tolist())
 
 
 
@@ -27,9 +30,10 @@ def greedily_recover_ind_subset(g: Graph, subset: GraphSubsetTracker) -> Set[int
     sorting the vertices of `subset` in reverse degree order and then going through them
     and greedily selecting vertices to create an independent set.
     """
-    sorted_vertices: List[int] = sorted(subset.subset, key=lambda x: subset.internal_degree(x))
+    # Ties are broken by vertex, so that the result does not depend on the iteration order of the set
+    sorted_vertices: List[int] = sorted(subset.subset, key=lambda x: (subset.internal_degree(x), x))
     ind_set: Set[int] = set()
-    for v in sorted(subset.subset, key=lambda x: subset.internal_degree(x)):
+    for v in sorted_vertices:
         if g.edge_boundary(v, ind_set) == 0:
             ind_set.add(v)
     return ind_set
@@ -0,0 +1,199 @@
+import importlib
+import json
+import os
+import shutil
+from typing import Any, Callable, Dict
+
+import dill
+import numpy as np
+
+from util.models.result import Result
+from util.results.result_tensor import ResultTensor
+
+"""
+    Columnar results directories. Rather than pickling a whole `Result`, each of its fields is
+    written separately into a directory holding:
+        metadata.json       - The result's class, its scalar fields, and how each other field is stored
+        <field>.npy         - NumPy arrays, and the results / collected arrays of ResultTensors
+        <field>.json        - Lists and dicts of plain JSON data
+        <field>/            - Nested results, and dicts of results (one subdirectory per entry)
+        <field>.pkl         - Anything else, pickled with dill
+
+    Loading reads only metadata.json. Every other field is loaded on its first access (see
+    `Result.__getattr__`), with arrays memory-mapped copy-on-write, so a plot which touches a
+    single tensor reads only that tensor's pages.
+
+    NOTE: A directory is written under a temporary name and renamed into place once complete, so
+    an interrupted store never leaves a partially written result behind.
+    NOTE: Memory-mapped tensors are hard-linked into the directory rather than copied, so the
+    directory they were collected in can be removed once the result is stored.
+"""
+
+METADATA_FILE: str = "metadata.json"
+FORMAT_VERSION: int = 1
+
+
+def is_columnar_results(path: str) -> bool:
+    """Returns whether `path` is a columnar results directory"""
+    return os.path.isfile(f"{path}/{METADATA_FILE}")
+
+
+def __is_scalar(value) -> bool:
+    return value is None or isinstance(value, (bool, int, float, str))
+
+
+def __is_json(value) -> bool:
+    """Returns whether `value` is unchanged by a round trip through JSON, e.g. holds no tuples, sets or int keys"""
+    if __is_scalar(value):
+        return True
+    if isinstance(value, list):
+        return all(__is_json(v) for v in value)
+    if isinstance(value, dict):
+        return all(isinstance(k, str) and __is_json(v) for k, v in value.items())
+    return False
+
+
+def __is_result_dict(value) -> bool:
+    return (
+        isinstance(value, dict)
+        and len(value) > 0
+        and all(__is_scalar(k) and isinstance(v, Result) for k, v in value.items())
+    )
+
+
+def __tensor_dimensions(result_tensor: ResultTensor) -> list:
+    return [[name, keys] for name, keys in result_tensor.get_dimensions()]
+
+
+def __link_or_copy(source: str, destination: str):
+    """
+    Hard-links the .npy file of a memory-mapped tensor into a results directory, rather than
+    writing a second copy of it. Copies instead when the two are on different file systems.
+    """
+    try:
+        os.link(source, destination)
+    except OSError:
+        shutil.copyfile(source, destination)
+
+
+def __write_field(directory: str, name: str, value: Any) -> dict:
+    """Writes a single field of a result into `directory`, returning its entry in the metadata"""
+    if isinstance(value, np.generic):
+        value = value.item()
+    if __is_scalar(value):
+        return {"kind": "scalar", "value": value}
+    if isinstance(value, np.ndarray) and value.dtype != object:
+        np.save(f"{directory}/{name}.npy", value)
+        return {"kind": "array"}
+    if isinstance(value, ResultTensor) and value.dimensions_fixed and __is_json(__tensor_dimensions(value)):
+        for array_name in ["results", "collected"]:
+            if value.directory is not None:
+                value.flush()
+                __link_or_copy(f"{value.directory}/{array_name}.npy", f"{directory}/{name}.{array_name}.npy")
+            else:
+                np.save(f"{directory}/{name}.{array_name}.npy", getattr(value, array_name))
+        return {
+            "kind": "tensor",
+            "dimensions": __tensor_dimensions(value),
+            "results_collected": int(value.results_collected),
+        }
+    if isinstance(value, Result):
+        __write_result(value, f"{directory}/{name}")
+        return {"kind": "result"}
+    if __is_result_dict(value):
+        keys: list = list(value.keys())
+        for i, key in enumerate(keys):
+            __write_result(value[key], f"{directory}/{name}/{i}")
+        return {"kind": "results", "keys": keys}
+    if __is_json(value):
+        with open(f"{directory}/{name}.json", "w") as output:
+            json.dump(value, output)
+        return {"kind": "json"}
+    with open(f"{directory}/{name}.pkl", "wb") as output:
+        dill.dump(value, output, dill.HIGHEST_PROTOCOL)
+    return {"kind": "pickle"}
+
+
+def __write_result(res: Result, directory: str):
+    res.load_all_fields()
+    os.makedirs(directory)
+    metadata: dict = {
+        "format": FORMAT_VERSION,
+        "class": f"{type(res).__module__}:{type(res).__qualname__}",
+        "fields": {name: __write_field(directory, name, value) for name, value in vars(res).items()},
+    }
+    with open(f"{directory}/{METADATA_FILE}", "w") as output:
+        json.dump(metadata, output, indent=4)
+
+
+def store_columnar(res: Result, path: str):
+    """Stores `res` as a columnar results directory at `path`, replacing any result already there"""
+    temporary_path: str = f"{path}.tmp"
+    shutil.rmtree(temporary_path, ignore_errors=True)
+    __write_result(res, temporary_path)
+    if os.path.isdir(path):
+        # Directories can only be renamed over empty ones, so the old result is moved aside first
+        shutil.rmtree(f"{path}.old", ignore_errors=True)
+        os.rename(path, f"{path}.old")
+        os.rename(temporary_path, path)
+        shutil.rmtree(f"{path}.old")
+    else:
+        os.rename(temporary_path, path)
+
+
+def __load_array(path: str) -> np.ndarray:
+    # Empty arrays cannot be memory-mapped
+    array: np.ndarray = np.load(path, mmap_mode="c")
+    return array if array.size > 0 else np.array(array)
+
+
+def __field_loader(directory: str, name: str, field: dict) -> Callable[[], Any]:
+    """Returns a function which loads the provided field of the result stored in `directory`"""
+    kind: str = field["kind"]
+    if kind == "array":
+        return lambda: __load_array(f"{directory}/{name}.npy")
+    if kind == "tensor":
+        return lambda: ResultTensor.from_arrays(
+            [(dimension, keys) for dimension, keys in field["dimensions"]],
+            __load_array(f"{directory}/{name}.results.npy"),
+            __load_array(f"{directory}/{name}.collected.npy"),
+            field["results_collected"],
+        )
+    if kind == "result":
+        return lambda: load_columnar(f"{directory}/{name}")
+    if kind == "results":
+        return lambda: {key: load_columnar(f"{directory}/{name}/{i}") for i, key in enumerate(field["keys"])}
+    if kind == "json":
+        def load_json():
+            with open(f"{directory}/{name}.json", "r") as input:
+                return json.load(input)
+        return load_json
+    if kind == "pickle":
+        def load_pickle():
+            with open(f"{directory}/{name}.pkl", "rb") as input:
+                return dill.load(input)
+        return load_pickle
+    raise Exception(f"Cannot load field {name} of unknown kind {kind}.")
+
+
+def load_columnar(path: str) -> Result:
+    """
+    Loads the result stored in the columnar results directory at `path`. Only the metadata is read
+    here, and every other field is read on its first access.
+    """
+    with open(f"{path}/{METADATA_FILE}", "r") as input:
+        metadata: dict = json.load(input)
+    if metadata["format"] != FORMAT_VERSION:
+        raise Exception(f"Cannot load results of format {metadata['format']} (expected {FORMAT_VERSION}).")
+    module_name, class_name = metadata["class"].split(":")
+    result_class: type = getattr(importlib.import_module(module_name), class_name)
+
+    res: Result = result_class.__new__(result_class)
+    loaders: Dict[str, Callable[[], Any]] = {}
+    for name, field in metadata["fields"].items():
+        if field["kind"] == "scalar":
+            vars(res)[name] = field["value"]
+        else:
+            loaders[name] = __field_loader(path, name, field)
+    vars(res)["_field_loaders"] = loaders
+    return res
@@ -1,6 +1,6 @@
 import copy
 import itertools
-import math
+import os
 from pprint import pprint
 from typing import List, Tuple
 
@@ -10,11 +10,21 @@ import numpy as np
 def mean(X: np.array) -> float:
     return sum(X) / X.size
 
-def next_power_of_2(x):
-    return 1 if x == 0 else 2**math.ceil(math.log2(x))
-
 class DynamicResultTensor:
-    def __init__(self):
+    """
+    A tensor of results with one dynamic dimension, the first, whose size grows as results are
+    added (e.g. the steps of a heuristic), alongside fixed dimensions as in ResultTensor.
+
+    NOTE: The dynamic dimension is stored as a list of fixed-size chunks, and a full chunk is
+    followed by a new one rather than copied into a larger tensor, so appending never copies the
+    results already collected. `results` concatenates the chunks into a contiguous view on demand,
+    which is kept until a result outside of it is added.
+
+    NOTE: Passing a `directory` keeps every chunk in its own memory-mapped .npy file under that
+    directory, so that only the chunk being appended to needs to be in RAM.
+    """
+
+    def __init__(self, directory: str = None):
         self.__dimension_names: [str] = []
         self.__dimension_sizes: [int] = []
         self.__dimension_keys: [[int]] = []
@@ -22,16 +32,34 @@ class DynamicResultTensor:
         self.__num_dimensions = 0
 
         self.__dynamic_dimension_name: str = None
-        self.__dynamic_dimension_capacity: int = None
         self.__dynamic_dimension_size: int = None
+        self.__chunk_size: int = None
+        # The directory the memory-mapped chunks are kept in, or None to keep them in memory
+        self.directory: str = directory
+        self.__chunks: [np.ndarray] = []
+        # The contiguous view of the chunks, materialized by `results`
+        self.__view: np.ndarray = None
 
-        self.results = None
         self.results_collected = -1
 
         #? State trackers
         self.dimensions_fixed = False
         self.dynamic_dimension_added = False
 
+    def __getstate__(self) -> dict:
+        state: dict = self.__dict__.copy()
+        state["_DynamicResultTensor__view"] = None
+        # Memory-mapped chunks are already on disk, so only their number is stored
+        if self.directory is not None:
+            for chunk in self.__chunks:
+                chunk.flush()
+            state["_DynamicResultTensor__chunks"] = len(self.__chunks)
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        if self.directory is not None:
+            self.__chunks = [np.load(self.__chunk_path(i), mmap_mode="r+") for i in range(self.__chunks)]
 
     def __verify_dimensions_fixed(self):    
         """
@@ -54,18 +82,30 @@ class DynamicResultTensor:
         if not self.dynamic_dimension_added:
             raise Exception("Dynamic dimension hasn't been added yet. Cannot collect results.")
 
-    def __increase_dynamic_capacity(self, min_capacity: int):
+    def __chunk_path(self, i: int) -> str:
+        return f"{self.directory}/chunk-{i}.npy"
+
+    def __append_chunk(self):
         if not self.dimensions_fixed:
             raise Exception("Can only increase dynamic capacity after dimensions have been fixed.")
-        elif min_capacity < self.__dynamic_dimension_capacity:
-            raise Exception("Cannot increase dynamic capacity to a smaller amount.")
-        # Calculate new capacity as a power of 2 (minimize runtime)
-        cur_capacity: int = self.__dynamic_dimension_capacity
-        new_capacity: int = next_power_of_2(min_capacity)
-        pad_amount: int = new_capacity - cur_capacity
-        pad_width: [(int, int)] = [(0, pad_amount)] + [(0, 0)] * self.__num_dimensions
-        self.results = np.pad(self.results, pad_width, 'constant', constant_values=(0))
-        self.__dynamic_dimension_capacity = new_capacity
+        shape: [int] = [self.__chunk_size] + self.__dimension_sizes
+        if self.directory is None:
+            chunk: np.ndarray = np.zeros(shape)
+        else:
+            chunk: np.ndarray = np.lib.format.open_memmap(self.__chunk_path(len(self.__chunks)), mode="w+", dtype=np.float64, shape=tuple(shape))
+        self.__chunks.append(chunk)
+
+    @property
+    def capacity(self) -> int:
+        """The number of entries of the dynamic dimension which fit in the chunks allocated so far"""
+        return len(self.__chunks) * self.__chunk_size
+
+    @property
+    def results(self) -> np.ndarray:
+        """The chunks as a single contiguous array, with `capacity` entries in the dynamic dimension"""
+        if self.__view is None and self.dimensions_fixed:
+            self.__view = self.__chunks[0] if len(self.__chunks) == 1 else np.concatenate(self.__chunks)
+        return self.__view
 
     def __dim_size(self, dimension: str) -> int:
         return self.__dimension_sizes[self.__dimension_indices[dimension]]
@@ -80,10 +120,13 @@ class DynamicResultTensor:
     def __get_index(self, dimension: str, key: int) -> int:
         return self.__dim_keys(dimension).index(key)
     
-    def set_dynamic_dimension(self, dimension_name: str, init_capacity: int = 64):
+    def set_dynamic_dimension(self, dimension_name: str, chunk_size: int = 64):
+        """Sets the dynamic dimension, which grows `chunk_size` entries at a time"""
         self.__verify_dimensions_not_fixed()
+        if chunk_size < 1:
+            raise Exception(f"Cannot grow the dynamic dimension by chunks of size {chunk_size}.")
         self.__dynamic_dimension_name = dimension_name
-        self.__dynamic_dimension_capacity = next_power_of_2(init_capacity)
+        self.__chunk_size = chunk_size
         self.__dynamic_dimension_size = 0
         self.dynamic_dimension_added = True
 
@@ -100,8 +143,11 @@ class DynamicResultTensor:
         self.___verify_dynamic_dimension_added()
         # Set tracker
         self.dimensions_fixed = True
-        # Initialize the results object to track all the actual results now
-        self.results = np.zeros([self.__dynamic_dimension_capacity] + self.__dimension_sizes)
+        # Initialize the first chunk to track all the actual results now
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+        self.__append_chunk()
+        self.__fixed_size: int = int(np.prod(self.__dimension_sizes))
         self.results_collected = 0
 
 
@@ -124,16 +170,19 @@ class DynamicResultTensor:
         return tuple([dynamic_index] + [self.__get_index(dim_name, k) for dim_name, k in access])
     
     def __resize_dynamic_dimension_if_necessary(self, index: int):
-        # Check which case we fall into
-        if index < self.__dynamic_dimension_size:
-            # Already in size, so we can just return
-            return
-        elif index < self.__dynamic_dimension_capacity:
-            # In capacity, so we only need to update size
-            self.__dynamic_dimension_size = index + 1   # account for 0 index
-        else:
-            self.__increase_dynamic_capacity(index + 1)
-            self.__dynamic_dimension_size = index + 1
+        # Append chunks until the index is in capacity, then update size
+        while index >= self.capacity:
+            self.__append_chunk()
+        self.__dynamic_dimension_size = max(self.__dynamic_dimension_size, index + 1)   # account for 0 index
+
+    def __write(self, index: int, fixed_indices: tuple, value):
+        """Writes `value` to the cell(s) at `index` of the dynamic dimension, keeping the view in sync"""
+        self.__chunks[index // self.__chunk_size][(index % self.__chunk_size,) + fixed_indices] = value
+        if self.__view is not None:
+            if index < len(self.__view):
+                self.__view[(index,) + fixed_indices] = value
+            else:
+                self.__view = None
 
     def add_result(self, result, **kwargs) -> bool:
         self.__verify_dimensions_fixed()
@@ -141,9 +190,26 @@ class DynamicResultTensor:
         indices: [int] = self.__validate_kwargs_access(list(kwargs.items()))
         # Resize and set the result
         self.__resize_dynamic_dimension_if_necessary(indices[0])
-        self.results[indices] = result
+        self.__write(indices[0], indices[1:], result)
         self.results_collected += 1
 
+    def append(self, values) -> int:
+        """
+            Appends the results of the next entry of the dynamic dimension, where `values` holds a
+            result for every cell of the fixed dimensions. Returns the index of the new entry.
+        """
+        self.__verify_dimensions_fixed()
+        index: int = self.__dynamic_dimension_size
+        chunk_index, offset = divmod(index, self.__chunk_size)
+        if chunk_index == len(self.__chunks):
+            self.__append_chunk()
+        self.__chunks[chunk_index][offset] = values
+        if self.__view is not None:
+            self.__write(index, (), values)
+        self.__dynamic_dimension_size = index + 1
+        self.results_collected += self.__fixed_size
+        return index
+
     def get_results(self, **kwargs) -> bool:
         self.__verify_dimensions_fixed()
         indices: [int] = self.__validate_kwargs_access(list(kwargs.items()))
@@ -1,6 +1,7 @@
 import copy
 import itertools
-from typing import List, Tuple
+import os
+from typing import Dict, List, Sequence, Tuple
 
 import numpy as np
 
@@ -12,18 +13,68 @@ def mean(X: np.array) -> float:
 
 
 class ResultTensor:
-    def __init__(self):
+    """
+    A dense tensor of results, with one named dimension per experiment parameter whose entries
+    are addressed by key (e.g. n=100, t=3) rather than by index.
+
+    NOTE: Every dimension keeps a dict from key to index, so that addressing a cell is O(1) in the
+    size of the dimensions. `add_results_bulk` writes whole slices at once, and the default
+    `mean` collapses reduce over the trailing axes in NumPy.
+
+    NOTE: Passing a `directory` keeps the results out of core, in .npy files under that directory
+    which are memory-mapped rather than held in RAM. Results stream to disk as they are added, and
+    pickling the tensor stores only the path, so a loaded tensor maps its files back in and only
+    reads the pages it touches. `dtype` picks the element type, e.g. np.int32 for counts.
+    """
+
+    def __init__(self, dtype=np.float64, directory: str = None):
         self.__dimension_names: List[str] = []
         self.__dimension_sizes: List[int] = []
         self.__dimension_keys: List[List[int]] = []
+        # Mapping from key -> index for each dimension
+        self.__dimension_key_indices: List[Dict[int, int]] = []
         self.__dimension_indices: dict = {}
         self.__num_dimensions = 0
         self.dimensions_fixed = False
 
+        self.dtype = np.dtype(dtype)
+        # The directory the memory-mapped results are kept in, or None to keep them in memory
+        self.directory: str = directory
         self.results: np.ndarray = None
+        # Marks which cells of `results` have been collected
+        self.collected: np.ndarray = None
         self.results_total = -1
         self.results_collected = -1
-        self.__index_list = []
+
+    def __getstate__(self) -> dict:
+        state: dict = self.__dict__.copy()
+        # Memory-mapped results are already on disk, so only their directory is stored
+        if state.get("directory") is not None and self.dimensions_fixed:
+            self.flush()
+            state["results"] = None
+            state["collected"] = None
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        # Tensors stored before dimensions kept their key indices rebuild them on load
+        if self.__dict__.get("_ResultTensor__dimension_key_indices") is None:
+            self.__dimension_key_indices = [{k: i for i, k in enumerate(keys)} for keys in self.__dimension_keys]
+        if self.__dict__.get("directory") is not None and self.dimensions_fixed:
+            self.results = np.load(self.__results_path(), mmap_mode="r+")
+            self.collected = np.load(self.__collected_path(), mmap_mode="r+")
+
+    def __results_path(self) -> str:
+        return f"{self.directory}/results.npy"
+
+    def __collected_path(self) -> str:
+        return f"{self.directory}/collected.npy"
+
+    def flush(self):
+        """Writes any memory-mapped results still held in memory out to disk"""
+        if isinstance(self.results, np.memmap):
+            self.results.flush()
+            self.collected.flush()
 
     def __dim_size(self, dimension: str) -> int:
         return self.__dimension_sizes[self.__dimension_indices[dimension]]
@@ -43,7 +94,7 @@ class ResultTensor:
 
     def __get_index(self, dimension: str, key: int) -> int:
         """Returns the appropriate index for the tensor from the provided key"""
-        return self.__dim_keys(dimension).index(key)
+        return self.__dimension_key_indices[self.__get_dimension_index(dimension)][key]
 
     def add_dimension(self, dimension_name: str, dimension_keys: List[int]):
         if self.dimensions_fixed:
@@ -54,18 +105,59 @@ class ResultTensor:
         self.__dimension_names.append(dimension_name)
         self.__dimension_sizes.append(len(dimension_keys))
         self.__dimension_keys.append(dimension_keys)
+        self.__dimension_key_indices.append({k: i for i, k in enumerate(dimension_keys)})
         self.__dimension_indices[dimension_name] = len(self.__dimension_names) - 1
         self.__num_dimensions += 1
 
+    def get_dimensions(self) -> List[Tuple[str, List[int]]]:
+        """Returns the (name, keys) of every dimension, in order"""
+        return [(name, list(keys)) for name, keys in zip(self.__dimension_names, self.__dimension_keys)]
+
+    @classmethod
+    def from_arrays(
+        cls,
+        dimensions: List[Tuple[str, List[int]]],
+        results: np.ndarray,
+        collected: np.ndarray,
+        results_collected: int,
+    ) -> "ResultTensor":
+        """
+        Returns a tensor with the provided (name, keys) dimensions over existing `results` and
+        `collected` arrays, e.g. ones memory-mapped from a stored result, rather than fresh ones
+        """
+        result_tensor: ResultTensor = cls(results.dtype)
+        for name, keys in dimensions:
+            result_tensor.add_dimension(name, keys)
+        shape: Tuple[int, ...] = tuple(result_tensor.__dimension_sizes)
+        if results.shape != shape or collected.shape != shape:
+            raise Exception(f"Cannot use results of shape {results.shape} for dimensions of shape {shape}.")
+        result_tensor.dimensions_fixed = True
+        result_tensor.results = results
+        result_tensor.collected = collected
+        result_tensor.results_collected = results_collected
+        result_tensor.results_total = np.prod(shape)
+        return result_tensor
+
     def fix_dimensions(self):
         # Set trackers
         self.dimensions_fixed = True
 
         # Initialize the results object to track all the actual results now
-        self.results: np.ndarray = np.zeros(self.__dimension_sizes)
+        shape: Tuple[int, ...] = tuple(self.__dimension_sizes)
+        if self.directory is None:
+            self.results: np.ndarray = np.zeros(shape, dtype=self.dtype)
+            self.collected: np.ndarray = np.zeros(shape, dtype=bool)
+        else:
+            # NOTE: New .npy files are zero filled, and sparse on file systems which support it
+            os.makedirs(self.directory, exist_ok=True)
+            # Opening existing files for writing would truncate the results of whichever run owns them
+            for path in [self.__results_path(), self.__collected_path()]:
+                if os.path.exists(path):
+                    raise Exception(f"Cannot keep results in {self.directory}, which already holds {os.path.basename(path)}.")
+            self.results: np.ndarray = np.lib.format.open_memmap(self.__results_path(), mode="w+", dtype=self.dtype, shape=shape)
+            self.collected: np.ndarray = np.lib.format.open_memmap(self.__collected_path(), mode="w+", dtype=bool, shape=shape)
         self.results_collected = 0
         self.results_total = np.prod(self.__dimension_sizes)
-        self.__index_list = list(itertools.product(*self.__dimension_keys))
 
     def __validate_kwargs_access(self, kwargs):
         if len(kwargs) != self.__num_dimensions:
@@ -77,7 +169,7 @@ class ResultTensor:
                 raise Exception(
                     "Wrong ordering of dimensions for accessing results dict."
                 )
-            if k not in self.__dimension_keys[i]:
+            if k not in self.__dimension_key_indices[i]:
                 raise Exception(
                     f"Bad key passed into results dict access\nKey: {k}\tKeys:{self.__dimension_keys[i]}"
                 )
@@ -94,9 +186,54 @@ class ResultTensor:
         self.__validate_kwargs_access(kwargs)
         indices = self.__to_indices(kwargs)
         self.results[indices] = result
-        self.results_collected += 1
+        if not self.collected[indices]:
+            self.collected[indices] = True
+            self.results_collected += 1
         # result.put(indices, result)
 
+    def add_results_bulk(self, values, **index_arrays):
+        """
+        Writes a whole slice of results at once. Each dimension is given, in order, either a single
+        key or a sequence of keys, and `values` is broadcast to the outer product of the sequences.
+
+        EXAMPLE:
+            x.add_results_bulk(sizes, step=step_values, trial=t)
+
+            > Writes sizes[i] to the cell (step_values[i], t) for every i
+        """
+        if not self.dimensions_fixed:
+            raise Exception(
+                "Attempt to add results with dimensions not fixed in results dict"
+            )
+        if list(index_arrays.keys()) != self.__dimension_names:
+            raise Exception(
+                f"Bulk results must index every dimension in order. Expected {self.__dimension_names}, got {list(index_arrays.keys())}."
+            )
+
+        indices: List[np.ndarray] = []
+        sliced_shape: List[int] = []
+        for i, keys in enumerate(index_arrays.values()):
+            if isinstance(keys, (list, tuple, range, np.ndarray)):
+                indices.append(self.__to_index_array(i, keys))
+                sliced_shape.append(len(keys))
+            else:
+                indices.append(self.__to_index_array(i, [keys]))
+        # Single keys are length one axes of the slice, which `values` does not include
+        cells = np.ix_(*indices)
+        self.results[cells] = np.broadcast_to(values, sliced_shape).reshape([len(index) for index in indices])
+        self.results_collected += int(np.count_nonzero(~self.collected[cells]))
+        self.collected[cells] = True
+
+    def __to_index_array(self, dimension_index: int, keys: Sequence) -> np.ndarray:
+        """Maps a sequence of keys of a dimension to their indices, validating every key"""
+        key_indices: Dict[int, int] = self.__dimension_key_indices[dimension_index]
+        try:
+            return np.fromiter((key_indices[k] for k in keys), dtype=np.int64, count=len(keys))
+        except KeyError as e:
+            raise Exception(
+                f"Bad key passed into results dict access\nKey: {e.args[0]}\tKeys:{self.__dimension_keys[dimension_index]}"
+            )
+
     def get_results(self, **kwargs) -> bool:
         if not self.dimensions_fixed:
             raise Exception(
@@ -108,21 +245,35 @@ class ResultTensor:
         return self.results[indices]
         # result.put(indices, result)
 
+    def is_collected(self, **kwargs) -> bool:
+        """Returns whether a result has been added for the cell at the provided keys"""
+        if not self.dimensions_fixed:
+            raise Exception(
+                "Attempt to check result with dimensions not fixed in results dict"
+            )
+
+        self.__validate_kwargs_access(kwargs)
+        return bool(self.collected[self.__to_indices(kwargs)])
+
     def all_results_collected(self) -> bool:
         return self.results_collected == self.results_total
 
     def collapse_to_matrix(self, f=mean) -> np.ndarray:
-        m: np.array = np.zeros(self.__dimension_sizes[0:2])
         outer_size: int = self.__dimension_sizes[0]
         inner_size: int = self.__dimension_sizes[1]
+        if f is mean:
+            return self.results.reshape(outer_size, inner_size, -1).mean(axis=2)
+        m: np.array = np.zeros(self.__dimension_sizes[0:2])
         for r in range(outer_size):
             for c in range(inner_size):
                 m[r][c] = f(self.results[r][c])
         return m
 
     def collapse_to_list(self, f=mean) -> np.ndarray:
-        m: np.array = np.zeros(self.__dimension_sizes[0])
         size: int = self.__dimension_sizes[0]
+        if f is mean:
+            return self.results.reshape(size, -1).mean(axis=1)
+        m: np.array = np.zeros(self.__dimension_sizes[0])
         for r in range(size):
             m[r] = f(self.results[r])
         return m
@@ -152,7 +303,8 @@ class ResultTensor:
         return tensor.get_sub_tensor(self.results, dim_index, entry_index)
 
     def get_index_list(self) -> List:
-        return copy.copy(self.__index_list)
+        # NOTE: Built on request rather than stored, as it has an entry for every cell
+        return list(itertools.product(*self.__dimension_keys))
 
     def __str__(self) -> str:
         return f"<{[self.__dimension_names]}>"
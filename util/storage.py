@@ -1,6 +1,7 @@
 import gc
 import os
 import pickle
+import tempfile
 from typing import List, Dict
 
 import dill
@@ -8,6 +9,7 @@ import klepto.archives
 
 from util.config import get_experiment_results_directory, get_preprocessing_directory
 from util.models.result import Result
+from util.results.columnar import is_columnar_results, load_columnar, store_columnar
 
 
 def __pickle_path(file_name: str, directory: str = None) -> str:
@@ -103,10 +105,68 @@ def load_experiment(project_name: str, file_name: str):
 
 
 def store_results(project_name: str, res: Result):
-    """Stores a result from an experiment"""
-    store(res, res.generate_file_name(), get_experiment_results_directory(project_name))
+    """Stores a result from an experiment as a columnar results directory (see util/results/columnar.py)"""
+    path: str = f"{get_experiment_results_directory(project_name)}/{res.generate_file_name()}"
+    print(path)
+    store_columnar(res, path)
+
+
+def results_tensor_directory(project_name: str, result_class: type) -> str:
+    """
+    Creates a new directory for the memory-mapped tensors of a result, alongside the file the
+    result itself is stored to. Every call gets its own directory, so runs on the same day (e.g.
+    for different n in parallel) never share, and truncate, each other's tensors.
+    """
+    return tempfile.mkdtemp(
+        prefix=f"{result_class.generate_file_name()}-tensors-",
+        dir=get_experiment_results_directory(project_name),
+    )
+
+
+def __checkpoint_path(project_name: str, result_class: type) -> str:
+    return f"{get_experiment_results_directory(project_name)}/{result_class.result_identifier}-checkpoint.pkl"
+
+
+def store_checkpoint(project_name: str, res: Result):
+    """
+    Stores a checkpoint of a partially collected result, replacing the previous checkpoint.
+    NOTE: Writes to a temporary file which is then renamed over the checkpoint, so an interruption
+    mid-write leaves the previous checkpoint intact.
+    """
+    path: str = __checkpoint_path(project_name, type(res))
+    with open(f"{path}.tmp", "wb") as output:
+        dill.dump(res, output, pickle.HIGHEST_PROTOCOL)
+    os.replace(f"{path}.tmp", path)
 
 
-def load_results(project_name: str, file_name: str):
+def load_checkpoint(project_name: str, result_class: type) -> Result:
+    """Loads the checkpoint stored for the provided result class, or None if there is none"""
+    path: str = __checkpoint_path(project_name, result_class)
+    return load_from_path(path) if os.path.isfile(path) else None
+
+
+def remove_checkpoint(project_name: str, result_class: type):
+    """Removes the checkpoint stored for the provided result class, if any"""
+    path: str = __checkpoint_path(project_name, result_class)
+    if os.path.isfile(path):
+        os.remove(path)
+
+
+def results_exist(path: str) -> bool:
+    """Returns whether a result is stored at `path`, given without an extension"""
+    return is_columnar_results(path) or os.path.isfile(f"{path}.pkl")
+
+
+def load_results_from_path(path: str) -> Result:
+    """
+    Loads the result stored at `path`, given without an extension. Columnar results directories
+    load their fields lazily, while results stored before them are still read from their pickles.
+    """
+    if is_columnar_results(path):
+        return load_columnar(path)
+    return load_from_path(f"{path}.pkl")
+
+
+def load_results(project_name: str, file_name: str) -> Result:
     results_dir: str = get_experiment_results_directory(project_name)
-    return load_from_path(f"{results_dir}/{file_name}.pkl")
+    return load_results_from_path(f"{results_dir}/{file_name}")
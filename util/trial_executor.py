@@ -0,0 +1,79 @@
+import multiprocessing
+import random
+from typing import Any, Callable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+"""
+Runs the independent trials of an experiment, either serially or across a pool of worker processes.
+
+Every trial is identified by a key of non-negative integers (e.g. (n, t)), and is handed its own
+`np.random.Generator` as the `rng` keyword argument, derived from the experiment's root seed and
+that key as with `SeedSequence.spawn`. Trials pass this generator to the graph generators and
+heuristics they run. The `random` and `np.random` modules are seeded from the same stream for any
+code which still uses them. A trial therefore sees the same random stream whichever worker runs it
+and whatever the number of workers, and a single trial is replayed in isolation by running it alone
+with the root seed recorded on the `Result`.
+
+Trials are top-level functions which build their own graph and return a plain, picklable record of
+their results. The records are yielded back to the calling process as trials finish, which merges
+them into the experiment's `Result` object.
+"""
+
+TrialKey = Tuple[int, ...]
+
+
+def resolve_root_seed(seed: int = None) -> int:
+    """Returns `seed`, or a fresh root seed drawn from OS entropy when it is None"""
+    return np.random.SeedSequence(seed).entropy
+
+
+def trial_seed_sequence(root_seed: int, key: TrialKey) -> np.random.SeedSequence:
+    """
+    Returns the seed sequence of the trial with the provided key. For a key (i,) this is the
+    i-th child of `SeedSequence(root_seed).spawn`, and longer keys extend the spawn tree.
+    """
+    return np.random.SeedSequence(root_seed, spawn_key=tuple(key))
+
+
+def trial_rng(root_seed: int, key: TrialKey) -> np.random.Generator:
+    """Returns the generator of the trial with the provided key, derived from the root seed"""
+    return np.random.default_rng(trial_seed_sequence(root_seed, key))
+
+
+def _run_seeded_trial(payload: Tuple[Callable, TrialKey, tuple, int]) -> Tuple[TrialKey, Any]:
+    trial, key, args, root_seed = payload
+    seed_sequence: np.random.SeedSequence = trial_seed_sequence(root_seed, key)
+    global_seed: int = int(seed_sequence.generate_state(1)[0])
+    random.seed(global_seed)
+    np.random.seed(global_seed)
+    return key, trial(*args, rng=np.random.default_rng(seed_sequence))
+
+
+def run_trials(
+    trial: Callable,
+    trials: Sequence[Tuple[TrialKey, tuple]],
+    workers: int = 1,
+    root_seed: int = None,
+) -> Iterator[Tuple[TrialKey, Any]]:
+    """
+    Runs `trial(*args, rng=rng)` for every (key, args) in `trials`, yielding (key, result)
+    as each trial completes. With more than one worker, trials run in a process pool and
+    complete in no particular order.
+
+    NOTE: `trial` and its arguments are pickled to reach the workers, so `trial` must be a
+    module level function.
+    """
+    if workers < 1:
+        raise Exception(f"Cannot run trials with a non-positive number of workers ({workers}).")
+    root_seed = resolve_root_seed(root_seed)
+    payloads: List[Tuple[Callable, TrialKey, tuple, int]] = [
+        (trial, tuple(key), args, root_seed) for key, args in trials
+    ]
+    if workers == 1 or len(payloads) <= 1:
+        for payload in payloads:
+            yield _run_seeded_trial(payload)
+        return
+    with multiprocessing.Pool(processes=min(workers, len(payloads))) as pool:
+        for result in pool.imap_unordered(_run_seeded_trial, payloads):
+            yield result